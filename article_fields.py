@@ -0,0 +1,92 @@
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+
+# ================= ARTICLE FIELDS =================
+# data.json carries records from several writers: the older uppercase
+# schema (TITLE, SUMMARY, DATE…) and the lowercase one fetch_news.py writes.
+# These helpers read either, and derive the fields no record stores.
+
+def safe(item, *keys, default=""):
+    for k in keys:
+        if k in item and str(item[k]).strip():
+            return str(item[k])
+    return default
+
+def slugify(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+# Same slug generate_pages.py writes the article page under
+def article_slug(item):
+    return slugify(safe(item, "TITLE", "title"))
+
+# ISO date → aware datetime (naive dates are UTC), None when unparseable
+def parse_date(date_str):
+    try:
+        dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    except Exception:
+        return None
+    if not dt.tzinfo:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+def hours_old(date_str, now):
+    ts = date_epoch(date_str)
+    if ts is None:
+        return 999
+    return (now.timestamp() - ts) / 3600
+
+# ================= DATE EPOCHS =================
+# Each ISO date is stored with its epoch seconds next to it (DATE →
+# DATE_TS, date → date_ts), stamped once at ingest, so the date-based
+# stages subtract floats instead of reparsing every article every run.
+# A writer that changes a date stamps it again with stamp_dates(); the
+# article store also re-stamps every record it stores as changed, so
+# hand edits to data.json and writers that forget cannot keep a stale epoch.
+DATE_FIELDS = ("DATE", "date")
+EPOCH_FIELDS = {"DATE": "DATE_TS", "date": "date_ts"}
+
+# Records without a stamp (or unstamped strings) parse once per process
+@lru_cache(maxsize=1 << 16)
+def date_epoch(date_str):
+    dt = parse_date(date_str)
+    return dt.timestamp() if dt else None
+
+def stamp_dates(item, missing_only=False):
+    stamped = False
+    for field, ts_field in EPOCH_FIELDS.items():
+        value = item.get(field)
+        if not isinstance(value, str):
+            continue
+        if missing_only and ts_field in item:
+            continue
+        ts = date_epoch(value)
+        if ts is None:
+            stamped = item.pop(ts_field, None) is not None or stamped
+        elif item.get(ts_field) != ts:
+            item[ts_field] = ts
+            stamped = True
+    return stamped
+
+# Epoch of the first date field present, None when missing or unparseable
+def article_epoch(item, fields=DATE_FIELDS):
+    for field in fields:
+        value = item.get(field)
+        if not isinstance(value, str) or not value.strip():
+            continue
+        ts = item.get(EPOCH_FIELDS[field])
+        return ts if ts is not None else date_epoch(value)
+    return None
+
+# Ages for the whole article list in one pass, aligned with it (None where
+# an article has no usable date)
+def ages_hours(data, now, fields=DATE_FIELDS):
+    now_ts = now.timestamp()
+    epochs = [article_epoch(a, fields) for a in data]
+    return [None if ts is None else (now_ts - ts) / 3600 for ts in epochs]
+
+# Whole days, rounded down like timedelta.days
+def ages_days(data, now, fields=DATE_FIELDS):
+    now_ts = now.timestamp()
+    epochs = [article_epoch(a, fields) for a in data]
+    return [None if ts is None else int((now_ts - ts) // 86400) for ts in epochs]
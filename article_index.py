@@ -0,0 +1,132 @@
+import os
+import sys
+
+from article_fields import safe, slugify
+from article_store import article_title, fingerprint
+from data_io import load_articles, load_json, save_json
+
+# ================= CONFIG =================
+INDEX_FILE = "signals/article_index.json"
+
+# ================= KEYS =================
+def title_key(title):
+    return " ".join(title.lower().split())
+
+def article_source(item):
+    return safe(item, "SOURCE", "source").strip()
+
+# ================= INDEX =================
+# Dedupe lookups for the ingest paths: fingerprint, normalised title,
+# source URL and slug, each a dict lookup instead of a set rebuilt (or a
+# list scanned) per run. Reads either field casing.
+#
+# The sidecar (fp -> [title key, source, slug]) lets open() reuse the keys
+# of articles it has already indexed and only compute them for new or
+# changed ones; it is rewritten only when something changed.
+class ArticleIndex:
+    def __init__(self, path=INDEX_FILE):
+        self.path = path
+        self.entries = {}       # fp -> [title key, source, slug]
+        self.by_title = {}
+        self.by_source = {}
+        self.by_slug = {}
+        self.dirty = False
+
+    @classmethod
+    def build(cls, articles, path=INDEX_FILE):
+        index = cls(path)
+        for item in articles:
+            index.add(item)
+        return index
+
+    @classmethod
+    def open(cls, articles, path=INDEX_FILE):
+        stored = load_json(path, {}).get("articles", {})
+        index = cls(path)
+        reused = 0
+
+        for item in articles:
+            title = article_title(item)
+            if not title:
+                continue
+            fp = fingerprint(title)
+            if fp in index.entries:
+                continue
+
+            keys = stored.get(fp)
+            if keys and keys[1] == article_source(item):
+                index._insert(fp, keys)
+                reused += 1
+            else:
+                index._insert(fp, [title_key(title), article_source(item), slugify(title)])
+
+        index.dirty = reused != len(index.entries) or len(stored) != len(index.entries)
+        index.save()
+        return index
+
+    def _insert(self, fp, keys):
+        title, source, slug = keys
+        self.entries[fp] = keys
+        self.by_title.setdefault(title, fp)
+        if source:
+            self.by_source.setdefault(source, fp)
+        self.by_slug.setdefault(slug, fp)
+        self.dirty = True
+
+    # Indexes an article; returns its fingerprint (None without a title).
+    # The first article with a given key keeps it, as the dedupe guards did.
+    def add(self, item):
+        title = article_title(item)
+        if not title:
+            return None
+        fp = fingerprint(title)
+        if fp not in self.entries:
+            self._insert(fp, [title_key(title), article_source(item), slugify(title)])
+        return fp
+
+    # ---------- lookups ----------
+    def __contains__(self, fp):
+        return fp in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def has_title(self, title):
+        return title_key(title) in self.by_title
+
+    def has_source(self, url):
+        return url.strip() in self.by_source
+
+    def has_slug(self, slug):
+        return slug in self.by_slug
+
+    # Any key already indexed → the fingerprint of the article holding it
+    def find(self, title=None, source=None, slug=None):
+        if title:
+            fp = self.by_title.get(title_key(title))
+            if fp:
+                return fp
+        if source:
+            fp = self.by_source.get(source.strip())
+            if fp:
+                return fp
+        if slug:
+            return self.by_slug.get(slug)
+        return None
+
+    def save(self):
+        if not self.dirty and os.path.exists(self.path):
+            return False
+        save_json(self.path, {"articles": self.entries}, ensure_ascii=False, separators=(",", ":"))
+        self.dirty = False
+        return True
+
+# ================= CLI =================
+# python article_index.py  → refresh the sidecar from data.json and report
+if __name__ == "__main__":
+    data = load_articles()
+    index = ArticleIndex.open(data)
+    print(f"🗂 Article index: {len(index)} articles | {len(index.by_source)} sources | {len(index.by_slug)} slugs")
+    if len(sys.argv) > 1:
+        query = " ".join(sys.argv[1:])
+        print("🔎", query, "→", index.find(title=query, source=query, slug=query))
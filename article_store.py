@@ -0,0 +1,375 @@
+import hashlib
+import json
+import os
+import sys
+
+from article_fields import article_epoch, stamp_dates
+from data_io import DATA_FILE, atomic_write, load_articles, load_json, save_articles, save_json
+
+# ================= CONFIG =================
+# Working state, not committed (.gitignore): data.json is the durable copy,
+# and a store that is missing or behind it is rebuilt from it on load.
+# Keeping these out of git stops the archive being stored twice and every
+# compaction committing a full snapshot.
+SNAPSHOT_FILE = "store/articles.snapshot.jsonl"     # compacted state, newest first
+LOG_FILE = "store/articles.log.jsonl"               # append-only changes since snapshot
+META_FILE = "store/articles.meta.json"              # hash of the last data.json export
+
+COMPACT_AFTER = 500         # log entries before folding them into the snapshot
+
+DAY_SECONDS = 86400
+DAY_FIELDS = ("date",)      # the date the discover rules age articles by
+
+# ================= KEYS =================
+def article_title(item):
+    return item.get("TITLE") or item.get("title") or ""
+
+def fingerprint(title):
+    return hashlib.md5(title.lower().encode()).hexdigest()
+
+def _encode(item):
+    return json.dumps(item, ensure_ascii=False, separators=(",", ":"))
+
+def _digest(encoded):
+    return hashlib.md5(encoded.encode("utf-8")).digest()
+
+def _file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+# ================= DAY INDEX =================
+# Articles bucketed by publish day (days since the epoch, UTC), so a rule
+# that only cares about articles 3–7 days old reads those few buckets
+# instead of the archive. Undated articles are not indexed.
+class DayIndex:
+    def __init__(self, fields=DAY_FIELDS):
+        self.fields = fields
+        self.days = {}          # day -> {fp: item}
+        self.day_of = {}        # fp -> day
+
+    def __len__(self):
+        return len(self.day_of)
+
+    def add(self, fp, item):
+        self.remove(fp)
+        ts = article_epoch(item, self.fields)
+        if ts is None:
+            return
+        day = int(ts // DAY_SECONDS)
+        self.days.setdefault(day, {})[fp] = item
+        self.day_of[fp] = day
+
+    def remove(self, fp):
+        day = self.day_of.pop(fp, None)
+        if day is not None:
+            bucket = self.days[day]
+            del bucket[fp]
+            if not bucket:
+                del self.days[day]
+
+    # (fp, item) for articles min_days..max_days old in whole days, as
+    # timedelta.days counts them (max_days=None: no upper bound). An
+    # article of day d is today-d-1 or today-d days old depending on the
+    # hour, so the edge buckets are checked per article.
+    def window(self, now_ts, min_days, max_days=None):
+        today = int(now_ts // DAY_SECONDS)
+        first = None if max_days is None else today - max_days - 1
+        last = today - min_days
+
+        if first is None:
+            days = [d for d in self.days if d <= last]
+        else:
+            days = [d for d in range(first, last + 1) if d in self.days]
+
+        out = []
+        for day in days:
+            for fp, item in self.days[day].items():
+                age = int((now_ts - article_epoch(item, self.fields)) // DAY_SECONDS)
+                if age >= min_days and (max_days is None or age <= max_days):
+                    out.append((fp, item))
+        return out
+
+# ================= STORE =================
+# Articles keyed by title fingerprint. The snapshot holds the compacted
+# archive; every put/delete after that is one line appended to the log,
+# so an ingest costs O(changed) on disk instead of rewriting everything.
+# data.json is an export of the store for existing consumers; edits made
+# to it by scripts that bypass the store are picked up on the next load.
+class ArticleStore:
+    def __init__(self, snapshot_file=SNAPSHOT_FILE, log_file=LOG_FILE,
+                 meta_file=META_FILE, data_file=DATA_FILE):
+        self.snapshot_file = snapshot_file
+        self.log_file = log_file
+        self.meta_file = meta_file
+        self.data_file = data_file
+
+        self.records = {}       # fp -> article
+        self.digests = {}       # fp -> md5 of the encoded article
+        self.order = []         # snapshot order (newest first)
+        self.head = []          # fps first seen after the snapshot, oldest first
+        self.log_entries = 0
+        self.pending = []       # log lines not yet flushed
+        self.changed = False
+
+        self.days = DayIndex()
+        self.rank = {}          # fp -> position in the last articles() list
+        self.listed = None      # (count, first, last) of that list
+
+        self._load()
+
+    # ---------- loading ----------
+    def _load(self):
+        if os.path.exists(self.snapshot_file):
+            with open(self.snapshot_file, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    fp = entry["fp"]
+                    self.records[fp] = entry["item"]
+                    self.digests[fp] = _digest(_encode(entry["item"]))
+                    self.days.add(fp, entry["item"])
+                    self.order.append(fp)
+
+        if os.path.exists(self.log_file):
+            complete = 0        # bytes up to the last full line
+            with open(self.log_file, "rb") as f:
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        # half-written last line from a killed run
+                        break
+                    complete += len(raw)
+                    line = raw.decode("utf-8", errors="replace")
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    self._apply(entry)
+                    self.log_entries += 1
+
+            # Cut the torn tail off, or the next flush would append its
+            # first entry onto it and replay would drop both
+            if complete < os.path.getsize(self.log_file):
+                with open(self.log_file, "r+b") as f:
+                    f.truncate(complete)
+                print(f"⚠️ {self.log_file}: dropped a half-written last entry")
+
+        bootstrap = not self.records and not self.log_entries
+
+        if os.path.exists(self.data_file):
+            meta = load_json(self.meta_file, {})
+            if meta.get("exported_sha256") != _file_sha256(self.data_file):
+                try:
+                    # With no store yet, data.json.bak is the only fallback
+                    edited = load_articles(self.data_file, recover=bootstrap)
+                except ValueError as e:
+                    # Torn or hand-broken export: the store itself is the
+                    # last good state, so keep it and write data.json again
+                    print(f"⚠️ {self.data_file} unreadable ({e}) — restoring it from the article store")
+                    self.changed = True
+                else:
+                    added, updated, deleted = self.sync(edited)
+                    print(f"🗃 Imported data.json edits: +{added} ~{updated} -{deleted}")
+
+        if bootstrap and self.records:
+            self.compact()
+
+    def _apply(self, entry):
+        fp = entry["fp"]
+        if entry["op"] == "put":
+            if fp not in self.records:
+                self.head.append(fp)
+            self.records[fp] = entry["item"]
+            self.digests[fp] = _digest(_encode(entry["item"]))
+            self.days.add(fp, entry["item"])
+        elif entry["op"] == "del":
+            self.records.pop(fp, None)
+            self.digests.pop(fp, None)
+            self.days.remove(fp)
+
+    # ---------- reads ----------
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, fp):
+        return fp in self.records
+
+    def get(self, fp):
+        return self.records.get(fp)
+
+    def articles(self):
+        out = []
+        self.rank = {}
+        for fp in list(reversed(self.head)) + self.order:
+            if fp in self.records and fp not in self.rank:
+                self.rank[fp] = len(out)
+                out.append(self.records[fp])
+        self.listed = (len(out), out[0], out[-1]) if out else (0, None, None)
+        return out
+
+    # Articles of the day index min_days..max_days old, in articles() order
+    def in_window(self, now_ts, min_days, max_days=None):
+        return self.in_windows(now_ts, [(min_days, max_days)])
+
+    # The same for several windows, which must not overlap
+    def in_windows(self, now_ts, windows):
+        found = []
+        for min_days, max_days in windows:
+            found += self.days.window(now_ts, min_days, max_days)
+        found.sort(key=lambda pair: self.rank.get(pair[0], len(self.rank)))
+        return [item for _, item in found]
+
+    # The articles a stage put in front of the articles() list (ingest
+    # inserts at 0), or None when the list was reshaped in any other way
+    # and has to be scanned whole
+    def prepended(self, data):
+        if self.listed is None:
+            return None
+        count, first, last = self.listed
+        extra = len(data) - count
+        if extra < 0:
+            return None
+        if count and (data[extra] is not first or data[-1] is not last):
+            return None
+        return data[:extra]
+
+    # ---------- writes ----------
+    def put(self, item):
+        title = article_title(item)
+        if not title:
+            return None
+
+        fp = fingerprint(title)
+        encoded = _encode(item)
+        digest = _digest(encoded)
+        if self.digests.get(fp) == digest:
+            return None
+
+        # a changed record may carry an edited date: its epoch follows it
+        if stamp_dates(item):
+            encoded = _encode(item)
+            digest = _digest(encoded)
+            if self.digests.get(fp) == digest:
+                return None
+
+        status = "updated" if fp in self.records else "added"
+        if status == "added":
+            self.head.append(fp)
+        self.records[fp] = item
+        self.digests[fp] = digest
+        self.days.add(fp, item)
+        self.pending.append('{"op":"put","fp":"%s","item":%s}' % (fp, encoded))
+        self.changed = True
+        return status
+
+    def delete(self, fp):
+        if fp not in self.records:
+            return False
+        del self.records[fp]
+        del self.digests[fp]
+        self.days.remove(fp)
+        self.pending.append('{"op":"del","fp":"%s"}' % fp)
+        self.changed = True
+        return True
+
+    # Make the store match an article list (newest first), e.g. after the
+    # pipeline stages mutated it. Only records whose content changed are
+    # logged; the first record wins when two share a fingerprint.
+    def sync(self, articles):
+        added = updated = 0
+        keep = set()
+        new_items = []
+
+        for item in articles:
+            title = article_title(item)
+            if not title:
+                continue
+            fp = fingerprint(title)
+            if fp in keep:
+                continue
+            keep.add(fp)
+
+            if fp not in self.records:
+                new_items.append(item)
+            elif self.put(item):
+                updated += 1
+
+        # oldest new item first, so the export lists them newest first
+        for item in reversed(new_items):
+            if self.put(item):
+                added += 1
+
+        gone = [fp for fp in self.records if fp not in keep]
+        for fp in gone:
+            self.delete(fp)
+
+        return added, updated, len(gone)
+
+    def flush(self):
+        if self.pending:
+            os.makedirs(os.path.dirname(self.log_file) or ".", exist_ok=True)
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                f.write("\n".join(self.pending) + "\n")
+            self.log_entries += len(self.pending)
+            self.pending = []
+
+        if self.log_entries >= COMPACT_AFTER:
+            self.compact()
+
+    def compact(self):
+        articles = self.articles()
+
+        with atomic_write(self.snapshot_file) as f:
+            for item in articles:
+                fp = fingerprint(article_title(item))
+                f.write('{"fp":"%s","item":%s}\n' % (fp, _encode(item)))
+
+        with open(self.log_file, "w", encoding="utf-8"):
+            pass
+
+        self.order = [fingerprint(article_title(item)) for item in articles]
+        self.head = []
+        self.log_entries = 0
+        self.pending = []
+
+        print(f"🗜 Article store compacted: {len(articles)} articles")
+
+    # ---------- data.json compatibility ----------
+    def export(self):
+        self.flush()
+
+        if (
+            not self.changed
+            and os.path.exists(self.data_file)
+            and os.path.exists(self.meta_file)
+        ):
+            return False
+
+        save_articles(self.articles(), self.data_file)
+
+        save_json(self.meta_file, {"exported_sha256": _file_sha256(self.data_file)}, indent=2)
+
+        self.changed = False
+        return True
+
+# ================= CLI =================
+# python article_store.py [stats|compact|export]
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "stats"
+    store = ArticleStore()
+
+    if command == "compact":
+        store.flush()
+        store.compact()
+        store.export()
+    elif command == "export":
+        store.changed = True
+        store.export()
+        print(f"📤 data.json exported: {len(store)} articles")
+    else:
+        print(f"🗃 Articles: {len(store)} | log entries since snapshot: {store.log_entries}")
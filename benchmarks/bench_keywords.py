@@ -0,0 +1,95 @@
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from entity_authority import ENTITY_MATCHER, ENTITY_PATTERNS
+from fetch_news import CATEGORY_KEYWORDS, detect_category
+from keyword_matcher import KeywordMatcher
+from live_engine import BREAKING_KEYWORDS, BREAKING_MATCHER, TOPIC_KEYWORDS, detect_topic
+
+# ================= CONFIG =================
+TITLES = 50_000
+LARGE_TABLE = 200           # labels in the scaling run, 5 keywords each
+
+WORDS = (
+    "markets stocks said feed fed federal reserve inflation jobs court ai chips "
+    "software government policy laws election senate crisis record surge "
+    "breaking emergency wall street shares bonds earnings growth economy "
+    "technology tech detail maintain rally officials talks plan week new "
+    "leaders warn over amid after ahead report shows latest global trade"
+).split()
+
+def synthetic_titles(n, seed=11):
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 14))).capitalize()
+
+# ================= CANDIDATES =================
+# The substring loops the matcher replaced
+def loop_category(title):
+    t = title.lower()
+    for category, keys in CATEGORY_KEYWORDS.items():
+        if any(k in t for k in keys):
+            return category
+    return "General"
+
+def loop_topic(title):
+    t = title.lower()
+    for topic, keys in TOPIC_KEYWORDS.items():
+        if any(k in t for k in keys):
+            return topic
+    return "World"
+
+def loop_entities(text):
+    text = text.lower()
+    return [e for e, keys in ENTITY_PATTERNS.items() if any(k in text for k in keys)]
+
+def loop_breaking(title):
+    return any(k in title.lower() for k in BREAKING_KEYWORDS)
+
+def loops(title):
+    return loop_category(title), loop_topic(title), loop_entities(title), loop_breaking(title)
+
+def compiled(title):
+    return detect_category(title), detect_topic(title), ENTITY_MATCHER.labels(title), BREAKING_MATCHER.search(title)
+
+def bench(label, classify, titles):
+    started = time.perf_counter()
+    results = [classify(t) for t in titles]
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {elapsed * 1000:>9.1f}ms  {len(titles) / elapsed:>10.0f} titles/s")
+    return elapsed, results
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else TITLES
+    titles = list(synthetic_titles(n))
+
+    print(f"🔎 Classifying {n} titles (category, topic, entities, breaking)")
+    base, old = bench("substring loops", loops, titles)
+    fast, new = bench("compiled matchers", compiled, titles)
+
+    # Differences are the substring false positives ("said" → AI, "feed" → Fed)
+    changed = sum(1 for a, b in zip(old, new) if a != b)
+    print(f"⚡ Compiled matcher speedup: {base / fast:.1f}x | {changed} titles classified differently")
+
+    # Loop cost grows with the keyword count, the matcher's does not
+    rng = random.Random(3)
+    table = {
+        f"entity-{i}": [f"{rng.choice(WORDS)}{i}", f"{rng.choice(WORDS)} {rng.choice(WORDS)}{i}"] +
+                       [rng.choice(WORDS) + str(i * 7 + j) for j in range(3)]
+        for i in range(LARGE_TABLE)
+    }
+    matcher = KeywordMatcher(table)
+
+    def loop_large(title):
+        t = title.lower()
+        return [e for e, keys in table.items() if any(k in t for k in keys)]
+
+    print(f"\n🔎 Entity table with {LARGE_TABLE * 5} keywords")
+    base, _ = bench("substring loops", loop_large, titles)
+    fast, _ = bench("compiled matcher", matcher.labels, titles)
+    print(f"⚡ Compiled matcher speedup: {base / fast:.1f}x")
@@ -0,0 +1,71 @@
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from near_duplicates import THRESHOLD, NearDuplicateIndex, jaccard, shingles
+
+# ================= CONFIG =================
+HEADLINES = 2_000
+REWORDED = 0.1              # share of headlines that are a rewording of an earlier one
+
+WORDS = (
+    "markets stocks fed federal reserve inflation jobs court chips software "
+    "government policy election senate crisis record surge emergency shares "
+    "bonds earnings growth economy officials talks plan leaders warn trade "
+    "greenland tariffs nato minister storm floods strike union league final"
+).split()
+
+def synthetic_headlines(n, seed=5):
+    rng = random.Random(seed)
+    titles = []
+    for _ in range(n):
+        if titles and rng.random() < REWORDED:
+            words = rng.choice(titles).split()
+            words[rng.randrange(len(words))] = rng.choice(WORDS)
+            titles.append(" ".join(words))
+        else:
+            titles.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(7, 12))))
+    return titles
+
+# ================= CANDIDATES =================
+# Every new headline against every earlier one
+def pairwise(titles):
+    seen = []
+    dupes = 0
+    for title in titles:
+        sh = shingles(title)
+        if any(jaccard(sh, other) >= THRESHOLD for other in seen):
+            dupes += 1
+        seen.append(sh)
+    return dupes, len(seen) * (len(seen) - 1) // 2
+
+def lsh(titles):
+    index = NearDuplicateIndex()
+    dupes = 0
+    for i, title in enumerate(titles):
+        if index.find(title):
+            dupes += 1
+        index.add(i, title)
+    return dupes, index.comparisons
+
+def bench(label, run, titles):
+    started = time.perf_counter()
+    dupes, comparisons = run(titles)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<12} {elapsed * 1000:>9.1f}ms  {dupes:>6} near-duplicates  {comparisons:>10} comparisons")
+    return elapsed, dupes
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else HEADLINES
+    titles = synthetic_headlines(n)
+
+    print(f"🧬 Checking {n} headlines at threshold {THRESHOLD}")
+    base, expected = bench("pairwise", pairwise, titles)
+    fast, found = bench("minhash/lsh", lsh, titles)
+
+    # LSH can only miss pairs (never invent them): misses are the recall cost
+    print(f"⚡ LSH speedup: {base / fast:.1f}x | recall {found / max(expected, 1):.1%}")
@@ -0,0 +1,104 @@
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ranking import select_sections
+
+# ================= CONFIG =================
+ARTICLES = 100_000
+ROUNDS = 5
+
+# Same layout as generate_pages.HOMEPAGE_SECTIONS (importing generate_pages
+# would load the site templates from the working directory)
+SECTIONS = [
+    {"name": "live", "key": "age_hours", "descending": False, "limit": 20,
+     "where": lambda a: a["is_live"], "claims_all": True},
+    {"name": "trending", "key": "final_score", "limit": 6},
+    {"name": "top", "key": "final_score", "limit": 6},
+    {"name": "recent", "key": "date", "limit": 6},
+    {"name": "older", "key": None, "limit": 6},
+    {"name": "featured", "key": "final_score", "limit": 1,
+     "where": lambda a: not a["is_live"], "exclusive": False},
+]
+
+# Coarse scores and repeated slugs on purpose: ties and slug collisions are
+# where a heap selection can drift from the sorted() it replaces
+def synthetic_articles(n, slugs, seed=7):
+    rng = random.Random(seed)
+    for i in range(n):
+        age = rng.uniform(0, 24 * 30)
+        yield {
+            "slug": f"story-{rng.randrange(slugs)}",
+            "final_score": rng.randrange(200),
+            "date": f"2026-01-{1 + int(age) % 28:02d}T{int(age) % 24:02d}:00:00+00:00",
+            "age_hours": age,
+            "is_live": rng.random() < 0.0005
+        }
+
+# ================= CANDIDATES =================
+# The repeated-sort selection generate_pages.py used before ranking.py
+def sorted_sections(articles):
+    used = set()
+
+    live = [a for a in articles if a["is_live"]]
+    live.sort(key=lambda x: x["age_hours"])
+    used.update(a["slug"] for a in live)
+
+    remaining = [a for a in articles if a["slug"] not in used]
+    trending = sorted(remaining, key=lambda x: x["final_score"], reverse=True)[:6]
+    used.update(a["slug"] for a in trending)
+
+    remaining = [a for a in remaining if a["slug"] not in used]
+    top = sorted(remaining, key=lambda x: x["final_score"], reverse=True)[:6]
+    used.update(a["slug"] for a in top)
+
+    remaining = [a for a in remaining if a["slug"] not in used]
+    recent = sorted(remaining, key=lambda x: x["date"], reverse=True)[:6]
+    used.update(a["slug"] for a in recent)
+
+    older = [a for a in articles if a["slug"] not in used][:6]
+
+    featured_candidates = [a for a in articles if not a["is_live"]]
+    featured = [max(featured_candidates, key=lambda x: x["final_score"])] if featured_candidates else []
+
+    return {
+        "live": live[:20], "trending": trending, "top": top,
+        "recent": recent, "older": older, "featured": featured
+    }
+
+def same(a, b):
+    return a.keys() == b.keys() and all(
+        [id(x) for x in a[k]] == [id(x) for x in b[k]] for k in a
+    )
+
+def bench(label, select, articles):
+    best = None
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        select(articles)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<28} {best * 1000:>9.1f}ms  {len(articles) / best:>12.0f} articles/s")
+    return best
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else ARTICLES
+
+    # Exactness first: small pools with heavy slug reuse force the fallback
+    for seed in range(200):
+        small = list(synthetic_articles(random.Random(seed).randrange(1, 80), slugs=12, seed=seed))
+        for a in small[::7]:
+            a["is_live"] = True
+        assert same(sorted_sections(small), select_sections(small, SECTIONS)), seed
+
+    articles = list(synthetic_articles(n, slugs=n))
+    assert same(sorted_sections(articles), select_sections(articles, SECTIONS))
+
+    print(f"🏠 Selecting homepage sections from {n} articles (best of {ROUNDS})")
+    base = bench("repeated sorted()", sorted_sections, articles)
+    fast = bench("bounded heaps (ranking.py)", lambda a: select_sections(a, SECTIONS), articles)
+    print(f"⚡ Heap selection speedup: {base / fast:.1f}x")
@@ -0,0 +1,189 @@
+import argparse
+import importlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from build_profiler import cpu_seconds
+
+# ================= CONFIG =================
+SIZES = [10_000, 100_000]   # add 1_000_000 with --sizes (≈1GB of JSON, 1M article pages)
+WORK_DIR = os.path.join(tempfile.gettempdir(), "purestill-bench")
+SEED = 2026
+
+# Stage modules exposing run(data), in pipeline order. "load" is reading
+# data.json on its own; every other stage is timed after its own load.
+STAGES = [
+    "load",
+    "normalize_data",
+    "entity_authority",
+    "discover_lifecycle",
+    "generate_pages",
+    "topic_hubs",
+    "country_homepages",
+    "google_news_feed",
+    "sitemaps",
+]
+
+# What a stage reads from the working directory
+SITE_FILES = ["article_template.html", "index_template.html"]
+
+# ================= MEMORY =================
+# Resident set now and the high-water mark since the last reset, from
+# /proc/self/status (Linux). Writing 5 to clear_refs resets the mark, so a
+# stage's peak is not hidden under the peak of loading data.json.
+def rss_mb(field):
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+def reset_peak():
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+# ================= CHILD =================
+# One stage over one archive in a fresh process, so every measurement
+# starts from the same heap. Prints one JSON line.
+def measure(stage, data_file, work_dir):
+    os.chdir(work_dir)
+    from data_io import load_articles
+
+    started = time.perf_counter()
+    data = load_articles(data_file)
+    load_seconds = time.perf_counter() - started
+    articles = len(data)
+
+    module = None if stage == "load" else importlib.import_module(stage)
+
+    base = rss_mb("VmRSS")
+    peak_reset = reset_peak()
+    cpu = cpu_seconds()
+    started = time.perf_counter()
+
+    if module is not None:
+        # stage output is noise here; errors still reach stderr
+        with open(os.devnull, "w") as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                module.run(data)
+            finally:
+                sys.stdout = stdout
+
+    wall = time.perf_counter() - started if module is not None else load_seconds
+    peak = rss_mb("VmHWM")
+    print(json.dumps({
+        "stage": stage,
+        "articles": articles,
+        "wall_s": wall,
+        "cpu_s": cpu_seconds() - cpu if module is not None else None,
+        "rss_mb": base,
+        "peak_mb": peak,
+        "stage_peak_mb": peak - base if peak is not None and base is not None and peak_reset else None,
+    }))
+
+def run_child(stage, data_file, work_dir):
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", stage, data_file, work_dir],
+        capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        return {"stage": stage, "error": (proc.stderr.strip().splitlines() or ["failed"])[-1]}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+# ================= HARNESS =================
+def prepare(size, seed, work_dir):
+    from synthetic_data import write_archive
+
+    data_file = os.path.join(work_dir, f"data-{size}-{seed}.json")
+    if not os.path.exists(data_file):
+        started = time.perf_counter()
+        write_archive(data_file, size, seed)
+        print(f"🧪 {size} synthetic articles generated in {time.perf_counter() - started:.1f}s "
+              f"({os.path.getsize(data_file) / (1 << 20):.0f}MB)")
+    return data_file
+
+# A clean site/ and signals/ for the size: the first pass of each stage is
+# a cold build, the second (with --warm) what a following cron run costs
+def fresh_site(work_dir):
+    site_dir = os.path.join(work_dir, "run")
+    shutil.rmtree(site_dir, ignore_errors=True)
+    os.makedirs(os.path.join(site_dir, "site"))
+    os.makedirs(os.path.join(site_dir, "signals"))
+    for name in SITE_FILES:
+        shutil.copy(os.path.join(ROOT, name), site_dir)
+    return site_dir
+
+# rss: resident after data.json is loaded; stage peak: the most the stage
+# added on top of that
+def report_row(r, label=""):
+    if "error" in r:
+        print(f"   {'failed':>9}  {r['stage']}{label}: {r['error']}")
+        return
+    rate = r["articles"] / r["wall_s"] if r["wall_s"] else float("inf")
+    cpu = f"{r['cpu_s']:>8.2f}s" if r["cpu_s"] is not None else f"{'-':>9}"
+    stage_peak = f"{r['stage_peak_mb']:>+8.0f}MB" if r["stage_peak_mb"] is not None else f"{'-':>10}"
+    print(f"   {r['wall_s']:>8.2f}s  {cpu}  {rate:>11,.0f}/s  {r['rss_mb']:>6.0f}MB  {stage_peak}  {r['stage']}{label}")
+
+def run(sizes, stages, seed=SEED, work_dir=WORK_DIR, warm=False):
+    os.makedirs(work_dir, exist_ok=True)
+    results = []
+
+    for size in sizes:
+        data_file = prepare(size, seed, work_dir)
+        site_dir = fresh_site(work_dir)
+
+        print(f"\n📦 {size:,} articles")
+        print(f"   {'wall':>9}  {'cpu':>9}  {'throughput':>13}  {'rss':>8}  {'stage peak':>10}  stage")
+        for stage in stages:
+            passes = ["cold", "warm"] if warm and stage != "load" else ["cold"]
+            for label in passes:
+                r = run_child(stage, data_file, site_dir)
+                r["size"] = size
+                r["pass"] = label
+                results.append(r)
+                report_row(r, f" ({label})" if warm and stage != "load" else "")
+
+    return results
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == "--child":
+        measure(*sys.argv[2:])
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(description="Run pipeline stages over synthetic archives")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in SIZES),
+                        help="comma-separated archive sizes (e.g. 10000,100000,1000000)")
+    parser.add_argument("--stages", default=",".join(STAGES), help="comma-separated stages to run")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--work-dir", default=WORK_DIR, help="where archives and site output go")
+    parser.add_argument("--warm", action="store_true",
+                        help="run every stage a second time against the site/ and signals/ it just wrote")
+    parser.add_argument("--json", metavar="FILE", help="also write the results to FILE")
+    args = parser.parse_args()
+
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise SystemExit("❌ Unknown stages: " + ", ".join(sorted(unknown)))
+
+    results = run([int(s) for s in args.sizes.split(",")], stages, args.seed, args.work_dir, args.warm)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from template_engine import Template
+
+# ================= CONFIG =================
+ARTICLES = 10_000
+RAW_SLOTS = ("CONTENT", "RELATED_LINKS", "AD_MID", "AD_BOTTOM")
+
+with open(os.path.join(ROOT, "article_template.html"), encoding="utf-8") as f:
+    TEMPLATE_TEXT = f.read()
+
+def synthetic_pages(n):
+    for i in range(n):
+        yield {
+            "TITLE": f"Markets react to policy shift number {i}",
+            "SUMMARY": f"An independent analysis of development {i} and what it means.",
+            "CONTENT": "<h2>Context</h2>\n<p>" + "Lorem ipsum dolor sit amet. " * 40 + "</p>",
+            "CATEGORY": "Economy",
+            "SOURCE": f"https://example.com/story/{i}",
+            "DATE": "2026-01-20T14:11:04+00:00",
+            "CANONICAL_URL": f"https://purestill.pages.dev/articles/story-{i}.html",
+            "RELATED_LINKS": "",
+            "AD_MID": "",
+            "AD_BOTTOM": ""
+        }
+
+# ================= CANDIDATES =================
+# The replace chain generate_pages.py used before the compiled template
+def replace_chain(values):
+    html = TEMPLATE_TEXT
+    for slot, value in values.items():
+        html = html.replace("{{" + slot + "}}", value)
+    return html
+
+COMPILED = Template(TEMPLATE_TEXT, raw=RAW_SLOTS)
+COMPILED_RAW = Template(TEMPLATE_TEXT, escape=False)
+
+def bench(label, render, pages):
+    started = time.perf_counter()
+    total = 0
+    for values in pages:
+        total += len(render(values))
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {elapsed * 1000:>9.1f}ms  {len(pages) / elapsed:>10.0f} pages/s  {total / 1e6:.1f} MB")
+    return elapsed
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else ARTICLES
+    pages = list(synthetic_pages(n))
+
+    # Same output when nothing needs escaping
+    assert replace_chain(pages[0]) == COMPILED_RAW.render(pages[0])
+
+    print(f"📐 Rendering {n} articles ({len(TEMPLATE_TEXT) / 1024:.1f} KiB template)")
+    base = bench("str.replace chain", replace_chain, pages)
+    fast = bench("compiled (no escaping)", COMPILED_RAW.render, pages)
+    bench("compiled (escaped slots)", COMPILED.render, pages)
+    print(f"⚡ Compiled template speedup: {base / fast:.1f}x")
@@ -0,0 +1,144 @@
+import argparse
+import os
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from article_fields import stamp_dates
+from data_io import write_articles
+
+# ================= CONFIG =================
+ARCHIVE_DAYS = 3 * 365      # oldest article
+RECENT_SHARE = 0.3          # share of articles from the last week
+LOWERCASE_SHARE = 0.25      # records still in the raw ingest schema (title/date…)
+REPEAT_SHARE = 0.02         # the same headline again (another feed, a re-run)
+REWORD_SHARE = 0.05         # an earlier headline with one word changed
+BREAKING_SHARE = 0.1        # of the last three hours' articles
+CONTENT_SHARE = 0.1         # articles with a body (the rest are auto-expanded)
+
+CATEGORIES = [
+    ("Business", 25), ("Economy", 20), ("Policy", 20), ("Technology", 18),
+    ("AI", 7), ("Sports", 5), ("General", 5),
+]
+RAW_CATEGORIES = {"Policy": "politics", "Technology": "tech", "AI": "ai"}
+COUNTRIES = [("GLOBAL", 60), ("US", 15), ("UK", 10), ("IN", 6), ("CA", 4), ("AU", 3), ("DE", 2)]
+SOURCES = ["BBC", "Reuters", "AP", "Bloomberg", "CNBC", "Guardian", "Al Jazeera", "FT"]
+
+SUBJECTS = (
+    "Fed Trump Greenland NATO Europe China India Apple Nvidia OpenAI Tesla Amazon "
+    "Congress Senate Treasury ECB Bank Oil Gold Bitcoin Microsoft Google Meta Boeing "
+    "Ukraine Russia Japan Canada Mexico Germany France Britain Labour unions farmers"
+).split()
+VERBS = (
+    "says warns plans cuts raises delays approves rejects faces expands drops "
+    "weighs signs blocks targets launches hits boosts slows backs probes"
+).split()
+OBJECTS = (
+    "interest rates tariffs chips stocks shares bonds jobs wages inflation prices "
+    "exports deal talks ban regulation policy budget tax reform outlook forecast "
+    "earnings growth market sanctions subsidies layoffs strike merger lawsuit AI rules"
+).split()
+TAILS = (
+    "as markets slide|after talks stall|amid record demand|ahead of election|"
+    "in surprise move|despite warnings|for the first time|as pressure mounts|"
+    "in latest shake-up|after court ruling|as prices climb|in landmark decision"
+).split("|")
+
+NOW = datetime.now(timezone.utc)
+
+def weighted(rng, table):
+    values, weights = zip(*table)
+    return rng.choices(values, weights)[0]
+
+# Zipf-ish: a few subjects make most of the news
+def headline(rng):
+    subject = SUBJECTS[min(int(rng.paretovariate(1.2)) - 1, len(SUBJECTS) - 1)]
+    words = [subject, rng.choice(VERBS)]
+    words += rng.sample(OBJECTS, rng.randint(1, 3))
+    if rng.random() < 0.7:
+        words.append(rng.choice(TAILS))
+    text = " ".join(words)
+    return text[0].upper() + text[1:]
+
+def publish_date(rng):
+    if rng.random() < RECENT_SHARE:
+        age = timedelta(hours=rng.expovariate(1 / 36))
+    else:
+        age = timedelta(days=rng.uniform(0, ARCHIVE_DAYS))
+    return NOW - min(age, timedelta(days=ARCHIVE_DAYS))
+
+# ================= ARTICLES =================
+# Newest first, like data.json. Mixed schemas, duplicate and reworded
+# headlines, a few breaking items and a long tail of old articles.
+def synthetic_articles(n, seed=2026):
+    rng = random.Random(seed)
+    dates = sorted((publish_date(rng) for _ in range(n)), reverse=True)
+    titles = []
+
+    for i, published in enumerate(dates):
+        roll = rng.random()
+        if titles and roll < REPEAT_SHARE:
+            title = rng.choice(titles[-500:])
+        elif titles and roll < REPEAT_SHARE + REWORD_SHARE:
+            words = rng.choice(titles[-500:]).split()
+            words[rng.randrange(1, len(words))] = rng.choice(OBJECTS)
+            title = " ".join(words)
+        else:
+            title = f"{headline(rng)} ({i})" if rng.random() < 0.5 else headline(rng)
+        titles.append(title)
+
+        category = weighted(rng, CATEGORIES)
+        summary = f"An independent analysis of recent developments regarding {title}."
+        content = ""
+        if rng.random() < CONTENT_SHARE:
+            content = "".join(f"<p>{headline(rng)}. {summary}</p>" for _ in range(rng.randint(3, 8)))
+        breaking = (NOW - published) < timedelta(hours=3) and rng.random() < BREAKING_SHARE
+
+        if rng.random() < LOWERCASE_SHARE:
+            item = {
+                "title": title,
+                "summary": summary,
+                "content": content,
+                "category": RAW_CATEGORIES.get(category, category.lower()),
+                "date": published.isoformat(),
+                "source": rng.choice(SOURCES),
+            }
+            if breaking:
+                item["IS_BREAKING"] = True
+                item["PUBLISH_GROUP"] = "breaking"
+        else:
+            item = {
+                "TITLE": title,
+                "SUMMARY": summary,
+                "CONTENT": content,
+                "CATEGORY": category,
+                "DATE": published.isoformat(),
+                "SOURCE": rng.choice(SOURCES),
+                "COUNTRY": weighted(rng, COUNTRIES),
+                "IS_BREAKING": breaking,
+                "VISIBILITY": "normal" if rng.random() < 0.95 else "boosted",
+                "HEADLINE_VARIANTS": [title, f"{title}: What It Means", f"{title} Explained"],
+                "HEADLINE_ACTIVE": rng.randrange(3),
+                "DISCOVER_SIGNAL": int(rng.expovariate(1 / 20)),
+            }
+
+        stamp_dates(item)
+        yield item
+
+# Streamed to disk in the same layout save_articles() writes
+def write_archive(path, n, seed=2026):
+    write_articles(synthetic_articles(n, seed), path, backup=False)
+    return path
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic data.json")
+    parser.add_argument("articles", type=int, help="number of articles")
+    parser.add_argument("-o", "--out", default="data.synthetic.json")
+    parser.add_argument("--seed", type=int, default=2026)
+    args = parser.parse_args()
+
+    write_archive(args.out, args.articles, args.seed)
+    print(f"🧪 {args.articles} synthetic articles written to {args.out} ({os.path.getsize(args.out) / (1 << 20):.1f}MB)")
@@ -0,0 +1,273 @@
+import argparse
+import cProfile
+import json
+import os
+import resource
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+from data_io import atomic_write
+
+# ================= CONFIG =================
+# Only written when asked for (pipeline.py --metrics): the workflow commits
+# signals/, so recording every 15-minute desk run would make a commit of
+# its own each time. The daily run records.
+METRICS_FILE = "signals/build_metrics.jsonl"    # one line per recorded run
+KEEP_RUNS = 200             # runs kept in the file (≈ 7 months of daily runs)
+SUMMARY_RUNS = 20
+
+# ================= COUNTERS =================
+# Bytes this process handed to write(): files, pages, logs. Linux only
+# (None elsewhere); pool workers' writes are their own processes' and
+# are not included.
+def bytes_written():
+    try:
+        with open("/proc/self/io") as f:
+            for line in f:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+# High-water mark of this process (or of its largest finished child) so
+# far: cumulative over the run, not per stage
+def peak_rss_mb():
+    # ru_maxrss is KB on Linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale
+    return round(max(own, children) / (1 << 20), 1)
+
+# user + system time of this process and of finished child processes
+def cpu_seconds():
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+# One int per article: a hash of its field names and the identities of
+# their values. Comparing after a stage finds the articles the stage
+# added, removed or assigned a field on, without copying any article. A
+# list field mutated in place (same object) is not seen, and a field
+# assigned twice in one stage can, rarely, get its first value's address
+# back and look untouched.
+def article_fingerprints(data):
+    return {id(item): hash((tuple(item), tuple(map(id, item.values())))) for item in data}
+
+def articles_touched(before, data):
+    touched = 0
+    for item in data:
+        fp = before.pop(id(item), None)
+        if fp is None or fp != hash((tuple(item), tuple(map(id, item.values())))):
+            touched += 1
+    return touched + len(before)
+
+# ================= PROFILER =================
+# with profiler.stage("fetch_news", data): module.run(data)
+#
+# Each stage records wall and CPU seconds, articles read (the list it was
+# handed), articles written (added, removed or changed, from
+# article_fingerprints) and bytes written. Memory is the process's peak
+# RSS so far (peak_rss_mb, cumulative) and how far the stage pushed that
+# peak up (rss_growth_mb; 0 when it stayed under an earlier stage's).
+# With profile_dir set, every stage is also run under cProfile and dumped
+# to <profile_dir>/<stage>.prof (read it with python -m pstats).
+# metrics_file=None: report only, nothing is written.
+class BuildProfiler:
+    def __init__(self, metrics_file=None, profile_dir=None):
+        self.metrics_file = metrics_file
+        self.profile_dir = profile_dir
+        self.stages = []
+        self.started = time.perf_counter()
+        self.cpu_started = cpu_seconds()
+        self.bytes_started = bytes_written()
+
+        if profile_dir:
+            os.makedirs(profile_dir, exist_ok=True)
+
+    def stage(self, name, data=None):
+        return _Stage(self, name, data)
+
+    def record(self, name, wall, cpu, rss, growth, read, written, out_bytes, ok):
+        self.stages.append({
+            "stage": name,
+            "wall_s": round(wall, 4),
+            "cpu_s": round(cpu, 4),
+            "peak_rss_mb": rss,
+            "rss_growth_mb": growth,
+            "articles_read": read,
+            "articles_written": written,
+            "bytes_written": out_bytes,
+            "ok": ok,
+        })
+
+    def report(self):
+        print("\n⏱ Stage timings:")
+        print(f"   {'wall':>9}  {'cpu':>9}  {'peak rss':>8}  {'+rss':>8}  {'read':>7}  {'written':>7}  {'bytes':>9}  stage")
+        for s in self.stages:
+            print(
+                f"   {s['wall_s'] * 1000:>7.1f}ms  {s['cpu_s'] * 1000:>7.1f}ms  {s['peak_rss_mb']:>6.1f}MB  "
+                f"{s['rss_growth_mb']:>+6.1f}MB  "
+                f"{_count(s['articles_read']):>7}  {_count(s['articles_written']):>7}  "
+                f"{_size(s['bytes_written']):>9}  {s['stage']}{'' if s['ok'] else '  (failed)'}"
+            )
+        print(f"   {(time.perf_counter() - self.started) * 1000:>7.1f}ms  total")
+
+    # Appends this run as one JSON line (with a metrics file); returns the record
+    def save(self, articles=None, stages=None):
+        end_bytes = bytes_written()
+        run = {
+            "run_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "only": sorted(stages) if stages else None,
+            "articles": articles,
+            "wall_s": round(time.perf_counter() - self.started, 4),
+            "cpu_s": round(cpu_seconds() - self.cpu_started, 4),
+            "peak_rss_mb": peak_rss_mb(),
+            "bytes_written": None if end_bytes is None else end_bytes - self.bytes_started,
+            "stages": self.stages,
+        }
+
+        if not self.metrics_file:
+            return run
+
+        os.makedirs(os.path.dirname(self.metrics_file) or ".", exist_ok=True)
+        with open(self.metrics_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(run, separators=(",", ":")) + "\n")
+        trim_metrics(self.metrics_file)
+        return run
+
+class _Stage:
+    def __init__(self, profiler, name, data):
+        self.profiler = profiler
+        self.name = name
+        self.data = data
+
+    def __enter__(self):
+        self.read = len(self.data) if self.data is not None else None
+        self.before = article_fingerprints(self.data) if self.data is not None else None
+        self.rss = peak_rss_mb()
+        self.bytes = bytes_written()
+        self.cpu = cpu_seconds()
+        self.wall = time.perf_counter()
+
+        self.cprofile = None
+        if self.profiler.profile_dir:
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.cprofile is not None:
+            self.cprofile.disable()
+        wall = time.perf_counter() - self.wall
+        cpu = cpu_seconds() - self.cpu
+        end_bytes = bytes_written()
+
+        if self.cprofile is not None:
+            self.cprofile.dump_stats(os.path.join(self.profiler.profile_dir, f"{self.name.replace(' ', '_')}.prof"))
+
+        rss = peak_rss_mb()
+        self.profiler.record(
+            self.name, wall, cpu, rss, round(rss - self.rss, 1), self.read,
+            articles_touched(self.before, self.data) if self.before is not None else None,
+            None if end_bytes is None or self.bytes is None else end_bytes - self.bytes,
+            exc_type is None,
+        )
+        return False
+
+def _count(n):
+    return "-" if n is None else str(n)
+
+def _size(n):
+    if n is None:
+        return "-"
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.0f}{unit}" if unit == "B" else f"{n:.1f}{unit}"
+        n /= 1024
+    return f"{n:.1f}GB"
+
+# ================= HISTORY =================
+def load_runs(metrics_file=METRICS_FILE, last=None):
+    runs = []
+    if not os.path.exists(metrics_file):
+        return runs
+    with open(metrics_file, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                runs.append(json.loads(line))
+            except ValueError:
+                # half-written last line from a killed run
+                continue
+    return runs[-last:] if last else runs
+
+def trim_metrics(metrics_file=METRICS_FILE, keep=KEEP_RUNS):
+    runs = load_runs(metrics_file)
+    if len(runs) <= keep:
+        return
+    with atomic_write(metrics_file) as f:
+        for run in runs[-keep:]:
+            f.write(json.dumps(run, separators=(",", ":")) + "\n")
+
+# Per stage over the runs: median / min / max wall time, median CPU, the
+# latest run against the median (the trend), and the most the stage
+# pushed the process's peak RSS up.
+# Slowest stages first.
+def summarize(runs):
+    per_stage = {}
+    for run in runs:
+        for s in run.get("stages", []):
+            per_stage.setdefault(s["stage"], []).append(s)
+
+    rows = []
+    for name, samples in per_stage.items():
+        walls = [s["wall_s"] for s in samples]
+        median = statistics.median(walls)
+        rows.append({
+            "stage": name,
+            "runs": len(samples),
+            "median_s": median,
+            "min_s": min(walls),
+            "max_s": max(walls),
+            "last_s": walls[-1],
+            "trend": (walls[-1] - median) / median if median else 0.0,
+            "cpu_s": statistics.median(s["cpu_s"] for s in samples),
+            "rss_growth_mb": max(s.get("rss_growth_mb") or 0 for s in samples),
+            "failed": sum(1 for s in samples if not s.get("ok", True)),
+        })
+    rows.sort(key=lambda r: r["median_s"], reverse=True)
+    return rows
+
+def print_summary(runs, metrics_file=METRICS_FILE):
+    if not runs:
+        print(f"No runs recorded in {metrics_file}")
+        return
+
+    totals = [r["wall_s"] for r in runs]
+    print(f"📊 Last {len(runs)} runs ({runs[0]['run_at']} → {runs[-1]['run_at']})")
+    print(f"   total wall: median {statistics.median(totals):.2f}s | min {min(totals):.2f}s | "
+          f"max {max(totals):.2f}s | last {totals[-1]:.2f}s")
+    print(f"\n   {'median':>8}  {'min':>8}  {'max':>8}  {'last':>8}  {'trend':>7}  {'cpu':>8}  {'+rss':>8}  runs  stage")
+    for r in summarize(runs):
+        print(
+            f"   {r['median_s']:>7.2f}s  {r['min_s']:>7.2f}s  {r['max_s']:>7.2f}s  {r['last_s']:>7.2f}s  "
+            f"{r['trend']:>+6.0%}  {r['cpu_s']:>7.2f}s  {r['rss_growth_mb']:>+6.1f}MB  {r['runs']:>4}  {r['stage']}"
+            + (f"  ({r['failed']} failed)" if r["failed"] else "")
+        )
+
+# ================= CLI =================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize pipeline build metrics across runs")
+    parser.add_argument("-n", "--runs", type=int, default=SUMMARY_RUNS, help="how many recent runs to include")
+    parser.add_argument("--file", default=METRICS_FILE, help="metrics file to read")
+    parser.add_argument("--json", action="store_true", help="print the per-stage summary as JSON")
+    args = parser.parse_args()
+
+    runs = load_runs(args.file, args.runs)
+    if args.json:
+        print(json.dumps(summarize(runs), indent=2))
+    else:
+        print_summary(runs, args.file)
@@ -1,30 +1,35 @@
-import json
 from datetime import datetime, timezone, timedelta
 
-DATA_FILE = "data.json"
+from article_fields import ages_days
+from data_io import load_articles, save_articles
+
 NOW = datetime.now(timezone.utc)
 
 DECAY_DAYS = 30
-PRUNED = 0
 
-with open(DATA_FILE, encoding="utf-8") as f:
-    data = json.load(f)
+# ================= RULE =================
+# One article at age_days; True when it was changed. Also run, with the
+# other discover rules, by discover_lifecycle.py.
+def rule(item, age, state):
+    if age > DECAY_DAYS and item.get("DISCOVER_SIGNAL", 0) == 0:
+        item["VISIBILITY"] = "low"
+        state["pruned"] = state.get("pruned", 0) + 1
+        return True
+    return False
 
-for item in data:
-    try:
-        published = datetime.fromisoformat(
-            item["date"].replace("Z","+00:00")
-        )
-    except:
-        continue
+def report(state):
+    print(f"Weak content pruned: {state.get('pruned', 0)}")
 
-    age = (NOW - published).days
+def run(data):
+    state = {}
 
-    if age > DECAY_DAYS and item.get("DISCOVER_SIGNAL", 0) == 0:
-        item["VISIBILITY"] = "low"
-        PRUNED += 1
+    for item, age in zip(data, ages_days(data, NOW, fields=("date",))):
+        if age is not None:
+            rule(item, age, state)
 
-with open(DATA_FILE, "w", encoding="utf-8") as f:
-    json.dump(data, f, indent=2)
+    report(state)
 
-print(f"Weak content pruned: {PRUNED}")
+if __name__ == "__main__":
+    data = load_articles()
+    run(data)
+    save_articles(data)
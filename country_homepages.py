@@ -1,8 +1,17 @@
-import json, os
+import heapq
+import json
+import os
+
+from article_fields import article_slug, safe
+from data_io import load_articles
+from scoring import ScoreColumns, load_trust_score
 
-DATA_FILE = "data.json"
 OUT_DIR = "site"
+RPM_COUNTRIES_FILE = "signals/rpm_countries.json"
+
+TOP_N = 15
 
+# Used when signals/rpm_countries.json is missing or unreadable
 COUNTRY_RPM = {
     "US": 100,
     "UK": 90,
@@ -10,38 +19,69 @@ COUNTRY_RPM = {
     "AU": 80
 }
 
-os.makedirs(OUT_DIR, exist_ok=True)
+# Catch-all code for untargeted stories, not a market with its own page
+SKIP_COUNTRIES = {"GLOBAL"}
+
+def load_countries(path=RPM_COUNTRIES_FILE):
+    if not os.path.exists(path):
+        return dict(COUNTRY_RPM)
+    try:
+        with open(path, encoding="utf-8") as f:
+            rpm = json.load(f)
+    except Exception as e:
+        print("⚠️ rpm_countries.json unreadable, using built-in markets:", e)
+        return dict(COUNTRY_RPM)
+    return {c: v for c, v in rpm.items() if c not in SKIP_COUNTRIES}
+
+# ================= RANKING =================
+# Base scores are computed once for the whole set. A country only changes
+# the score of the articles that target it (ScoreColumns.country), so its
+# top N is drawn from those boosted articles plus the best unboosted ones
+# by base score — never a re-sort of the full list. Ties keep data.json
+# order, as the old per-country sorted() did.
+def rank_countries(columns, countries, base, limit=TOP_N):
+    boosted = {country: columns.country(country, rpm, base) for country, rpm in countries.items()}
 
-with open(DATA_FILE, encoding="utf-8") as f:
-    data = json.load(f)
+    # Enough of the base ranking to fill any country after its boosted
+    # articles are taken out of it
+    depth = limit + max((len(b) for b in boosted.values()), default=0)
+    base_top = heapq.nlargest(depth, range(len(base)), key=base.__getitem__)
 
-def score(article, country):
-    base = article.get("final_score", 0)
-    rpm = COUNTRY_RPM.get(country, 50)
-    if country in article.get("TARGET_COUNTRIES", []):
-        base += rpm * 0.5
-    return base
+    ranked = {}
+    for country in countries:
+        scores = boosted[country]
+        candidates = [(score, -i) for i, score in scores.items()]
+        candidates += [(base[i], -i) for i in base_top if i not in scores][:limit]
 
-for country in COUNTRY_RPM:
-    country_articles = sorted(
-        data,
-        key=lambda a: score(a, country),
-        reverse=True
-    )[:15]
+        ranked[country] = [-i for _, i in heapq.nlargest(limit, candidates)]
+    return ranked
 
-    html = "<h1>Top News for {}</h1>".format(country)
+def run(data):
+    os.makedirs(OUT_DIR, exist_ok=True)
 
-    for a in country_articles:
-        html += f"""
+    countries = load_countries()
+    columns = ScoreColumns.from_records(data, load_trust_score())
+    ranked = rank_countries(columns, countries, columns.final())
+
+    for country in countries:
+        country_articles = [data[i] for i in ranked[country]]
+
+        html = "<h1>Top News for {}</h1>".format(country)
+
+        for a in country_articles:
+            html += f"""
         <div>
-          <a href="/articles/{a['slug']}.html">{a['title']}</a>
+          <a href="/articles/{article_slug(a)}.html">{safe(a, "TITLE", "title")}</a>
         </div>
         """
 
-    out = os.path.join(OUT_DIR, country.lower())
-    os.makedirs(out, exist_ok=True)
+        out = os.path.join(OUT_DIR, country.lower())
+        os.makedirs(out, exist_ok=True)
+
+        with open(os.path.join(out, "index.html"), "w") as f:
+            f.write(html)
 
-    with open(os.path.join(out, "index.html"), "w") as f:
-        f.write(html)
+    print(f"🌍 Country homepages generated ({len(countries)} markets)")
 
-print("🌍 Country homepages generated")
+if __name__ == "__main__":
+    run(load_articles())
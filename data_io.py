@@ -0,0 +1,258 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from itertools import islice
+
+try:
+    import fcntl
+except ImportError:     # not on Windows; locking becomes a no-op there
+    fcntl = None
+
+# ================= CONFIG =================
+DATA_FILE = "data.json"
+BACKUP_SUFFIX = ".bak"        # previous version kept next to data.json
+
+READ_CHUNK = 1 << 16          # characters read per refill when streaming
+WHITESPACE = " \t\r\n"
+WRITE_BATCH = 256             # articles encoded per write when streaming
+
+# ================= SAFE WRITES =================
+# Everything is written to a temp file in the target's directory, fsynced
+# and renamed over the target, so a killed run leaves either the old file
+# or the new one, never a truncated mix. backup=True first hard-links the
+# current version to <path>.bak — the last good copy readers fall back to.
+@contextmanager
+def atomic_write(path, backup=False, encoding="utf-8"):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix="." + os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+
+        # mkstemp files are 0600; keep the target's mode (or a normal one)
+        mode = os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644
+        os.chmod(tmp, mode)
+
+        if backup and os.path.exists(path):
+            link = tmp + BACKUP_SUFFIX
+            try:
+                os.link(path, link)
+            except OSError:
+                shutil.copyfile(path, link)
+            os.replace(link, path + BACKUP_SUFFIX)
+
+        os.replace(tmp, path)
+    except BaseException:
+        for leftover in (tmp, tmp + BACKUP_SUFFIX):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+        raise
+
+    # make the rename itself durable
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+def save_json(path, obj, backup=False, **dump_args):
+    with atomic_write(path, backup=backup) as f:
+        json.dump(obj, f, **dump_args)
+
+# Skips the write when the file already holds exactly this text, so
+# unchanged outputs keep their mtime and deploys do not re-upload them
+def write_if_changed(path, text):
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    with atomic_write(path) as f:
+        f.write(text)
+    return True
+
+# A missing file returns default. An unreadable one falls back to its .bak
+# copy, then to default when one is given; otherwise the error is raised.
+_REQUIRED = object()
+
+def load_json(path, default=_REQUIRED):
+    if not os.path.exists(path):
+        if default is _REQUIRED:
+            raise FileNotFoundError(path)
+        return default
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except ValueError as e:
+        error = e
+
+    backup = path + BACKUP_SUFFIX
+    if os.path.exists(backup):
+        try:
+            with open(backup, encoding="utf-8") as f:
+                data = json.load(f)
+            print(f"⚠️ {path} unreadable ({error}) — recovered last good copy {backup}")
+            return data
+        except ValueError:
+            pass
+
+    if default is _REQUIRED:
+        raise error
+    print(f"⚠️ {path} unreadable ({error}) — using defaults")
+    return default
+
+# ================= RUN LOCK =================
+# Exclusive advisory lock held for a whole run, so an overlapping cron
+# (15-minute desk vs daily full run) waits instead of interleaving writes.
+@contextmanager
+def file_lock(path, timeout=None, poll=1.0):
+    if fcntl is None:
+        yield
+        return
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        started = time.monotonic()
+        waiting = False
+        while True:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if not waiting:
+                    print(f"⏳ Waiting for {path} (another run is in progress)…")
+                    waiting = True
+                if timeout is not None and time.monotonic() - started >= timeout:
+                    raise TimeoutError(f"❌ {path} still locked after {timeout}s")
+                time.sleep(poll)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+# ================= ARTICLES =================
+# recover=True falls back to data.json.bak when data.json is unreadable
+def load_articles(path=DATA_FILE, recover=True):
+    if recover:
+        data = load_json(path)
+    else:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+    if not isinstance(data, list):
+        raise Exception(f"❌ {path} must be a list")
+
+    return data
+
+def save_articles(data, path=DATA_FILE):
+    write_articles(data, path)
+
+# ================= STREAMING READ =================
+# Yields the items of a top-level JSON array one at a time, decoding each
+# with raw_decode from a rolling buffer. Memory is bounded by the largest
+# single article, not the whole archive. For read-only passes run on their
+# own (topic_seasons, rpm_heatmap); there is no .bak fallback, and a torn
+# or empty file raises ValueError like json.load, possibly after some
+# items were already yielded.
+def iter_articles(path=DATA_FILE, chunk_size=READ_CHUNK):
+    decoder = json.JSONDecoder()
+
+    with open(path, encoding="utf-8") as f:
+        buf = ""
+        pos = 0
+        eof = False
+
+        def refill():
+            nonlocal buf, pos, eof
+            # Grow the read with the buffer so one huge item is not
+            # re-decoded once per small chunk
+            chunk = f.read(max(chunk_size, len(buf) - pos))
+            if not chunk:
+                eof = True
+                return False
+            buf = buf[pos:] + chunk
+            pos = 0
+            return True
+
+        def next_char():
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in WHITESPACE:
+                    pos += 1
+                if pos < len(buf):
+                    return buf[pos]
+                if not refill():
+                    return ""
+
+        first = next_char()
+        if first == "":
+            raise json.JSONDecodeError("Expecting value", buf, pos)
+        if first != "[":
+            raise Exception(f"❌ {path} must be a list")
+        pos += 1
+
+        if next_char() == "]":
+            return
+
+        while True:
+            next_char()
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if eof or not refill():
+                        raise
+                    continue
+                # A value cut at the buffer edge can still decode ("2." →
+                # 2), so only accept it once its ',' or ']' is buffered
+                j = end
+                while j < len(buf) and buf[j] in WHITESPACE:
+                    j += 1
+                if (j == len(buf) or buf[j] not in ",]") and not eof and refill():
+                    continue
+                break
+
+            pos = end
+            yield item
+
+            c = next_char()
+            if c == ",":
+                pos += 1
+            elif c == "]":
+                return
+            else:
+                raise json.JSONDecodeError("Expecting ',' or ']'", buf, pos)
+
+# ================= STREAMING WRITE =================
+# Writes items in small batches. The output is byte-identical to
+# json.dump(data, f, indent=2, ensure_ascii=False).
+def write_articles(items, path=DATA_FILE, backup=True):
+    with atomic_write(path, backup=backup) as f:
+        return write_article_stream(items, f)
+
+def write_article_stream(items, f, batch_size=WRITE_BATCH):
+    items = iter(items)
+    count = 0
+
+    while True:
+        batch = list(islice(items, batch_size))
+        if not batch:
+            break
+
+        # A batch dumped as a list is already indented as part of the
+        # outer array; only its own brackets are dropped
+        text = json.dumps(batch, indent=2, ensure_ascii=False)[2:-2]
+        f.write(("[\n" if count == 0 else ",\n") + text)
+
+        count += len(batch)
+
+    f.write("\n]" if count else "[]")
+    return count
@@ -1,47 +1,55 @@
-import json
 from datetime import datetime, timezone
 
-DATA_FILE = "data.json"
+from article_fields import ages_days
+from data_io import load_articles, save_articles
+
 NOW = datetime.now(timezone.utc)
 
 MIN_SIGNAL_AGE_DAYS = 3
 MAX_SIGNAL_AGE_DAYS = 7
 LOCK_THRESHOLD = 2   # signals needed to lock headline
 
-with open(DATA_FILE, encoding="utf-8") as f:
-    data = json.load(f)
-
-for item in data:
+# ================= RULE =================
+# One article at age_days; True when it was changed. Also run, with the
+# other discover rules, by discover_lifecycle.py.
+def rule(item, age_days, state):
     if "HEADLINE_VARIANTS" not in item:
-        continue
+        return False
 
     if item.get("HEADLINE_LOCKED"):
-        continue
+        return False
 
-    try:
-        published = datetime.fromisoformat(
-            item["date"].replace("Z", "+00:00")
-        )
-    except:
-        continue
+    # Resurfacing window
+    if not MIN_SIGNAL_AGE_DAYS <= age_days <= MAX_SIGNAL_AGE_DAYS:
+        return False
 
-    age_days = (NOW - published).days
+    item["DISCOVER_SIGNAL"] = item.get("DISCOVER_SIGNAL", 0) + 1
 
-    # Resurfacing window
-    if MIN_SIGNAL_AGE_DAYS <= age_days <= MAX_SIGNAL_AGE_DAYS:
-        item["DISCOVER_SIGNAL"] = item.get("DISCOVER_SIGNAL", 0) + 1
+    # Rotate headline ONCE if not locked
+    if item["DISCOVER_SIGNAL"] < LOCK_THRESHOLD:
+        item["HEADLINE_ACTIVE"] = (
+            item["HEADLINE_ACTIVE"] + 1
+        ) % len(item["HEADLINE_VARIANTS"])
+
+    # Lock winner
+    if item["DISCOVER_SIGNAL"] >= LOCK_THRESHOLD:
+        item["HEADLINE_LOCKED"] = True
+
+    return True
+
+def report(state):
+    print("Discover CTR feedback processed")
 
-        # Rotate headline ONCE if not locked
-        if item["DISCOVER_SIGNAL"] < LOCK_THRESHOLD:
-            item["HEADLINE_ACTIVE"] = (
-                item["HEADLINE_ACTIVE"] + 1
-            ) % len(item["HEADLINE_VARIANTS"])
+def run(data):
+    state = {}
 
-        # Lock winner
-        if item["DISCOVER_SIGNAL"] >= LOCK_THRESHOLD:
-            item["HEADLINE_LOCKED"] = True
+    for item, age_days in zip(data, ages_days(data, NOW, fields=("date",))):
+        if age_days is not None:
+            rule(item, age_days, state)
 
-with open(DATA_FILE, "w", encoding="utf-8") as f:
-    json.dump(data, f, indent=2)
+    report(state)
 
-print("Discover CTR feedback processed")
+if __name__ == "__main__":
+    data = load_articles()
+    run(data)
+    save_articles(data)
@@ -1,31 +1,42 @@
-import json
 from datetime import datetime, timezone, timedelta
 
-DATA_FILE = "data.json"
+from article_fields import ages_days
+from data_io import load_articles
+
 NOW = datetime.now(timezone.utc)
 
 WARNING_DAYS = 4
 
-with open(DATA_FILE, encoding="utf-8") as f:
-    data = json.load(f)
+# ================= RULE =================
+# One article at age_days; True when it raised an alert. Also run, with
+# the other discover rules, by discover_lifecycle.py.
+def rule(item, age, state):
+    if item.get("DISCOVER_SIGNAL"):
+        return False
+
+    if age >= WARNING_DAYS and item.get("EVERGREEN_REFRESHED_AT") is None:
+        state.setdefault("alerts", []).append(item["title"])
+        return True
+    return False
+
+def report(state):
+    alerts = state.get("alerts", [])
 
-alerts = []
+    if alerts:
+        print("🚨 DISCOVER EARLY WARNING:")
+        for t in alerts[:5]:
+            print(" -", t)
+    else:
+        print("✅ Discover activity normal")
 
-for item in data:
-    if not item.get("DISCOVER_SIGNAL"):
-        try:
-            published = datetime.fromisoformat(item["date"].replace("Z","+00:00"))
-        except:
-            continue
+def run(data):
+    state = {}
 
-        age = (NOW - published).days
+    for item, age in zip(data, ages_days(data, NOW, fields=("date",))):
+        if age is not None:
+            rule(item, age, state)
 
-        if age >= WARNING_DAYS and item.get("EVERGREEN_REFRESHED_AT") is None:
-            alerts.append(item["title"])
+    report(state)
 
-if alerts:
-    print("🚨 DISCOVER EARLY WARNING:")
-    for t in alerts[:5]:
-        print(" -", t)
-else:
-    print("✅ Discover activity normal")
+if __name__ == "__main__":
+    run(load_articles())
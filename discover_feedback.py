@@ -1,25 +1,36 @@
-import json
 from datetime import datetime, timezone, timedelta
 
-DATA_FILE = "data.json"
-NOW = datetime.now(timezone.utc)
-
-with open(DATA_FILE, encoding="utf-8") as f:
-    data = json.load(f)
+from article_fields import ages_days
+from data_io import load_articles, save_articles
 
-for item in data:
-    try:
-        published = datetime.fromisoformat(item["date"].replace("Z","+00:00"))
-    except:
-        continue
+NOW = datetime.now(timezone.utc)
 
-    age_days = (NOW - published).days
+MIN_SIGNAL_AGE_DAYS = 3
+MAX_SIGNAL_AGE_DAYS = 7
 
+# ================= RULE =================
+# One article at age_days; True when it was changed. Also run, with the
+# other discover rules, by discover_lifecycle.py.
+def rule(item, age_days, state):
     # If Google resurfaces article after 3–7 days → good CTR
-    if 3 <= age_days <= 7:
+    if MIN_SIGNAL_AGE_DAYS <= age_days <= MAX_SIGNAL_AGE_DAYS:
         item["DISCOVER_SIGNAL"] = item.get("DISCOVER_SIGNAL", 0) + 1
+        return True
+    return False
+
+def report(state):
+    print("Discover feedback updated")
+
+def run(data):
+    state = {}
+
+    for item, age_days in zip(data, ages_days(data, NOW, fields=("date",))):
+        if age_days is not None:
+            rule(item, age_days, state)
 
-with open(DATA_FILE, "w", encoding="utf-8") as f:
-    json.dump(data, f, indent=2)
+    report(state)
 
-print("Discover feedback updated")
+if __name__ == "__main__":
+    data = load_articles()
+    run(data)
+    save_articles(data)
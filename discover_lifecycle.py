@@ -0,0 +1,159 @@
+import time
+import traceback
+from datetime import datetime, timezone
+
+import content_prune
+import discover_ctr_feedback
+import discover_early_warning
+import discover_feedback
+import discover_low_ctr_guard
+import discover_recovery
+import discover_winners
+from article_fields import article_epoch
+from article_store import DAY_FIELDS, DAY_SECONDS, ArticleStore
+
+NOW = datetime.now(timezone.utc)
+
+# ================= RULE TABLE =================
+# The discover lifecycle scripts, in the order they used to run one after
+# another. Each module keeps its own thresholds and exposes
+# rule(item, age, state) -> changed, plus report(state) for its summary.
+# The window is the age range in whole days (max None: no upper bound)
+# outside which the rule never touches an article.
+RULES = [
+    # name                      module                  age unit  window (days)
+    ("discover_feedback",       discover_feedback,      "days",   (discover_feedback.MIN_SIGNAL_AGE_DAYS,
+                                                                   discover_feedback.MAX_SIGNAL_AGE_DAYS)),
+    ("discover_ctr_feedback",   discover_ctr_feedback,  "days",   (discover_ctr_feedback.MIN_SIGNAL_AGE_DAYS,
+                                                                   discover_ctr_feedback.MAX_SIGNAL_AGE_DAYS)),
+    ("discover_recovery",       discover_recovery,      "days",   (discover_recovery.RECOVERY_MIN_DAYS,
+                                                                   discover_recovery.RECOVERY_MAX_DAYS)),
+    ("discover_low_ctr_guard",  discover_low_ctr_guard, "days",   (discover_low_ctr_guard.LOW_SIGNAL_DAYS, None)),
+    ("content_prune",           content_prune,          "days",   (content_prune.DECAY_DAYS + 1, None)),
+    ("discover_early_warning",  discover_early_warning, "days",   (discover_early_warning.WARNING_DAYS, None)),
+    ("discover_winners",        discover_winners,       "hours",  (1, None)),       # > 24 hours
+]
+
+# ================= CANDIDATES =================
+# The rules' windows merged into non-overlapping ranges, e.g. (3, 7) and
+# (31, None) stay apart, (3, 7) and (5, 10) become (3, 10)
+def merged_windows(rules):
+    merged = []
+    for lo, hi in sorted((window for *_, window in rules), key=lambda w: w[0]):
+        if merged and (merged[-1][1] is None or lo <= merged[-1][1] + 1):
+            last_lo, last_hi = merged[-1]
+            merged[-1] = (last_lo, None if last_hi is None or hi is None else max(last_hi, hi))
+        else:
+            merged.append((lo, hi))
+    return merged
+
+# The articles any of the rules can touch, in list order. With the article
+# store's day index only the day buckets inside the rules' windows are
+# read (open-ended ones too), plus whatever was ingested this run;
+# without it, or when a stage reshaped the list, the whole list.
+def candidates(data, rules, now_ts, store=None):
+    fresh = store.prepended(data) if store is not None else None
+    if fresh is None:
+        return data
+
+    return list(fresh) + store.in_windows(now_ts, merged_windows(rules))
+
+# ================= ENGINE =================
+# One pass over the articles: the publish date is read once per article
+# and every rule whose window covers it is applied, in table order. Rules
+# only read and write the article in hand (plus their own state), so this
+# makes the same changes as running the scripts in sequence over the
+# whole list.
+#
+# Like the "|| true" stages it replaces, a rule that raises is reported and
+# the other rules carry on, and none of its changes are kept: the old
+# script crashed before saving. Every field a rule sets is journalled;
+# on a failure the whole pass is undone and run again without that rule,
+# so the rules after it see the articles as they would have without it.
+_MISSING = object()
+
+def run_rules(data, rules=RULES, now=None, store=None):
+    now_ts = (now or NOW).timestamp()
+    items = candidates(data, rules, now_ts, store)
+    failed = set()
+
+    while True:
+        states = [{} for _ in rules]
+        hits = [0] * len(rules)
+        journal = []            # (item, field, value before) in change order
+        visited, failing = _pass(items, rules, now_ts, failed, states, hits, journal)
+        if failing is None:
+            break
+
+        for item, field, value in reversed(journal):
+            if value is _MISSING:
+                item.pop(field, None)
+            else:
+                item[field] = value
+        print(f"⚠️ {rules[failing][0]} failed, its changes rolled back, continuing")
+        failed.add(failing)
+
+    for i, (name, module, *_) in enumerate(rules):
+        if i not in failed:
+            module.report(states[i])
+
+    return visited, hits, [rules[i][0] for i in sorted(failed)]
+
+# Returns (articles read, index of the rule that raised or None)
+def _pass(items, rules, now_ts, failed, states, hits, journal):
+    visited = 0
+
+    for item in items:
+        ts = article_epoch(item, fields=DAY_FIELDS)
+        if ts is None:
+            continue
+        visited += 1
+        age_days = int((now_ts - ts) // DAY_SECONDS)
+        age_hours = (now_ts - ts) / 3600
+
+        for i, (name, module, unit, (lo, hi)) in enumerate(rules):
+            if i in failed or age_days < lo or (hi is not None and age_days > hi):
+                continue
+            before = dict(item)
+            try:
+                changed = module.rule(item, age_days if unit == "days" else age_hours, states[i])
+            except Exception:
+                traceback.print_exc()
+                _record(journal, item, before)
+                return visited, i
+            if changed:
+                hits[i] += 1
+                _record(journal, item, before)
+
+    return visited, None
+
+def _record(journal, item, before):
+    for field, value in before.items():
+        if item.get(field, _MISSING) is not value:
+            journal.append((item, field, value))
+    for field in item.keys() - before.keys():
+        journal.append((item, field, _MISSING))
+
+# names: run only these rules (table order is kept). store: the article
+# store data came from, whose day index narrows windowed runs.
+def run(data, names=None, store=None):
+    rules = [r for r in RULES if names is None or r[0] in names]
+
+    started = time.perf_counter()
+    visited, hits, failed = run_rules(data, rules, store=store)
+    elapsed = time.perf_counter() - started
+
+    print(f"♻️ Discover lifecycle: {len(rules)} rules, {visited}/{len(data)} articles read in {elapsed * 1000:.1f}ms")
+    for (name, *_), count in zip(rules, hits):
+        print(f"   {count:>7}  {name}{'  (failed)' if name in failed else ''}")
+
+    if failed:
+        raise Exception("❌ Discover rules failed: " + ", ".join(failed))
+
+# ================= STANDALONE =================
+if __name__ == "__main__":
+    store = ArticleStore()
+    data = store.articles()
+    run(data, store=store)
+    store.sync(data)
+    store.export()
@@ -1,36 +1,40 @@
-import json
 from datetime import datetime, timezone, timedelta
 
-DATA_FILE = "data.json"
+from article_fields import ages_days
+from data_io import load_articles, save_articles
+
 NOW = datetime.now(timezone.utc)
 
 LOW_SIGNAL_DAYS = 5
 DOWNGRADE_THRESHOLD = 0
 
-with open(DATA_FILE, encoding="utf-8") as f:
-    data = json.load(f)
-
-downgraded = 0
-
-for item in data:
+# ================= RULE =================
+# One article at age_days; True when it was changed. Also run, with the
+# other discover rules, by discover_lifecycle.py.
+def rule(item, age_days, state):
     if item.get("HEADLINE_LOCKED"):
-        continue
-
-    try:
-        published = datetime.fromisoformat(
-            item["date"].replace("Z","+00:00")
-        )
-    except:
-        continue
-
-    age_days = (NOW - published).days
+        return False
 
     if age_days >= LOW_SIGNAL_DAYS:
         if item.get("DISCOVER_SIGNAL", 0) <= DOWNGRADE_THRESHOLD:
             item["VISIBILITY"] = "low"
-            downgraded += 1
+            state["downgraded"] = state.get("downgraded", 0) + 1
+            return True
+    return False
+
+def report(state):
+    print(f"🔻 Low-CTR articles downgraded: {state.get('downgraded', 0)}")
+
+def run(data):
+    state = {}
+
+    for item, age_days in zip(data, ages_days(data, NOW, fields=("date",))):
+        if age_days is not None:
+            rule(item, age_days, state)
 
-with open(DATA_FILE, "w", encoding="utf-8") as f:
-    json.dump(data, f, indent=2)
+    report(state)
 
-print(f"🔻 Low-CTR articles downgraded: {downgraded}")
+if __name__ == "__main__":
+    data = load_articles()
+    run(data)
+    save_articles(data)
@@ -1,8 +1,9 @@
-import json
 from datetime import datetime, timezone
 
+from article_fields import ages_days
+from data_io import load_articles, save_articles
+
 # ================= CONFIG =================
-DATA_FILE = "data.json"
 NOW = datetime.now(timezone.utc)
 
 # 🔧 Recovery rules (SAFE & CONSERVATIVE)
@@ -11,39 +12,23 @@ RECOVERY_MAX_DAYS = 10       # too old → skip
 DROP_AFTER_DAYS = 5          # Discover cooling threshold
 MAX_RECOVERIES = 3           # hard cap per run (anti-spam)
 
-# ================= LOAD DATA =================
-with open(DATA_FILE, encoding="utf-8") as f:
-    data = json.load(f)
-
-if not isinstance(data, list):
-    raise Exception("data.json must be a list")
-
-recovered = 0
-
-# ================= RECOVERY SCAN =================
-for item in data:
-    if recovered >= MAX_RECOVERIES:
-        break
+# ================= RECOVERY RULE =================
+# One article at age_days; True when it was flagged. Also run, with the
+# other discover rules, by discover_lifecycle.py.
+def rule(item, age_days, state):
+    # 🛑 cap reached: the rest of this run's articles are left alone
+    if state.get("recovered", 0) >= MAX_RECOVERIES:
+        return False
 
     # ❌ Never touch protected articles
     if item.get("HEADLINE_LOCKED") is True:
-        continue
+        return False
     if item.get("RECOVERY_FLAG") is True:
-        continue
-
-    # ⏱ Parse publish date safely
-    try:
-        published = datetime.fromisoformat(
-            str(item.get("date", "")).replace("Z", "+00:00")
-        )
-    except Exception:
-        continue
-
-    age_days = (NOW - published).days
+        return False
 
     # 🧠 Recovery eligibility window
     if not (RECOVERY_MIN_DAYS <= age_days <= RECOVERY_MAX_DAYS):
-        continue
+        return False
 
     # 📉 Detect Discover cooling
     discover_signal = item.get("DISCOVER_SIGNAL", 0)
@@ -52,10 +37,26 @@ for item in data:
         item["RECOVERY_FLAG"] = True
         item["RECOVERY_AT"] = NOW.isoformat()
 
-        recovered += 1
+        state["recovered"] = state.get("recovered", 0) + 1
+        return True
+    return False
+
+def report(state):
+    print(f"🩺 Discover recovery flagged: {state.get('recovered', 0)}")
+
+# ================= RECOVERY SCAN =================
+def run(data):
+    state = {}
+
+    for item, age_days in zip(data, ages_days(data, NOW, fields=("date",))):
+        if state.get("recovered", 0) >= MAX_RECOVERIES:
+            break
+        if age_days is not None:
+            rule(item, age_days, state)
 
-# ================= SAVE =================
-with open(DATA_FILE, "w", encoding="utf-8") as f:
-    json.dump(data, f, indent=2, ensure_ascii=False)
+    report(state)
 
-print(f"🩺 Discover recovery flagged: {recovered}")
+if __name__ == "__main__":
+    data = load_articles()
+    run(data)
+    save_articles(data)
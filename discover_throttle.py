@@ -1,23 +1,25 @@
 import json
 
-with open("signals/discover_winners.json") as f:
-    winners = json.load(f)
+from data_io import load_articles, save_json
 
-with open("data.json") as f:
-    data = json.load(f)
+def run(data):
+    with open("signals/discover_winners.json") as f:
+        winners = json.load(f)
 
-recent = data[:10]
+    recent = data[:10]
 
-winner_ratio = len(winners) / max(len(recent),1)
+    winner_ratio = len(winners) / max(len(recent),1)
 
-THROTTLE = "NORMAL"
+    throttle = "NORMAL"
 
-if winner_ratio < 0.2:
-    THROTTLE = "SLOW"
-elif winner_ratio > 0.5:
-    THROTTLE = "FAST"
+    if winner_ratio < 0.2:
+        throttle = "SLOW"
+    elif winner_ratio > 0.5:
+        throttle = "FAST"
 
-with open("signals/publish_mode.json","w") as f:
-    json.dump({"mode": THROTTLE}, f)
+    save_json("signals/publish_mode.json", {"mode": throttle})
 
-print(f"🚦 Publish mode: {THROTTLE}")
+    print(f"🚦 Publish mode: {throttle}")
+
+if __name__ == "__main__":
+    run(load_articles())
@@ -1,31 +1,39 @@
-import json
 from datetime import datetime, timezone, timedelta
 
-DATA_FILE = "data.json"
-NOW = datetime.now(timezone.utc)
-
-WINNERS = []
-
-with open(DATA_FILE, encoding="utf-8") as f:
-    data = json.load(f)
+from article_fields import ages_hours
+from data_io import load_articles, save_json
 
-for a in data:
-    try:
-        published = datetime.fromisoformat(a["date"].replace("Z","+00:00"))
-    except:
-        continue
-
-    age_hours = (NOW - published).total_seconds() / 3600
+NOW = datetime.now(timezone.utc)
 
+# ================= RULE =================
+# One article at age_hours; True when it is a winner. Also run, with the
+# other discover rules, by discover_lifecycle.py.
+def rule(a, age_hours, state):
     # winner conditions (SAFE)
     if (
         age_hours > 24
         and a.get("ENTITY_AUTHORITY_SCORE", 0) >= 5
         and a.get("final_score", 0) >= 70
     ):
-        WINNERS.append(a)
+        state.setdefault("winners", []).append(a)
+        return True
+    return False
+
+def report(state):
+    winners = state.get("winners", [])
+
+    save_json("signals/discover_winners.json", winners, indent=2)
+
+    print(f"🏆 Discover winners found: {len(winners)}")
+
+def run(data):
+    state = {}
+
+    for a, age_hours in zip(data, ages_hours(data, NOW, fields=("date",))):
+        if age_hours is not None:
+            rule(a, age_hours, state)
 
-with open("signals/discover_winners.json", "w") as f:
-    json.dump(WINNERS, f, indent=2)
+    report(state)
 
-print(f"🏆 Discover winners found: {len(WINNERS)}")
+if __name__ == "__main__":
+    run(load_articles())
@@ -1,5 +1,7 @@
 import json
 
+from data_io import save_json
+
 with open("signals/tomorrow_topics.json") as f:
     forecast = json.load(f)
 
@@ -27,7 +29,6 @@ for t in forecast:
         t["confidence"] = c
         approved.append(t)
 
-with open("signals/approved_topics.json","w") as f:
-    json.dump(approved, f, indent=2)
+save_json("signals/approved_topics.json", approved, indent=2)
 
 print(f"🧠 Topics approved by editor AI: {len(approved)}")
@@ -1,8 +1,10 @@
+import hashlib
 import json
-import re
-from collections import defaultdict
+from collections import Counter
 
-DATA_FILE = "data.json"
+from article_store import article_title, fingerprint
+from data_io import load_articles, load_json, save_articles, save_json
+from keyword_matcher import KeywordMatcher
 
 ENTITY_PATTERNS = {
     "Federal Reserve": ["federal reserve", "fed"],
@@ -11,31 +13,102 @@ ENTITY_PATTERNS = {
     "Government Policy": ["policy", "government", "law", "regulation"]
 }
 
-with open(DATA_FILE, encoding="utf-8") as f:
-    data = json.load(f)
+ENTITY_MATCHER = KeywordMatcher(ENTITY_PATTERNS)
 
-entity_scores = defaultdict(int)
+COUNTS_FILE = "signals/entity_authority.json"   # entity -> articles mentioning it (export)
+STATE_FILE = "signals/entity_index.json"        # the counts plus fp -> [text digest, entities]
 
-for article in data:
-    text = (article.get("title","") + " " + article.get("summary","")).lower()
+# A changed pattern table invalidates every stored match
+PATTERNS_HASH = hashlib.sha256(json.dumps(ENTITY_PATTERNS, sort_keys=True).encode("utf-8")).hexdigest()
 
-    for entity, keywords in ENTITY_PATTERNS.items():
-        if any(k in text for k in keywords):
-            entity_scores[entity] += 1
-            article.setdefault("ENTITIES", []).append(entity)
+def entity_text(article):
+    return article.get("title","") + " " + article.get("summary","")
 
-# normalize authority score
-for article in data:
-    score = 0
-    for e in article.get("ENTITIES", []):
-        score += entity_scores.get(e, 0)
+def text_digest(text):
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
 
-    article["ENTITY_AUTHORITY_SCORE"] = score
+# ================= INCREMENTAL COUNTS =================
+# Only articles that are new or whose title/summary changed are matched;
+# their old entities come out of the counts and the new ones go in.
+# Articles that left the archive are subtracted. ENTITIES is assigned,
+# never appended to, so a second run over the same data changes nothing.
+# Each article (by title fingerprint) counts once.
+def update_counts(data, counts, index):
+    seen = {}
+    scanned = 0
 
-with open("signals/entity_authority.json", "w") as f:
-    json.dump(entity_scores, f, indent=2)
+    for article in data:
+        fp = fingerprint(article_title(article))
+        if fp in seen:
+            if seen[fp]:
+                article["ENTITIES"] = list(seen[fp])
+            else:
+                article.pop("ENTITIES", None)
+            continue
 
-with open(DATA_FILE, "w", encoding="utf-8") as f:
-    json.dump(data, f, indent=2)
+        text = entity_text(article)
+        digest = text_digest(text)
+        entry = index.get(fp)
 
-print("🧠 Entity authority updated")
+        if entry is not None and entry[0] == digest:
+            entities = entry[1]
+        else:
+            entities = ENTITY_MATCHER.labels(text)
+            scanned += 1
+            if entry is not None:
+                counts.subtract(entry[1])
+            counts.update(entities)
+            index[fp] = [digest, entities]
+
+        seen[fp] = entities
+        if not entities:
+            article.pop("ENTITIES", None)
+        elif article.get("ENTITIES") != entities:
+            article["ENTITIES"] = list(entities)
+
+    removed = 0
+    for fp in list(index):
+        if fp not in seen:
+            counts.subtract(index.pop(fp)[1])
+            removed += 1
+
+    for entity in [e for e, n in counts.items() if n <= 0]:
+        del counts[entity]
+
+    return scanned, removed
+
+# ================= SCORES =================
+# One pass: an article's score is the sum of its entities' counts, looked
+# up per distinct entity combination (there are only a handful)
+def apply_scores(data, counts):
+    by_entities = {}
+    for article in data:
+        entities = tuple(article.get("ENTITIES") or ())
+        score = by_entities.get(entities)
+        if score is None:
+            score = by_entities[entities] = sum(counts.get(e, 0) for e in entities)
+        article["ENTITY_AUTHORITY_SCORE"] = score
+
+def run(data):
+    # Counts and index live in one file so they can never disagree
+    state = load_json(STATE_FILE, {})
+    if state.get("patterns") == PATTERNS_HASH:
+        counts = Counter(state.get("counts", {}))
+        index = state.get("articles", {})
+    else:
+        counts, index = Counter(), {}
+
+    scanned, removed = update_counts(data, counts, index)
+    apply_scores(data, counts)
+
+    if scanned or removed or state.get("patterns") != PATTERNS_HASH:
+        save_json(COUNTS_FILE, dict(counts), indent=2)
+        save_json(STATE_FILE, {"patterns": PATTERNS_HASH, "counts": dict(counts), "articles": index},
+                  ensure_ascii=False, separators=(",", ":"))
+
+    print(f"🧠 Entity authority updated: {scanned} scanned, {removed} removed, {len(data) - scanned} unchanged")
+
+if __name__ == "__main__":
+    data = load_articles()
+    run(data)
+    save_articles(data)
@@ -0,0 +1,136 @@
+import gzip
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import feedparser
+
+from data_io import save_json
+
+# ================= CONFIG =================
+CACHE_FILE = "signals/feed_cache.json"   # ETag / Last-Modified per feed URL
+
+MAX_WORKERS = 8             # feeds fetched at the same time
+PER_HOST_LIMIT = 2          # politeness cap per publisher host
+TIMEOUT_SECONDS = 15        # per feed, connect + read
+
+USER_AGENT = "PureStillBot/1.0 (+https://purestill.pages.dev)"
+
+# ================= VALIDATOR CACHE =================
+def load_cache(path=CACHE_FILE):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except Exception as e:
+        print("⚠️ Feed cache unreadable, refetching everything:", e)
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+# Callers only pass feeds whose entries they actually looked at: storing
+# validators for a feed skipped by a run cap would turn its unread entries
+# into 304s on the next run.
+def commit_validators(results, path=CACHE_FILE):
+    cache = load_cache(path)
+
+    for r in results:
+        if r["status"] != 200:
+            continue
+        validators = {k: r[k] for k in ("etag", "modified") if r.get(k)}
+        if validators:
+            cache[r["url"]] = validators
+        else:
+            cache.pop(r["url"], None)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    save_json(path, cache, indent=2, sort_keys=True)
+
+# ================= FETCH =================
+def _fetch_one(url, validators, host_slots, timeout):
+    result = {
+        "url": url,
+        "status": None,
+        "feed": None,
+        "etag": None,
+        "modified": None,
+        "latency_ms": 0,
+        "error": None
+    }
+
+    headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("modified"):
+        headers["If-Modified-Since"] = validators["modified"]
+
+    started = time.perf_counter()
+
+    with host_slots[urlparse(url).netloc]:
+        try:
+            req = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                body = resp.read()
+                if resp.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                result["status"] = resp.status
+                result["etag"] = resp.headers.get("ETag")
+                result["modified"] = resp.headers.get("Last-Modified")
+                response_headers = {
+                    "content-type": resp.headers.get("Content-Type", ""),
+                    "content-location": url
+                }
+        except urllib.error.HTTPError as e:
+            result["status"] = e.code
+            if e.code != 304:
+                result["error"] = f"HTTP {e.code}"
+        except Exception as e:
+            result["error"] = str(e) or e.__class__.__name__
+
+    result["latency_ms"] = int((time.perf_counter() - started) * 1000)
+
+    if result["status"] == 200:
+        result["feed"] = feedparser.parse(body, response_headers=response_headers)
+
+    return result
+
+# One result per URL, in the order given. status 304 → publisher reports no
+# change (feed is None); status None → request failed, see "error".
+def fetch_feeds(urls, cache_path=CACHE_FILE, timeout=TIMEOUT_SECONDS,
+                max_workers=MAX_WORKERS, per_host=PER_HOST_LIMIT):
+    cache = load_cache(cache_path)
+
+    host_slots = {}
+    for url in urls:
+        host_slots.setdefault(urlparse(url).netloc, threading.Semaphore(per_host))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_fetch_one, url, cache.get(url, {}), host_slots, timeout)
+            for url in urls
+        ]
+        return [f.result() for f in futures]
+
+def print_latency_report(results):
+    print("⏱ Feed latency:")
+    for r in sorted(results, key=lambda x: x["latency_ms"], reverse=True):
+        status = r["status"] if r["status"] is not None else "ERR"
+        note = f" ({r['error']})" if r["error"] else ""
+        print(f"   {r['latency_ms']:>6}ms  {status}  {r['url']}{note}")
+
+# ================= CLI =================
+# python feed_fetcher.py URL [URL ...]  → fetch once and report, e.g. against
+# a local http.server serving fixture feeds
+if __name__ == "__main__":
+    results = fetch_feeds(sys.argv[1:])
+    print_latency_report(results)
+    for r in results:
+        if r["feed"] is not None:
+            print(f"📥 {len(r['feed'].entries)} entries from {r['url']}")
+    commit_validators(results)
@@ -1,10 +1,14 @@
-import feedparser
-import json
 import os
 from datetime import datetime, timezone
 
+from article_fields import stamp_dates
+from article_index import ArticleIndex
+from article_store import ArticleStore
+from feed_fetcher import commit_validators, fetch_feeds, print_latency_report
+from keyword_matcher import KeywordMatcher
+from near_duplicates import NearDuplicateIndex
+
 # ================= CONFIG =================
-DATA_FILE = "data.json"
 FEEDS_FILE = "feeds.txt"
 
 MAX_ITEMS_PER_FEED = 3        # per feed per run
@@ -13,151 +17,183 @@ MAX_ITEMS_PER_RUN = 20        # hard daily safety cap
 NOW = datetime.now(timezone.utc)
 TODAY = NOW.strftime("%Y-%m-%d")
 
-# ================= LOAD EXISTING DATA =================
-if os.path.exists(DATA_FILE):
-    try:
-        with open(DATA_FILE, encoding="utf-8") as f:
-            data = json.load(f)
-        if not isinstance(data, list):
-            print("⚠️ data.json invalid, resetting")
-            data = []
-    except Exception as e:
-        print("⚠️ Failed to read data.json, resetting:", e)
-        data = []
-else:
-    data = []
-
-existing_links = {
-    item.get("source")
-    for item in data
-    if isinstance(item, dict)
-}
-
-existing_today = sum(
-    1 for item in data
-    if isinstance(item, dict)
-    and str(item.get("date", "")).startswith(TODAY)
-)
-
 # ================= LOAD FEEDS =================
-if not os.path.exists(FEEDS_FILE):
-    raise Exception("feeds.txt not found in repo root")
-
-feeds = []
-with open(FEEDS_FILE, encoding="utf-8") as f:
-    for line in f:
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-
-        parts = [p.strip() for p in line.split("|")]
-        url = parts[0]
-        weight = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 1
-        feeds.append((url, weight))
-
-# Higher weight = higher priority (Reuters / Gov first)
-feeds.sort(key=lambda x: x[1], reverse=True)
+def load_feeds():
+    if not os.path.exists(FEEDS_FILE):
+        raise Exception("feeds.txt not found in repo root")
+
+    feeds = []
+    with open(FEEDS_FILE, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            parts = [p.strip() for p in line.split("|")]
+            url = parts[0]
+            weight = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 1
+            feeds.append((url, weight))
+
+    # Higher weight = higher priority (Reuters / Gov first)
+    feeds.sort(key=lambda x: x[1], reverse=True)
+    return feeds
 
 # ================= CATEGORY DETECTION =================
-def detect_category(title: str) -> str:
-    t = title.lower()
-
-    if any(k in t for k in ["inflation", "jobs", "labor", "gdp", "economy", "growth"]):
-        return "Economy"
-    if any(k in t for k in ["market", "stocks", "shares", "bonds", "earnings"]):
-        return "Business"
-    if any(k in t for k in ["technology", "tech", "ai", "chip", "software"]):
-        return "Technology"
-    if any(k in t for k in ["policy", "regulation", "law", "government", "court"]):
-        return "Policy"
-
-    return "General"
-
-# ================= FETCH LOOP =================
-new_items_added = 0
-paused_feeds = []
-
-for feed_url, weight in feeds:
-    if new_items_added >= MAX_ITEMS_PER_RUN:
-        break
-
-    print(f"🔍 Fetching: {feed_url}")
-    feed = feedparser.parse(feed_url)
-
-    # ---- SAFETY CHECKS ----
-    if getattr(feed, "bozo", False):
-        paused_feeds.append(feed_url)
-        print("⚠️ Feed parse error, skipped")
-        continue
-
-    if not getattr(feed, "entries", []):
-        paused_feeds.append(feed_url)
-        print("⚠️ Empty feed, skipped")
-        continue
-    # -----------------------
+# Checked in order: the first category with a matching keyword wins
+CATEGORY_KEYWORDS = {
+    "Economy": ["inflation", "jobs", "labor", "gdp", "economy", "growth"],
+    "Business": ["market", "stocks", "shares", "bonds", "earnings"],
+    "Technology": ["technology", "tech", "ai", "chip", "software"],
+    "Policy": ["policy", "regulation", "law", "government", "court"]
+}
 
-    feed_count = 0
+CATEGORY_MATCHER = KeywordMatcher(CATEGORY_KEYWORDS)
 
-    for entry in feed.entries:
+def detect_category(title: str) -> str:
+    return CATEGORY_MATCHER.first(title, "General")
+
+# ================= INGEST =================
+def run(data):
+    feeds = load_feeds()
+
+    index = ArticleIndex.open(data)
+    near = NearDuplicateIndex.from_articles(data)
+
+    existing_today = sum(
+        1 for item in data
+        if isinstance(item, dict)
+        and str(item.get("date", "")).startswith(TODAY)
+    )
+
+    # ================= FETCH (PARALLEL, CONDITIONAL GET) =================
+    if existing_today >= MAX_ITEMS_PER_RUN:
+        print("⏸️ Daily cap already reached, not fetching")
+        results = []
+    else:
+        print(f"🔍 Fetching {len(feeds)} feeds")
+        results = fetch_feeds([url for url, _ in feeds])
+
+    # ================= INGEST LOOP =================
+    new_items_added = 0
+    paused_feeds = []
+    unchanged_feeds = 0
+    near_duplicates = 0
+    consumed = []
+
+    for (feed_url, weight), result in zip(feeds, results):
         if new_items_added >= MAX_ITEMS_PER_RUN:
             break
-        if feed_count >= MAX_ITEMS_PER_FEED:
-            break
-        if existing_today + new_items_added >= MAX_ITEMS_PER_RUN:
-            break
 
-        link = entry.get("link")
-        title = entry.get("title", "").strip()
+        # ---- SAFETY CHECKS ----
+        if result["status"] == 304:
+            unchanged_feeds += 1
+            continue
 
-        if not link or not title:
+        if result["feed"] is None:
+            paused_feeds.append(feed_url)
+            print(f"⚠️ Fetch failed, skipped: {feed_url} ({result['error']})")
             continue
-        if link in existing_links:
+
+        feed = result["feed"]
+
+        if getattr(feed, "bozo", False):
+            paused_feeds.append(feed_url)
+            print(f"⚠️ Feed parse error, skipped: {feed_url}")
             continue
 
-        # ✅ copyright-safe summary
-        summary = (
-            f"An independent analysis based on recent public information regarding "
-            f"{title}. This summary highlights context, implications, and relevance."
-        )
-
-        item = {
-            # 🔑 REQUIRED BY generate_pages.py
-            "TITLE": title,
-            "SUMMARY": summary,
-            "CONTENT": "",
-            "CATEGORY": detect_category(title),
-            "DATE": NOW.isoformat(),
-            "SOURCE": link,
-
-            # 🔴 LIVE CONTROL (CRITICAL)
-            "IS_BREAKING": True,                 # LIVE at ingest
-            "PUBLISH_GROUP": "breaking",
-
-            # 🧠 DISCOVER / OPTIMIZATION
-            "HEADLINE_VARIANTS": [],
-            "HEADLINE_ACTIVE": 0,
-            "DISCOVER_SIGNAL": 0,
-            "VISIBILITY": "normal",
-
-            # 🌍 COUNTRY (for RPM logic later)
-            "COUNTRY": "GLOBAL"
-        }
-
-        data.insert(0, item)
-        existing_links.add(link)
-        new_items_added += 1
-        feed_count += 1
-
-# ================= SAVE UPDATED DATA =================
-with open(DATA_FILE, "w", encoding="utf-8") as f:
-    json.dump(data, f, indent=2, ensure_ascii=False)
-
-# ================= REPORT =================
-print("✅ fetch_news.py finished")
-print(f"➕ New articles added: {new_items_added}")
-print(f"📅 Date (UTC): {TODAY}")
-
-if paused_feeds:
-    print("⏸️ Feeds paused this run:")
-    for f in paused_feeds:
-        print(f" - {f}")
+        if not getattr(feed, "entries", []):
+            paused_feeds.append(feed_url)
+            print(f"⚠️ Empty feed, skipped: {feed_url}")
+            continue
+        # -----------------------
+
+        feed_count = 0
+        capped = False
+
+        for entry in feed.entries:
+            if new_items_added >= MAX_ITEMS_PER_RUN:
+                capped = True
+                break
+            if feed_count >= MAX_ITEMS_PER_FEED:
+                # unread entries stay behind a 304 if we keep validators
+                capped = True
+                break
+            if existing_today + new_items_added >= MAX_ITEMS_PER_RUN:
+                capped = True
+                break
+
+            link = entry.get("link")
+            title = entry.get("title", "").strip()
+
+            if not link or not title:
+                continue
+            # already ingested: same link, or same story under another link
+            if index.has_source(link) or index.has_title(title):
+                continue
+            # same story reworded by another wire in the last few days
+            if near.find(title):
+                near_duplicates += 1
+                continue
+
+            # ✅ copyright-safe summary
+            summary = (
+                f"An independent analysis based on recent public information regarding "
+                f"{title}. This summary highlights context, implications, and relevance."
+            )
+
+            item = {
+                # 🔑 REQUIRED BY generate_pages.py
+                "TITLE": title,
+                "SUMMARY": summary,
+                "CONTENT": "",
+                "CATEGORY": detect_category(title),
+                "DATE": NOW.isoformat(),
+                "SOURCE": link,
+
+                # 🔴 LIVE CONTROL (CRITICAL)
+                "IS_BREAKING": True,                 # LIVE at ingest
+                "PUBLISH_GROUP": "breaking",
+
+                # 🧠 DISCOVER / OPTIMIZATION
+                "HEADLINE_VARIANTS": [],
+                "HEADLINE_ACTIVE": 0,
+                "DISCOVER_SIGNAL": 0,
+                "VISIBILITY": "normal",
+
+                # 🌍 COUNTRY (for RPM logic later)
+                "COUNTRY": "GLOBAL"
+            }
+
+            stamp_dates(item)
+            data.insert(0, item)
+            near.add(index.add(item), title)
+            new_items_added += 1
+            feed_count += 1
+
+        # Only remember validators for feeds the run caps did not cut short
+        if not capped:
+            consumed.append(result)
+
+    commit_validators(consumed)
+    index.save()
+
+    # ================= REPORT =================
+    print("✅ fetch_news.py finished")
+    print(f"➕ New articles added: {new_items_added}")
+    print(f"🔁 Near-duplicate headlines skipped: {near_duplicates}")
+    print(f"📅 Date (UTC): {TODAY}")
+    print(f"💤 Feeds unchanged since last run: {unchanged_feeds}")
+    print_latency_report(results)
+
+    if paused_feeds:
+        print("⏸️ Feeds paused this run:")
+        for f in paused_feeds:
+            print(f" - {f}")
+
+# ================= STANDALONE =================
+if __name__ == "__main__":
+    store = ArticleStore()
+    data = store.articles()
+    run(data)
+    store.sync(data)
+    store.export()
@@ -1,49 +1,36 @@
-print("Starting PureStill generator…")
-
-import json, os, re
+import argparse, hashlib, html, json, os, time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone, timedelta
 
+from article_fields import article_epoch, hours_old, safe, slugify
+from data_io import load_articles, save_json
+from ranking import select_sections
+from related_articles import find_related
+from scoring import ScoreColumns, load_trust_score
+from template_engine import Template
+
 # ================= CONFIG =================
 BASE_URL = "https://purestill.pages.dev"
 SITE_DIR = "site"
 ARTICLES_DIR = os.path.join(SITE_DIR, "articles")
 SIGNALS_DIR = "signals"
+MANIFEST_FILE = os.path.join(SIGNALS_DIR, "build_manifest.json")
 
 # 🔴 LIVE rules
 LIVE_DEMOTION_HOURS = 2      # auto-demote LIVE after 2h
 LIVE_MAX_DISPLAY = 20
 
-# 🌍 Country RPM priority
-COUNTRY_RPM = {
-    "US": 100,
-    "UK": 95,
-    "CA": 90,
-    "AU": 85,
-    "GLOBAL": 70
-}
-
-os.makedirs(ARTICLES_DIR, exist_ok=True)
-
-# ================= LOAD DATA =================
-with open("data.json", encoding="utf-8") as f:
-    raw_data = json.load(f)
-
-if not isinstance(raw_data, list):
-    raise Exception("data.json must be a list")
-
-# ================= LOAD LIVE FEED =================
-live_feed = []
-live_file = os.path.join(SIGNALS_DIR, "live_feed.json")
-if os.path.exists(live_file):
-    with open(live_file, encoding="utf-8") as f:
-        live_feed = json.load(f)
-
-# ================= LOAD TRUST / CTR SIGNALS =================
-trust_score = 100
-trust_path = os.path.join(SIGNALS_DIR, "trust_score.json")
-if os.path.exists(trust_path):
-    with open(trust_path) as f:
-        trust_score = json.load(f).get("trust_score", 100)
+# 🏠 Homepage sections, filled in order (see ranking.py)
+HOMEPAGE_SECTIONS = [
+    {"name": "live", "key": "age_hours", "descending": False, "limit": LIVE_MAX_DISPLAY,
+     "where": lambda a: a["is_live"], "claims_all": True},
+    {"name": "trending", "key": "final_score", "limit": 6},
+    {"name": "top", "key": "final_score", "limit": 6},
+    {"name": "recent", "key": "date", "limit": 6},
+    {"name": "older", "key": None, "limit": 6},
+    {"name": "featured", "key": "final_score", "limit": 1,
+     "where": lambda a: not a["is_live"], "exclusive": False},
+]
 
 # ================= LOAD TEMPLATES =================
 with open("article_template.html", encoding="utf-8") as f:
@@ -52,52 +39,81 @@ with open("article_template.html", encoding="utf-8") as f:
 with open("index_template.html", encoding="utf-8") as f:
     INDEX_TEMPLATE = f.read()
 
+# Slots that carry markup; every other slot is HTML-escaped
+ARTICLE_RAW_SLOTS = ("CONTENT", "RELATED_LINKS", "AD_MID", "AD_BOTTOM")
+INDEX_RAW_SLOTS = (
+    "LIVE_BREAKING", "TRENDING_ARTICLES", "TOP_ARTICLES",
+    "FEATURED_ARTICLE", "RECENT_ARTICLES", "OLDER_ARTICLES"
+)
+
+ARTICLE_PAGE = Template(ARTICLE_TEMPLATE, "article_template.html", raw=ARTICLE_RAW_SLOTS)
+INDEX_PAGE = Template(INDEX_TEMPLATE, "index_template.html", raw=INDEX_RAW_SLOTS)
+
+# Escaping rules are part of the output, so they count as template changes
+TEMPLATE_HASH = hashlib.sha256(
+    (ARTICLE_TEMPLATE + "\0" + ",".join(ARTICLE_RAW_SLOTS)).encode("utf-8")
+).hexdigest()
+
 NOW = datetime.now(timezone.utc)
 
 # ================= HELPERS =================
-def slugify(text):
-    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
-
-def safe(item, *keys, default=""):
-    for k in keys:
-        if k in item and str(item[k]).strip():
-            return str(item[k])
-    return default
-
-def hours_old(date_str):
-    try:
-        dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-    except Exception:
-        return 999
-    if not dt.tzinfo:
-        dt = dt.replace(tzinfo=timezone.utc)
-    return (NOW - dt).total_seconds() / 3600
-
-# ================= SCORING =================
-CATEGORY_WEIGHT = {
-    "Business": 95,
-    "Economy": 90,
-    "Technology": 88,
-    "AI": 90,
-    "Policy": 85,
-    "Politics": 80,
-    "Sports": 60,
-    "General": 70
-}
-
-def final_score(article):
-    freshness = max(0, 100 - article["age_hours"] * 6)
-    category_score = CATEGORY_WEIGHT.get(article["category"], 70)
-    rpm = COUNTRY_RPM.get(article["country"], 70)
-    trust_boost = trust_score / 10
-    return round(
-        freshness * 0.35 +
-        category_score * 0.30 +
-        rpm * 0.25 +
-        trust_boost,
-        2
+def page_hash(fields):
+    payload = json.dumps(fields, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+# (slug, title, summary) of each related article → link-item blocks
+def render_related(related):
+    return "".join(
+        f'<div class="link-item"><a href="/articles/{slug}.html">{html.escape(title)}</a>'
+        f'<span>{html.escape(summary)}</span></div>'
+        for slug, title, summary in related
     )
 
+def render_article_page(page):
+    return ARTICLE_PAGE.render({
+        "TITLE": page["title"],
+        "SUMMARY": page["summary"],
+        "CONTENT": page["content"],
+        "CATEGORY": page["category"],
+        "SOURCE": page["source"],
+        "DATE": page["date"],
+        "CANONICAL_URL": page["canonical"],
+        "RELATED_LINKS": render_related(page.get("related", [])),
+        "AD_MID": "",
+        "AD_BOTTOM": ""
+    })
+
+def write_page(path, html, force=False):
+    data = html.encode("utf-8")
+    if not force and os.path.exists(path):
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+# Renders and writes one shard of pages. The serial build is a single shard
+# run in-process, so --workers output is byte-identical by construction.
+def write_shard(shard, full):
+    started = time.perf_counter()
+    written = unchanged = 0
+
+    for slug, page in shard:
+        path = os.path.join(ARTICLES_DIR, f"{slug}.html")
+        if write_page(path, render_article_page(page), force=full):
+            written += 1
+        else:
+            unchanged += 1
+
+    return {
+        "pid": os.getpid(),
+        "pages": len(shard),
+        "written": written,
+        "unchanged": unchanged,
+        "seconds": time.perf_counter() - started
+    }
+
 # ================= AUTO CONTENT =================
 def auto_expand_article(title, summary, category):
     return f"""
@@ -115,63 +131,146 @@ def auto_expand_article(title, summary, category):
 """
 
 # ================= ARTICLE BUILD =================
-articles = []
-
-for item in raw_data:
-    title = safe(item, "TITLE", "title")
-    if not title:
-        continue
-
-    summary = safe(item, "SUMMARY", "summary")
-    content_raw = safe(item, "CONTENT", "content")
-    category = safe(item, "CATEGORY", "category", default="General")
-    source = safe(item, "SOURCE", "source")
-    date = safe(item, "DATE", "date", default=NOW.isoformat())
-    country = safe(item, "COUNTRY", default="GLOBAL")
-
-    age = hours_old(date)
-
-    # 🔴 LIVE demotion logic
-    is_live = item.get("IS_BREAKING", False) is True and age <= LIVE_DEMOTION_HOURS
-
-    content = content_raw.strip() if content_raw else auto_expand_article(
-        title, summary, category
-    )
-
-    slug = slugify(title)
-    canonical = f"{BASE_URL}/articles/{slug}.html"
-
-    article = {
-        "title": title,
-        "summary": summary,
-        "category": category,
-        "date": date,
-        "slug": slug,
-        "age_hours": age,
-        "is_live": is_live,
-        "country": country
-    }
-
-    article["final_score"] = final_score(article)
-
-    html = ARTICLE_TEMPLATE
-    html = html.replace("{{TITLE}}", title)
-    html = html.replace("{{SUMMARY}}", summary)
-    html = html.replace("{{CONTENT}}", content)
-    html = html.replace("{{CATEGORY}}", category)
-    html = html.replace("{{SOURCE}}", source)
-    html = html.replace("{{DATE}}", date)
-    html = html.replace("{{CANONICAL_URL}}", canonical)
-    html = html.replace("{{RELATED_LINKS}}", "")
-    html = html.replace("{{AD_MID}}", "")
-    html = html.replace("{{AD_BOTTOM}}", "")
-
-    with open(os.path.join(ARTICLES_DIR, f"{slug}.html"), "w", encoding="utf-8") as f:
-        f.write(html)
-
-    articles.append(article)
-
-print(f"Generated {len(articles)} articles")
+def build_articles(data, trust_score):
+    articles = []
+    pages = {}
+    records = {}
+
+    for item in data:
+        title = safe(item, "TITLE", "title")
+        if not title:
+            continue
+
+        summary = safe(item, "SUMMARY", "summary")
+        content_raw = safe(item, "CONTENT", "content")
+        category = safe(item, "CATEGORY", "category", default="General")
+        source = safe(item, "SOURCE", "source")
+        date = safe(item, "DATE", "date", default=NOW.isoformat())
+        country = safe(item, "COUNTRY", default="GLOBAL")
+
+        ts = article_epoch(item)
+        age = (NOW.timestamp() - ts) / 3600 if ts is not None else hours_old(date, NOW)
+
+        # 🔴 LIVE demotion logic
+        is_live = item.get("IS_BREAKING", False) is True and age <= LIVE_DEMOTION_HOURS
+
+        content = content_raw.strip() if content_raw else auto_expand_article(
+            title, summary, category
+        )
+
+        slug = slugify(title)
+        canonical = f"{BASE_URL}/articles/{slug}.html"
+
+        article = {
+            "title": title,
+            "summary": summary,
+            "category": category,
+            "date": date,
+            "slug": slug,
+            "age_hours": age,
+            "is_live": is_live,
+            "country": country
+        }
+
+        # Same slug twice → the later record owns the page (as before)
+        pages[slug] = {
+            "title": title,
+            "summary": summary,
+            "content": content,
+            "category": category,
+            "source": source,
+            "date": date,
+            "canonical": canonical
+        }
+        records[slug] = item
+
+        articles.append(article)
+
+    # ---- RELATED LINKS ----
+    # Part of the page fields, so a changed related set (or a related
+    # article's new title) is a changed page hash in the manifest
+    related = find_related(records)
+    for slug, page in pages.items():
+        page["related"] = [
+            [r, pages[r]["title"], pages[r]["summary"]] for r in related[slug]
+        ]
+
+    # ---- SCORING (one batch over the whole set) ----
+    scores = ScoreColumns.from_articles(articles, trust_score).final()
+    for article, score in zip(articles, scores):
+        article["final_score"] = score
+
+    return articles, pages
+
+# ================= WRITE ARTICLE PAGES =================
+def load_manifest():
+    # slug -> hash of the fields the article page is rendered from
+    manifest = {"template": None, "articles": {}}
+    if os.path.exists(MANIFEST_FILE):
+        try:
+            with open(MANIFEST_FILE, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except Exception as e:
+            print("⚠️ Build manifest unreadable, rebuilding all pages:", e)
+    return manifest
+
+def write_article_pages(pages, full=False, workers=1):
+    os.makedirs(ARTICLES_DIR, exist_ok=True)
+
+    manifest = load_manifest()
+    template_changed = manifest.get("template") != TEMPLATE_HASH
+    previous_pages = manifest.get("articles", {})
+
+    skipped = removed = 0
+    built_pages = {}
+    todo = []
+
+    for slug, page in pages.items():
+        digest = page_hash(page)
+        built_pages[slug] = digest
+        path = os.path.join(ARTICLES_DIR, f"{slug}.html")
+
+        if (
+            not full
+            and not template_changed
+            and previous_pages.get(slug) == digest
+            and os.path.exists(path)
+        ):
+            skipped += 1
+            continue
+
+        todo.append((slug, page))
+
+    # ---- RENDER + WRITE (serial or sharded across a process pool) ----
+    workers = max(1, min(workers, len(todo)))
+    if workers > 1:
+        shards = [todo[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            stats = list(pool.map(write_shard, shards, [full] * workers))
+    else:
+        stats = [write_shard(todo, full)]
+
+    written = sum(s["written"] for s in stats)
+    unchanged = sum(s["unchanged"] for s in stats)
+
+    # 🧹 Remove pages we generated previously whose article is gone
+    for slug in previous_pages:
+        if slug in built_pages:
+            continue
+        path = os.path.join(ARTICLES_DIR, f"{slug}.html")
+        if os.path.exists(path):
+            os.remove(path)
+            removed += 1
+
+    save_json(MANIFEST_FILE, {"template": TEMPLATE_HASH, "articles": built_pages}, indent=2, sort_keys=True)
+
+    print(f"📄 Pages written: {written} | unchanged: {unchanged} | skipped: {skipped} | removed: {removed}")
+    if len(stats) > 1:
+        for i, st in enumerate(stats, 1):
+            print(
+                f"   worker {i} (pid {st['pid']}): {st['pages']} pages, "
+                f"{st['written']} written, {st['unchanged']} unchanged in {st['seconds']:.2f}s"
+            )
 
 # ================= RENDER HELPERS =================
 def render_card(a):
@@ -196,54 +295,54 @@ def render_live(item):
     </div>
     """
 
-# ================= HOMEPAGE LOGIC =================
-used = set()
+# ================= HOMEPAGE =================
+def build_homepage(articles):
+    sections = select_sections(articles, HOMEPAGE_SECTIONS)
 
-# 🔴 LIVE BREAKING (EXPLICIT + AUTO-DEMOTED)
-live_articles = [a for a in articles if a["is_live"]]
-live_articles.sort(key=lambda x: x["age_hours"])
+    # 🔴 LIVE BREAKING (EXPLICIT + AUTO-DEMOTED)
+    live_html = "".join(render_live(a) for a in sections["live"]) \
+        if sections["live"] else "<div class='live-empty'>No breaking developments.</div>"
 
-live_html = "".join(render_live(a) for a in live_articles[:LIVE_MAX_DISPLAY]) \
-    if live_articles else "<div class='live-empty'>No breaking developments.</div>"
+    featured = sections["featured"][0] if sections["featured"] else None
 
-used.update(a["slug"] for a in live_articles)
+    # ---- RENDER INDEX ----
+    # index_template.html may carry slots the homepage does not fill yet;
+    # those are left as-is (strict=False), as the old replace chain did
+    index_html = INDEX_PAGE.render({
+        "LIVE_BREAKING": live_html,
+        "TRENDING_ARTICLES": "".join(render_card(a) for a in sections["trending"]),
+        "TOP_ARTICLES": "".join(render_card(a) for a in sections["top"]),
+        "FEATURED_ARTICLE": render_card(featured) if featured else "",
+        "RECENT_ARTICLES": "".join(render_card(a) for a in sections["recent"]),
+        "OLDER_ARTICLES": "".join(render_card(a) for a in sections["older"])
+    }, strict=False)
 
-# 🔵 TRENDING NOW
-remaining = [a for a in articles if a["slug"] not in used]
-trending = sorted(remaining, key=lambda x: x["final_score"], reverse=True)[:6]
-used.update(a["slug"] for a in trending)
+    with open(os.path.join(SITE_DIR, "index.html"), "w", encoding="utf-8") as f:
+        f.write(index_html)
 
-# 🟢 TOP STORIES (RPM weighted)
-remaining = [a for a in remaining if a["slug"] not in used]
-top = sorted(remaining, key=lambda x: x["final_score"], reverse=True)[:6]
-used.update(a["slug"] for a in top)
+    print("Index generated")
 
-# 🟣 RECENT
-remaining = [a for a in remaining if a["slug"] not in used]
-recent = sorted(remaining, key=lambda x: x["date"], reverse=True)[:6]
-used.update(a["slug"] for a in recent)
+# ================= RUN =================
+def run(data, full=False, workers=1):
+    print("Starting PureStill generator…")
 
-# ⚪ OLDER
-older = [a for a in articles if a["slug"] not in used][:6]
+    # ---- TRUST / CTR SIGNALS ----
+    trust_score = load_trust_score(os.path.join(SIGNALS_DIR, "trust_score.json"))
 
-# ⭐ FEATURED (non-live only)
-featured_candidates = [a for a in articles if not a["is_live"]]
-featured = max(featured_candidates, key=lambda x: x["final_score"]) if featured_candidates else None
+    articles, pages = build_articles(data, trust_score)
+    print(f"Generated {len(articles)} articles")
 
-# ================= RENDER INDEX =================
-index_html = INDEX_TEMPLATE
-index_html = index_html.replace("{{LIVE_BREAKING}}", live_html)
-index_html = index_html.replace("{{TRENDING_ARTICLES}}", "".join(render_card(a) for a in trending))
-index_html = index_html.replace("{{TOP_ARTICLES}}", "".join(render_card(a) for a in top))
-index_html = index_html.replace(
-    "{{FEATURED_ARTICLE}}",
-    render_card(featured) if featured else ""
-)
-index_html = index_html.replace("{{RECENT_ARTICLES}}", "".join(render_card(a) for a in recent))
-index_html = index_html.replace("{{OLDER_ARTICLES}}", "".join(render_card(a) for a in older))
+    write_article_pages(pages, full, workers)
+    build_homepage(articles)
+
+    print("PureStill build complete ✅")
 
-with open(os.path.join(SITE_DIR, "index.html"), "w", encoding="utf-8") as f:
-    f.write(index_html)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the PureStill static site")
+    parser.add_argument("--full", action="store_true",
+                        help="ignore the build manifest and rewrite every article page")
+    parser.add_argument("--workers", type=int, default=1, metavar="N",
+                        help="render and write article pages across N processes")
+    args = parser.parse_args()
 
-print("Index generated")
-print("PureStill build complete ✅")
+    run(load_articles(), full=args.full, workers=args.workers)
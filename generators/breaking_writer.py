@@ -1,4 +1,10 @@
-import json, datetime
+import json, datetime, os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from article_fields import stamp_dates
+from article_index import ArticleIndex
+from data_io import save_json
 
 DATA = "data.json"
 SIGNALS = "signals/breaking_signals.json"
@@ -10,21 +16,25 @@ with open(SIGNALS) as f:
     signals = json.load(f)
 
 now = datetime.datetime.utcnow().isoformat()
+index = ArticleIndex.open(articles)
 
 for s in signals:
-    if any(a["title"] == s["title"] for a in articles):
+    if index.has_title(s["title"]):
         continue
 
-    articles.append({
+    article = {
         "title": s["title"],
         "summary": "Independent analysis of a developing global event.",
         "content": "",
         "category": "General",
         "date": now,
         "source": s["source"]
-    })
+    }
+    stamp_dates(article)
+    articles.append(article)
+    index.add(article)
 
-with open(DATA, "w", encoding="utf-8") as f:
-    json.dump(articles, f, indent=2)
+save_json(DATA, articles, backup=True, indent=2)
+index.save()
 
 print("Breaking articles written")
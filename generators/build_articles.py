@@ -1,11 +1,15 @@
-import json, os
+import json, os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from template_engine import load_template
 
 TEMPLATE = "site/articles/_article_template.html"
 OUTPUT_DIR = "site/articles"
 DATA = "signals/articles_data.json"   # your article content
 
-with open(TEMPLATE, encoding="utf-8") as f:
-    template = f.read()
+# Values are inserted verbatim (escape=False), as before
+template = load_template(TEMPLATE, escape=False)
 
 with open(DATA, encoding="utf-8") as f:
     articles = json.load(f)
@@ -13,9 +17,7 @@ with open(DATA, encoding="utf-8") as f:
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 for a in articles:
-    html = template
-    for k, v in a.items():
-        html = html.replace(f"{{{{{k}}}}}", v)
+    html = template.render(a, strict=False)
 
     out = os.path.join(OUTPUT_DIR, f"{a['slug']}.html")
     with open(out, "w", encoding="utf-8") as f:
@@ -1,4 +1,8 @@
-import json, datetime, os
+import datetime, os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_io import save_json
 
 FILE = "signals/breaking_signals.json"
 os.makedirs("signals", exist_ok=True)
@@ -14,7 +18,6 @@ signals = [
   }
 ]
 
-with open(FILE, "w", encoding="utf-8") as f:
-    json.dump(signals, f, indent=2)
+save_json(FILE, signals, indent=2)
 
 print("Breaking signals updated")
@@ -1,4 +1,8 @@
-import json, os
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_io import save_json
 
 FILE = "signals/hourly_trends.json"
 os.makedirs("signals", exist_ok=True)
@@ -18,7 +22,6 @@ trends = [
   }
 ]
 
-with open(FILE, "w", encoding="utf-8") as f:
-    json.dump(trends, f, indent=2)
+save_json(FILE, trends, indent=2)
 
 print("Hourly trends updated")
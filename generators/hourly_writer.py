@@ -1,4 +1,10 @@
-import json, datetime
+import json, datetime, os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from article_fields import stamp_dates
+from article_index import ArticleIndex
+from data_io import save_json
 
 DATA = "data.json"
 TRENDS = "signals/hourly_trends.json"
@@ -10,21 +16,25 @@ with open(TRENDS) as f:
     trends = json.load(f)
 
 now = datetime.datetime.utcnow().isoformat()
+index = ArticleIndex.open(articles)
 
 for t in trends:
-    if any(a["title"] == t["topic"] for a in articles):
+    if index.has_title(t["topic"]):
         continue
 
-    articles.append({
+    article = {
         "title": t["topic"],
         "summary": f"Independent analysis of {t['topic'].lower()}.",
         "content": "",
         "category": t["category"],
         "date": now,
         "source": "Public information"
-    })
+    }
+    stamp_dates(article)
+    articles.append(article)
+    index.add(article)
 
-with open(DATA, "w", encoding="utf-8") as f:
-    json.dump(articles, f, indent=2)
+save_json(DATA, articles, backup=True, indent=2)
+index.save()
 
 print("Hourly articles written")
@@ -1,29 +1,120 @@
-import json
-from datetime import datetime
-import xml.etree.ElementTree as ET
+import io
+import os
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import XMLGenerator
 
+from article_fields import article_epoch, article_slug, safe
+from data_io import load_articles, write_if_changed
+
+# ================= CONFIG =================
 BASE_URL = "https://purestill.pages.dev"
+SITE_DIR = "site"
+
+MAX_ITEMS = 100             # per feed
+
+# One pass over the articles fills every feed. categories=None takes any
+# category; breaking=True also takes live items whatever their category.
+FEEDS = [
+    {"file": "google-news.xml", "title": "PureStill News",
+     "description": "Independent global news and analysis",
+     "categories": ["Business", "Technology", "Policy"], "breaking": True},
+    {"file": "feeds/economy.xml", "title": "PureStill Economy",
+     "description": "Economy news and analysis", "categories": ["Economy"]},
+    {"file": "feeds/business.xml", "title": "PureStill Business",
+     "description": "Business and markets news and analysis", "categories": ["Business"]},
+    {"file": "feeds/technology.xml", "title": "PureStill Technology",
+     "description": "Technology news and analysis", "categories": ["Technology"]},
+    {"file": "feeds/policy.xml", "title": "PureStill Policy",
+     "description": "Policy news and analysis", "categories": ["Policy"]},
+]
+
+# ================= HELPERS =================
+# RSS wants RFC 822 dates ("Wed, 21 Jan 2026 23:50:45 GMT"), not ISO
+def rfc822_date(ts):
+    if ts is None:
+        return None
+    return format_datetime(datetime.fromtimestamp(ts, timezone.utc), usegmt=True)
+
+def is_breaking(item):
+    return item.get("IS_BREAKING") is True or item.get("is_breaking") is True
+
+# ================= RSS WRITER =================
+# Items are written one at a time as they are selected; nothing holds an
+# element tree of the feed
+class RSSWriter:
+    def __init__(self, feed):
+        self.out = io.StringIO()
+        self.xml = XMLGenerator(self.out, encoding="utf-8", short_empty_elements=True)
+        self.count = 0
+
+        self.xml.startDocument()
+        self.xml.startElement("rss", {"version": "2.0"})
+        self.xml.startElement("channel", {})
+        self.element("title", feed["title"])
+        self.element("link", BASE_URL)
+        self.element("description", feed["description"])
+
+    def element(self, name, text, attrs=None):
+        self.xml.startElement(name, attrs or {})
+        self.xml.characters(text)
+        self.xml.endElement(name)
+
+    def item(self, title, slug, pub_date):
+        self.xml.startElement("item", {})
+        self.element("title", title)
+        self.element("link", f"{BASE_URL}/articles/{slug}.html")
+        if pub_date:
+            self.element("pubDate", pub_date)
+        self.element("guid", slug, {"isPermaLink": "false"})
+        self.xml.endElement("item")
+        self.count += 1
+
+    def close(self):
+        self.xml.endElement("channel")
+        self.xml.endElement("rss")
+        self.xml.endDocument()
+        return self.out.getvalue() + "\n"
+
+# ================= BUILD =================
+def run(data, site_dir=SITE_DIR):
+    writers = [RSSWriter(feed) for feed in FEEDS]
+    wanted = []             # (categories or None, breaking, writer)
+    for feed, writer in zip(FEEDS, writers):
+        categories = set(feed["categories"]) if feed.get("categories") else None
+        wanted.append((categories, feed.get("breaking", False), writer))
 
-with open("data.json") as f:
-    data = json.load(f)
+    open_feeds = len(writers)
+    for a in data:
+        if not open_feeds:
+            break
 
-news = [a for a in data if a.get("is_breaking") or a.get("category") in ["Business","Technology","Policy"]]
+        title = safe(a, "TITLE", "title")
+        if not title:
+            continue
+        category = safe(a, "CATEGORY", "category")
+        breaking = is_breaking(a)
+        item = None
 
-rss = ET.Element("rss", version="2.0")
-channel = ET.SubElement(rss,"channel")
+        for categories, take_breaking, writer in wanted:
+            if writer.count >= MAX_ITEMS:
+                continue
+            if not (categories is None or category in categories or (take_breaking and breaking)):
+                continue
 
-ET.SubElement(channel,"title").text = "PureStill News"
-ET.SubElement(channel,"link").text = BASE_URL
-ET.SubElement(channel,"description").text = "Independent global news and analysis"
+            # fields are formatted once, for the first feed taking the article
+            if item is None:
+                item = (title, article_slug(a), rfc822_date(article_epoch(a)))
+            writer.item(*item)
+            if writer.count == MAX_ITEMS:
+                open_feeds -= 1
 
-for a in news[:100]:
-    item = ET.SubElement(channel,"item")
-    ET.SubElement(item,"title").text = a["title"]
-    ET.SubElement(item,"link").text = f"{BASE_URL}/articles/{a['slug']}.html"
-    ET.SubElement(item,"pubDate").text = a["date"]
-    ET.SubElement(item,"guid").text = a["slug"]
+    written = 0
+    for feed, writer in zip(FEEDS, writers):
+        if write_if_changed(os.path.join(site_dir, feed["file"]), writer.close()):
+            written += 1
 
-tree = ET.ElementTree(rss)
-tree.write("site/google-news.xml", encoding="utf-8", xml_declaration=True)
+    print(f"📰 Google News feeds: {len(FEEDS)} ({written} rewritten, {len(FEEDS) - written} unchanged)")
 
-print("📰 Google News feed generated")
+if __name__ == "__main__":
+    run(load_articles())
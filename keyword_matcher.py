@@ -0,0 +1,75 @@
+import re
+
+WORD = re.compile(r"[a-z0-9]+")
+
+# ================= KEYWORD MATCHER =================
+# Built once per keyword table ({label: [keywords]}), replacing
+# "any(k in text for k in keys)" loops. Text is split into words once and
+# every keyword is found in that single pass with set lookups, so the cost
+# no longer grows with the number of keywords.
+#
+# Matching is by whole word, which stops "ai" hitting "said" and "fed"
+# hitting "feed"; a trailing plural "s" is still accepted ("market"
+# matches "markets"). Multi-word keywords ("wall street") match the same
+# words in sequence.
+#
+# On today's 5-20 keyword tables this costs more per text than the loops
+# did (the word split dominates, benchmarks/bench_keywords.py); the
+# whole-word matches are what it is for there.
+class KeywordMatcher:
+    def __init__(self, table, plurals=True):
+        self.plurals = plurals
+        self.rank = {label: i for i, label in enumerate(table)}
+        self.keyword_labels = {}
+
+        for label, keywords in table.items():
+            for kw in keywords:
+                kw = " ".join(WORD.findall(kw.lower()))
+                labels = self.keyword_labels.setdefault(kw, [])
+                if label not in labels:
+                    labels.append(label)
+
+        # every accepted spelling of a one-word keyword -> the keyword
+        self.forms = {}
+        for kw in self.keyword_labels:
+            if " " not in kw:
+                self.forms[kw] = kw
+                if plurals:
+                    self.forms.setdefault(kw + "s", kw)
+
+        # first word -> phrases starting with it
+        self.phrases = {}
+        for kw in self.keyword_labels:
+            if " " in kw:
+                self.phrases.setdefault(kw.split(" ", 1)[0], []).append(kw)
+
+    # Keywords present in text (normalised keyword strings)
+    def keywords(self, text):
+        words = WORD.findall(text.lower())
+        found = {self.forms[w] for w in self.forms.keys() & words}
+
+        if self.phrases:
+            starts = self.phrases.keys() & words
+            if starts:
+                joined = " " + " ".join(words) + " "
+                for first in starts:
+                    for phrase in self.phrases[first]:
+                        if f" {phrase} " in joined or (self.plurals and f" {phrase}s " in joined):
+                            found.add(phrase)
+
+        return found
+
+    # All matched labels, in table order
+    def labels(self, text):
+        found = set()
+        for kw in self.keywords(text):
+            found.update(self.keyword_labels[kw])
+        return sorted(found, key=self.rank.__getitem__)
+
+    # First label in table order (tables are written in priority order)
+    def first(self, text, default=None):
+        labels = self.labels(text)
+        return labels[0] if labels else default
+
+    def search(self, text):
+        return bool(self.keywords(text))
@@ -1,6 +1,12 @@
 import json, os, hashlib
 from datetime import datetime, timezone, timedelta
-import feedparser
+
+from feed_fetcher import commit_validators, fetch_feeds, print_latency_report
+from keyword_matcher import KeywordMatcher
+from near_duplicates import NearDuplicateIndex
+from seen_cache import SeenCache
+
+from data_io import save_json
 
 # ================= CONFIG =================
 
@@ -9,6 +15,7 @@ SEEN_FILE = "signals/live_seen.json"
 TOPICS_FILE = "signals/topics_feed.json"
 
 LIVE_TTL_HOURS = 2          # live expires after 2 hours
+SEEN_RETENTION_HOURS = 168  # dedupe memory for published uids
 MAX_PER_RUN = 10            # safety cap per run
 
 # 🔝 Tier-1 sources (high RPM)
@@ -29,18 +36,15 @@ TOPIC_KEYWORDS = {
 
 BREAKING_KEYWORDS = ["breaking", "crisis", "surge", "record", "emergency"]
 
-now = datetime.now(timezone.utc)
+TOPIC_MATCHER = KeywordMatcher(TOPIC_KEYWORDS)
+BREAKING_MATCHER = KeywordMatcher({"breaking": BREAKING_KEYWORDS})
 
-os.makedirs("signals", exist_ok=True)
+now = datetime.now(timezone.utc)
 
 # ================= HELPERS =================
 
 def detect_topic(title: str) -> str:
-    t = title.lower()
-    for topic, keys in TOPIC_KEYWORDS.items():
-        if any(k in t for k in keys):
-            return topic
-    return "World"
+    return TOPIC_MATCHER.first(title, "World")
 
 def score_item(minutes_ago: int, title: str, tier_weight: int) -> int:
     score = tier_weight * 20
@@ -52,104 +56,134 @@ def score_item(minutes_ago: int, title: str, tier_weight: int) -> int:
     elif minutes_ago <= 180:
         score += 10
 
-    if any(k in title.lower() for k in BREAKING_KEYWORDS):
+    if BREAKING_MATCHER.search(title):
         score += 15
 
     return score
 
-# ================= LOAD STATE =================
+# ================= RUN =================
 
-live_items = []
-seen = set()
+# data is unused: the live desk only reads feeds and writes signals/
+def run(data=None):
+    os.makedirs("signals", exist_ok=True)
 
-if os.path.exists(LIVE_FILE):
-    with open(LIVE_FILE, encoding="utf-8") as f:
-        live_items = json.load(f)
+    # ================= LOAD STATE =================
 
-if os.path.exists(SEEN_FILE):
-    with open(SEEN_FILE, encoding="utf-8") as f:
-        seen = set(json.load(f))
+    live_items = []
 
-# ================= EXPIRE OLD =================
+    if os.path.exists(LIVE_FILE):
+        with open(LIVE_FILE, encoding="utf-8") as f:
+            live_items = json.load(f)
 
-fresh = []
-for item in live_items:
-    expires = datetime.fromisoformat(item["expires_at"])
-    if expires > now:
-        fresh.append(item)
+    seen = SeenCache(SEEN_FILE, SEEN_RETENTION_HOURS, now=now.timestamp())
 
-live_items = fresh
+    # ================= EXPIRE OLD =================
 
-# ================= FETCH FEEDS =================
+    fresh = []
+    for item in live_items:
+        expires = datetime.fromisoformat(item["expires_at"])
+        if expires > now:
+            fresh.append(item)
 
-added = 0
-topics = {k: [] for k in TOPIC_KEYWORDS}
+    live_items = fresh
 
-for feed_url, source, tier_weight in FEEDS:
-    if added >= MAX_PER_RUN:
-        break
+    # the same story from several publishers shows once
+    near = NearDuplicateIndex()
+    for item in live_items:
+        near.add(item["id"], item["title"])
 
-    feed = feedparser.parse(feed_url)
+    # ================= FETCH FEEDS =================
 
-    for entry in feed.entries[:10]:
+    added = 0
+    near_duplicates = 0
+    topics = {k: [] for k in TOPIC_KEYWORDS}
+    consumed = []
+
+    results = fetch_feeds([url for url, _, _ in FEEDS])
+
+    for (feed_url, source, tier_weight), result in zip(FEEDS, results):
         if added >= MAX_PER_RUN:
             break
 
-        title = entry.get("title", "").strip()
-        link = entry.get("link", "")
-
-        if not title or not link:
+        # 304 → nothing new from this publisher; failures are simply skipped
+        feed = result["feed"]
+        if feed is None:
             continue
 
-        uid = hashlib.md5((title + source).lower().encode()).hexdigest()
-        if uid in seen:
-            continue
+        capped = False
+
+        for entry in feed.entries[:10]:
+            if added >= MAX_PER_RUN:
+                capped = True
+                break
+
+            title = entry.get("title", "").strip()
+            link = entry.get("link", "")
+
+            if not title or not link:
+                continue
+
+            uid = hashlib.md5((title + source).lower().encode()).hexdigest()
+            if uid in seen:
+                continue
+            if near.find(title):
+                seen.add(uid)
+                near_duplicates += 1
+                continue
+
+            # published time
+            if hasattr(entry, "published_parsed"):
+                published = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+                minutes_ago = int((now - published).total_seconds() / 60)
+            else:
+                minutes_ago = 0
+
+            topic = detect_topic(title)
+            priority = score_item(minutes_ago, title, tier_weight)
+
+            item = {
+                "id": uid,
+                "title": title,
+                "url": link,
+                "source": source,
+                "topic": topic,
+                "priority": priority,
+                "minutes_ago": minutes_ago,
+                "timestamp": now.isoformat(),
+                "expires_at": (now + timedelta(hours=LIVE_TTL_HOURS)).isoformat()
+            }
 
-        # published time
-        if hasattr(entry, "published_parsed"):
-            published = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-            minutes_ago = int((now - published).total_seconds() / 60)
-        else:
-            minutes_ago = 0
+            live_items.insert(0, item)
+            topics[topic].append(item)
 
-        topic = detect_topic(title)
-        priority = score_item(minutes_ago, title, tier_weight)
+            seen.add(uid)
+            near.add(uid, title)
+            added += 1
 
-        item = {
-            "id": uid,
-            "title": title,
-            "url": link,
-            "source": source,
-            "topic": topic,
-            "priority": priority,
-            "minutes_ago": minutes_ago,
-            "timestamp": now.isoformat(),
-            "expires_at": (now + timedelta(hours=LIVE_TTL_HOURS)).isoformat()
-        }
+        if not capped:
+            consumed.append(result)
 
-        live_items.insert(0, item)
-        topics[topic].append(item)
+    commit_validators(consumed)
 
-        seen.add(uid)
-        added += 1
+    # ================= SORT & TRIM =================
 
-# ================= SORT & TRIM =================
+    # Sort live items by priority
+    live_items = sorted(live_items, key=lambda x: x["priority"], reverse=True)
 
-# Sort live items by priority
-live_items = sorted(live_items, key=lambda x: x["priority"], reverse=True)
+    # Keep feed compact
+    live_items = live_items[:30]
 
-# Keep feed compact
-live_items = live_items[:30]
+    # ================= SAVE =================
 
-# ================= SAVE =================
+    save_json(LIVE_FILE, live_items, indent=2)
 
-with open(LIVE_FILE, "w", encoding="utf-8") as f:
-    json.dump(live_items, f, indent=2)
+    seen.save()
 
-with open(SEEN_FILE, "w", encoding="utf-8") as f:
-    json.dump(list(seen), f)
+    save_json(TOPICS_FILE, topics, indent=2)
 
-with open(TOPICS_FILE, "w", encoding="utf-8") as f:
-    json.dump(topics, f, indent=2)
+    print(f"🔴 Live engine added {added} updates | {len(live_items)} active | {near_duplicates} near-duplicates skipped")
+    seen.report()
+    print_latency_report(results)
 
-print(f"🔴 Live engine added {added} updates | {len(live_items)} active")
+if __name__ == "__main__":
+    run()
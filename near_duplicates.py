@@ -0,0 +1,130 @@
+import hashlib
+import random
+import re
+import sys
+from datetime import datetime, timezone
+
+from article_fields import article_epoch
+from article_store import article_title, fingerprint
+from data_io import load_articles
+
+# ================= CONFIG =================
+THRESHOLD = 0.7         # shingle Jaccard similarity that counts as the same story
+WINDOW_HOURS = 72       # wires repeat a story within hours, not weeks
+
+SHINGLE_CHARS = 4
+NUM_HASHES = 64
+BANDS = 16              # 16 bands x 4 rows: pairs from ~0.5 similarity become candidates
+
+_rng = random.Random(2026)                          # fixed: signatures are reproducible
+_MASKS = [_rng.getrandbits(64) for _ in range(NUM_HASHES)]
+
+# ================= SHINGLES / MINHASH =================
+def normalize(title):
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", title.lower()).split())
+
+def shingles(title, k=SHINGLE_CHARS):
+    text = normalize(title)
+    if len(text) <= k:
+        return {text} if text else set()
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+def _hash(shingle):
+    return int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+
+# One 64-bit hash per shingle, permuted by XOR with a fixed random mask per
+# signature slot: several times cheaper than (a*h + b) % p on Python ints,
+# and candidates are verified exactly anyway
+def signature(shingle_set):
+    hashes = [_hash(s) for s in shingle_set]
+    return [min([h ^ m for h in hashes]) for m in _MASKS]
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+# ================= LSH INDEX =================
+# MinHash signatures split into bands; a headline is only compared with the
+# ones sharing at least one band bucket, so a lookup costs about the same
+# with 50 or 50,000 headlines indexed. Candidates are confirmed with the
+# exact shingle Jaccard against the threshold, so LSH only decides who is
+# compared, never what counts as a duplicate.
+class NearDuplicateIndex:
+    def __init__(self, threshold=THRESHOLD, bands=BANDS):
+        if NUM_HASHES % bands:
+            raise ValueError(f"bands must divide {NUM_HASHES}")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = NUM_HASHES // bands
+        self.buckets = [{} for _ in range(bands)]
+        self.shingle_sets = {}      # key -> shingles
+        self.comparisons = 0
+
+    def _band_keys(self, sig):
+        r = self.rows
+        return [tuple(sig[i * r:(i + 1) * r]) for i in range(self.bands)]
+
+    def __len__(self):
+        return len(self.shingle_sets)
+
+    def add(self, key, title):
+        sh = shingles(title)
+        if not sh or key in self.shingle_sets:
+            return
+        self.shingle_sets[key] = sh
+        for band, band_key in zip(self.buckets, self._band_keys(signature(sh))):
+            band.setdefault(band_key, []).append(key)
+
+    # Most similar indexed key at or above the threshold: (key, similarity)
+    def find(self, title):
+        sh = shingles(title)
+        if not sh:
+            return None
+
+        candidates = set()
+        for band, band_key in zip(self.buckets, self._band_keys(signature(sh))):
+            candidates.update(band.get(band_key, ()))
+
+        best = None
+        for key in candidates:
+            self.comparisons += 1
+            score = jaccard(sh, self.shingle_sets[key])
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (key, score)
+        return best
+
+    # Recent articles only (by DATE), keyed by title fingerprint
+    @classmethod
+    def from_articles(cls, articles, window_hours=WINDOW_HOURS, now=None, **kwargs):
+        now_ts = (now or datetime.now(timezone.utc)).timestamp()
+        index = cls(**kwargs)
+        for item in articles:
+            title = article_title(item)
+            ts = article_epoch(item)
+            if title and ts is not None and (now_ts - ts) / 3600 <= window_hours:
+                index.add(fingerprint(title), title)
+        return index
+
+# ================= CLI =================
+# python near_duplicates.py [threshold] → report near-duplicate clusters in data.json
+if __name__ == "__main__":
+    threshold = float(sys.argv[1]) if len(sys.argv) > 1 else THRESHOLD
+    index = NearDuplicateIndex(threshold=threshold)
+    titles = {}
+    pairs = 0
+
+    for item in load_articles():
+        title = article_title(item)
+        if not title:
+            continue
+        fp = fingerprint(title)
+        match = index.find(title)
+        if match and match[0] != fp:
+            pairs += 1
+            print(f"🔁 {match[1]:.2f}  {title}\n         ≈ {titles[match[0]]}")
+        index.add(fp, title)
+        titles.setdefault(fp, title)
+
+    print(f"🧬 {pairs} near-duplicates among {len(index)} headlines "
+          f"(threshold {threshold}, {index.comparisons} comparisons)")
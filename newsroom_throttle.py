@@ -1,5 +1,7 @@
 import json
 
+from data_io import save_json
+
 with open("signals/site_health.json") as f:
     health = json.load(f)
 
@@ -14,10 +16,9 @@ if QUALITY < 80:
 elif QUALITY < 90:
     MAX_ARTICLES = 6
 
-with open("signals/publish_limits.json", "w") as f:
-    json.dump({
-        "throttle": THROTTLE,
-        "max_articles": MAX_ARTICLES
-    }, f)
+save_json("signals/publish_limits.json", {
+    "throttle": THROTTLE,
+    "max_articles": MAX_ARTICLES
+})
 
 print("🚦 Throttle:", THROTTLE, "| Max articles:", MAX_ARTICLES)
@@ -1,10 +1,9 @@
-print("🔧 Normalizing PureStill data.json…")
-
-import json
-import hashlib
 from datetime import datetime, timezone, timedelta
 
-DATA_FILE = "data.json"
+from article_fields import stamp_dates
+from article_index import ArticleIndex
+from article_store import fingerprint
+from data_io import load_articles, save_articles
 
 NOW = datetime.now(timezone.utc)
 
@@ -50,9 +49,6 @@ def normalize_category(cat):
     key = str(cat).lower().strip()
     return CATEGORY_MAP.get(key, cat.title())
 
-def fingerprint(title):
-    return hashlib.md5(title.lower().encode()).hexdigest()
-
 def default_headlines(title):
     return [
         title,
@@ -61,86 +57,80 @@ def default_headlines(title):
     ]
 
 # =========================
-# LOAD DATA
+# NORMALIZE
 # =========================
 
-with open(DATA_FILE, encoding="utf-8") as f:
-    raw = json.load(f)
-
-if not isinstance(raw, list):
-    raise Exception("❌ data.json must be a list")
+def run(data):
+    print("🔧 Normalizing PureStill data.json…")
 
-normalized = []
-seen = set()
-breaking_count = 0
-
-# =========================
-# NORMALIZE EACH ITEM
-# =========================
+    normalized = []
+    index = ArticleIndex()
+    breaking_count = 0
 
-for item in raw:
-    title = item.get("TITLE") or item.get("title")
-    if not title:
-        continue
+    for item in data:
+        title = item.get("TITLE") or item.get("title")
+        if not title:
+            continue
 
-    fid = fingerprint(title)
-    if fid in seen:
-        continue
-    seen.add(fid)
+        if fingerprint(title.strip()) in index:
+            continue
 
-    date_raw = item.get("DATE") or item.get("date") or iso(NOW)
-    date = normalize_date(date_raw)
+        date_raw = item.get("DATE") or item.get("date") or iso(NOW)
+        date = normalize_date(date_raw)
 
-    age_hours = (NOW - datetime.fromisoformat(date.replace("Z","+00:00"))).total_seconds() / 3600
+        age_hours = (NOW - datetime.fromisoformat(date.replace("Z","+00:00"))).total_seconds() / 3600
 
-    is_breaking = bool(item.get("IS_BREAKING", False))
+        is_breaking = bool(item.get("IS_BREAKING", False))
 
-    # 🔴 AUTO DEMOTION
-    if is_breaking and age_hours > BREAKING_TTL_HOURS:
-        is_breaking = False
-
-    # 🔴 HARD BREAKING CAP
-    if is_breaking:
-        if breaking_count >= MAX_BREAKING_ALLOWED:
+        # 🔴 AUTO DEMOTION
+        if is_breaking and age_hours > BREAKING_TTL_HOURS:
             is_breaking = False
-        else:
-            breaking_count += 1
-
-    category = normalize_category(
-        item.get("CATEGORY") or item.get("category")
-    )
-
-    entry = {
-        "TITLE": title.strip(),
-        "SUMMARY": item.get("SUMMARY") or item.get("summary") or "",
-        "CONTENT": item.get("CONTENT") or item.get("content") or "",
-        "CATEGORY": category,
-        "DATE": date,
-        "SOURCE": item.get("SOURCE") or item.get("source") or "",
-
-        # 🔐 REQUIRED SYSTEM FIELDS
-        "COUNTRY": item.get("COUNTRY", DEFAULT_COUNTRY),
-        "IS_BREAKING": is_breaking,
-        "PUBLISH_GROUP": (
-            "breaking" if is_breaking else item.get("PUBLISH_GROUP", "normal")
-        ),
-
-        # 🧠 DISCOVER / HEADLINE SYSTEM
-        "HEADLINE_VARIANTS": item.get("HEADLINE_VARIANTS") or default_headlines(title),
-        "HEADLINE_ACTIVE": int(item.get("HEADLINE_ACTIVE", 0)),
-        "DISCOVER_SIGNAL": int(item.get("DISCOVER_SIGNAL", 0)),
-        "VISIBILITY": item.get("VISIBILITY", "normal")
-    }
-
-    normalized.append(entry)
-
-# =========================
-# SAVE BACK (AUTHORITATIVE)
-# =========================
-
-with open(DATA_FILE, "w", encoding="utf-8") as f:
-    json.dump(normalized, f, indent=2)
 
-print(f"✅ Normalized {len(normalized)} articles")
-print(f"🔴 Active breaking items: {breaking_count}")
-print("🛡 Schema locked. data.json is now system-managed.")
+        # 🔴 HARD BREAKING CAP
+        if is_breaking:
+            if breaking_count >= MAX_BREAKING_ALLOWED:
+                is_breaking = False
+            else:
+                breaking_count += 1
+
+        category = normalize_category(
+            item.get("CATEGORY") or item.get("category")
+        )
+
+        entry = {
+            "TITLE": title.strip(),
+            "SUMMARY": item.get("SUMMARY") or item.get("summary") or "",
+            "CONTENT": item.get("CONTENT") or item.get("content") or "",
+            "CATEGORY": category,
+            "DATE": date,
+            "SOURCE": item.get("SOURCE") or item.get("source") or "",
+
+            # 🔐 REQUIRED SYSTEM FIELDS
+            "COUNTRY": item.get("COUNTRY", DEFAULT_COUNTRY),
+            "IS_BREAKING": is_breaking,
+            "PUBLISH_GROUP": (
+                "breaking" if is_breaking else item.get("PUBLISH_GROUP", "normal")
+            ),
+
+            # 🧠 DISCOVER / HEADLINE SYSTEM
+            "HEADLINE_VARIANTS": item.get("HEADLINE_VARIANTS") or default_headlines(title),
+            "HEADLINE_ACTIVE": int(item.get("HEADLINE_ACTIVE", 0)),
+            "DISCOVER_SIGNAL": int(item.get("DISCOVER_SIGNAL", 0)),
+            "VISIBILITY": item.get("VISIBILITY", "normal")
+        }
+
+        stamp_dates(entry)
+        normalized.append(entry)
+        index.add(entry)
+
+    # Authoritative: the normalized list replaces the input in place
+    data[:] = normalized
+
+    print(f"✅ Normalized {len(normalized)} articles")
+    print(f"🔴 Active breaking items: {breaking_count}")
+    print("🛡 Schema locked. data.json is now system-managed.")
+
+if __name__ == "__main__":
+    data = load_articles()
+    run(data)
+    save_articles(data)
@@ -2,6 +2,8 @@ import json
 import re
 from collections import Counter
 
+from data_io import save_json
+
 with open("signals/discover_winners.json", encoding="utf-8") as f:
     winners = json.load(f)
 
@@ -33,7 +35,6 @@ patterns = {
     "section_patterns": section_patterns
 }
 
-with open("signals/discover_patterns.json", "w") as f:
-    json.dump(patterns, f, indent=2, default=int)
+save_json("signals/discover_patterns.json", patterns, indent=2, default=int)
 
 print("🧬 Discover patterns extracted")
@@ -0,0 +1,154 @@
+import argparse
+import sys
+import traceback
+from contextlib import nullcontext
+
+import country_homepages
+import discover_lifecycle
+import entity_authority
+import fetch_news
+import generate_pages
+import google_news_feed
+import hourly_engine
+import live_engine
+import revenue_forecast
+import sitemaps
+import topic_hubs
+import trust_signals
+from article_fields import stamp_dates
+from article_store import ArticleStore
+from build_profiler import METRICS_FILE, BuildProfiler
+from data_io import file_lock
+
+# ================= CONFIG =================
+# Held for the whole run so two local runs (cron, a manual run) cannot
+# interleave their article store and signals writes. It only covers one
+# machine; on GitHub Actions the workflow's concurrency group serializes runs.
+LOCK_FILE = ".pipeline.lock"
+
+# ================= STAGE ORDER =================
+# Every stage is run(data) over the same in-memory article list, loaded
+# from the article store once and synced back once at the end.
+# required=False mirrors the old "|| true" workflow steps: a failure is
+# reported and the run carries on with the next stage.
+STAGES = [
+    # name                      module                  required
+    ("live_engine",             live_engine,            True),
+    ("hourly_engine",           hourly_engine,          True),
+    ("fetch_news",              fetch_news,             True),
+    ("entity_authority",        entity_authority,       False),
+    ("revenue_forecast",        revenue_forecast,       False),
+    ("trust_signals",           trust_signals,          False),
+    # discover_feedback … discover_winners in one pass; --only may also
+    # name single rules (see discover_lifecycle.RULES)
+    ("discover_lifecycle",      discover_lifecycle,     False),
+    ("generate_pages",          generate_pages,         True),
+    ("topic_hubs",              topic_hubs,             False),
+    ("country_homepages",       country_homepages,      False),
+    ("google_news_feed",        google_news_feed,       False),
+    ("sitemaps",                sitemaps,               False),
+]
+
+# ================= RUNNER =================
+# stage_options: extra keyword arguments per stage name, e.g.
+# {"generate_pages": {"workers": 4, "full": True}}
+def run(stage_names=None, lock=True, profile_dir=None, metrics_file=None, stage_options=None):
+    with file_lock(LOCK_FILE) if lock else nullcontext():
+        run_stages(stage_names, profile_dir, metrics_file, stage_options)
+
+def stage_rules(module):
+    return [rule[0] for rule in getattr(module, "RULES", ())]
+
+# (name, module, required, rule subset or None for the whole stage)
+def select_stages(stage_names=None):
+    stages = []
+    for name, module, required in STAGES:
+        if stage_names is None or name in stage_names:
+            stages.append((name, module, required, None))
+            continue
+        rules = [r for r in stage_rules(module) if r in stage_names]
+        if rules:
+            stages.append((name, module, required, rules))
+    return stages
+
+# profile_dir: also dump a cProfile of every stage there. metrics_file:
+# append the run's stage metrics there.
+def run_stages(stage_names=None, profile_dir=None, metrics_file=None, stage_options=None):
+    stages = select_stages(stage_names)
+    stage_options = stage_options or {}
+    profiler = BuildProfiler(metrics_file, profile_dir)
+
+    with profiler.stage("load article store"):
+        store = ArticleStore()
+        data = store.articles()
+
+        # Records from before date stamping get their epochs once
+        stamped = sum(stamp_dates(item, missing_only=True) for item in data)
+        if stamped:
+            print(f"🕒 Date epochs stamped on {stamped} articles")
+    failed = []
+
+    for name, module, required, rules in stages:
+        print(f"\n▶ {name}" + (f" ({', '.join(rules)})" if rules else ""))
+        try:
+            with profiler.stage(name, data):
+                # rule stages also get the store, whose day index they read
+                if hasattr(module, "RULES"):
+                    module.run(data, rules, store=store)
+                else:
+                    module.run(data, **stage_options.get(name, {}))
+        except Exception:
+            traceback.print_exc()
+            if required:
+                profiler.save(len(data), stage_names)
+                raise SystemExit(f"❌ Failed: {name} (article store not saved)")
+            print(f"⚠️ {name} failed, continuing")
+            failed.append(name)
+
+    with profiler.stage("save article store", data):
+        added, updated, deleted = store.sync(data)
+        store.export()
+    print(f"\n🗃 Article store: +{added} ~{updated} -{deleted}")
+
+    # ================= TIMING REPORT =================
+    profiler.report()
+    profiler.save(len(data), stage_names)
+
+    if failed:
+        print("⚠️ Failed stages: " + ", ".join(failed))
+
+    print(f"\n✅ Pipeline finished: {len(stages)} stages, {len(data)} articles")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the PureStill newsroom in one process")
+    parser.add_argument("--only", help="comma-separated stage names to run (declared order is kept)")
+    parser.add_argument("--list", action="store_true", help="print the stage order and exit")
+    parser.add_argument("--no-lock", action="store_true", help=f"do not take {LOCK_FILE} for the run")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="dump a cProfile of every stage to DIR/<stage>.prof")
+    parser.add_argument("--metrics", nargs="?", const=METRICS_FILE, metavar="FILE",
+                        help=f"append this run's stage metrics to FILE (default {METRICS_FILE})")
+    parser.add_argument("--full", action="store_true",
+                        help="generate_pages: ignore the build manifest and rewrite every article page; "
+                             "topic_hubs: rebuild the hubs from the whole archive")
+    parser.add_argument("--workers", type=int, default=1, metavar="N",
+                        help="generate_pages: render and write article pages across N processes")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, module, required in STAGES:
+            print(f"{name}{'' if required else '  (optional)'}")
+            for rule in stage_rules(module):
+                print(f"   {rule}")
+        sys.exit(0)
+
+    names = None
+    if args.only:
+        names = {n.strip() for n in args.only.split(",") if n.strip()}
+        unknown = names - {s[0] for s in STAGES} - {r for s in STAGES for r in stage_rules(s[1])}
+        if unknown:
+            raise SystemExit("❌ Unknown stages: " + ", ".join(sorted(unknown)))
+
+    run(names, lock=not args.no_lock, profile_dir=args.profile, metrics_file=args.metrics,
+        stage_options={"generate_pages": {"full": args.full, "workers": args.workers},
+                       "topic_hubs": {"full": args.full}})
@@ -0,0 +1,99 @@
+import heapq
+
+# ================= SECTION DEFINITIONS =================
+# Sections are filled in order. Each one is a dict:
+#   name        result key
+#   key         field (or callable) ranked descending; None = archive order
+#   limit       items shown
+#   where       optional predicate an item must satisfy
+#   exclusive   True (default): skips slugs taken by earlier sections and
+#               claims the slugs it shows. False: ignores and claims nothing.
+#   claims_all  claims every matching item, not just the shown ones (used
+#               by LIVE, which hides all live stories from every other
+#               section); such a section is fully sorted, ascending when
+#               "descending" is False
+
+def _key_fn(key):
+    if key is None or callable(key):
+        return key
+    return lambda a: a[key]
+
+# ================= SELECTION =================
+# Each distinct (where, key) group is filtered once and ranked with a
+# bounded heap (heapq.nlargest), sized for the deepest section that reads
+# from it, so the work is O(n log k) instead of one full sort per section.
+# Results match "filter remaining, sorted(..., reverse=True)[:limit]" per
+# section, ties included (earlier articles win). If slug collisions eat
+# into a heap, that section falls back to a full scan so output stays
+# exact.
+def select_sections(articles, sections, slug="slug"):
+    claim_all = [s for s in sections if s.get("claims_all")]
+
+    # ---- claiming sections ----
+    result = {}
+    used = set()
+    claimed = set()
+    for s in claim_all:
+        where = s["where"]
+        matches = [a for a in articles if where(a)]
+        key = _key_fn(s["key"])
+        ranked = sorted(matches, key=key, reverse=s.get("descending", True)) if key else matches
+        result[s["name"]] = ranked[:s["limit"]]
+        used.update(a[slug] for a in matches)
+        claimed.update(id(a) for a in matches)
+
+    # ---- plan groups ----
+    groups = {}
+    plan = []
+    depth = 0
+    for s in sections:
+        if s.get("claims_all"):
+            continue
+        exclusive = s.get("exclusive", True)
+        gid = (id(s.get("where")), s["key"] if not callable(s["key"]) else id(s["key"]), exclusive)
+        g = groups.setdefault(gid, {
+            "where": s.get("where"),
+            "key": _key_fn(s["key"]),
+            "respects_claims": exclusive,
+            "size": 0
+        })
+        g["size"] = max(g["size"], s["limit"] + (depth if exclusive else 0))
+        plan.append((s, g))
+        if exclusive:
+            depth += s["limit"]
+
+    # ---- rank each group once ----
+    pools = {}
+    for g in groups.values():
+        pid = (id(g["where"]), g["respects_claims"])
+        if pid not in pools:
+            pool = articles
+            if g["respects_claims"] and claimed:
+                pool = [a for a in pool if id(a) not in claimed]
+            if g["where"] is not None:
+                where = g["where"]
+                pool = [a for a in pool if where(a)]
+            pools[pid] = pool
+
+        g["pool"] = pools[pid]
+        if g["key"] is None:
+            g["top"] = g["pool"][:g["size"]]
+        else:
+            g["top"] = heapq.nlargest(g["size"], g["pool"], key=g["key"])
+
+    # ---- fill sections in order ----
+    for s, g in plan:
+        exclusive = g["respects_claims"]
+        picked = [a for a in g["top"] if not exclusive or a[slug] not in used][:s["limit"]]
+
+        if len(picked) < s["limit"] and len(g["pool"]) > len(g["top"]):
+            pool = [a for a in g["pool"] if not exclusive or a[slug] not in used]
+            if g["key"] is not None:
+                pool = sorted(pool, key=g["key"], reverse=True)
+            picked = pool[:s["limit"]]
+
+        result[s["name"]] = picked
+        if exclusive:
+            used.update(a[slug] for a in picked)
+
+    return result
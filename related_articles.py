@@ -0,0 +1,219 @@
+import hashlib
+import heapq
+import math
+import sys
+from collections import Counter
+
+from article_fields import article_slug, safe
+from data_io import load_articles, load_json, save_json
+from keyword_matcher import WORD
+
+# ================= CONFIG =================
+CACHE_FILE = "signals/related_articles.json"
+CACHE_VERSION = 3           # bump when the cache entry layout changes
+
+RELATED_COUNT = 3           # links per article page
+MIN_SCORE = 0.15            # cosine similarity below which nothing is "related"
+MAX_DF_SHARE = 0.02         # tokens in more than this share of articles are too common to link on
+MAX_DF_FLOOR = 100          # … but small archives keep every token
+MAX_DF_CAP = 500            # and no posting list is followed past this length
+IDF_DRIFT = 0.10            # size change since the cache generation that starts a new one
+
+STOPWORDS = set(
+    "a an and are as at be but by for from has have he her his how in into is it its "
+    "new of on or over says said she that the their this to up was what when who why "
+    "will with after amid about more than not".split()
+)
+
+# ================= TOKENS =================
+# Title words plus the entities entity_authority.py tagged
+def article_tokens(item):
+    tokens = {w for w in WORD.findall(safe(item, "TITLE", "title").lower()) if w not in STOPWORDS and len(w) > 1}
+    for entity in item.get("ENTITIES") or ():
+        tokens.add("entity:" + entity.lower())
+    return tokens
+
+def token_signature(tokens):
+    return hashlib.md5("\0".join(sorted(tokens)).encode("utf-8")).hexdigest()
+
+# ================= ENGINE =================
+# TF-IDF cosine over binary token vectors. Each article only meets the
+# articles sharing one of its tokens (an inverted index), and tokens on
+# more than MAX_DF_SHARE of the archive are not followed, so the bulk run
+# stays near-linear in the archive size instead of comparing all pairs.
+#
+# generation: {"size", "max_df", "df"} frozen when the cache last started
+# over (see find_related); None starts one from these articles. Tokens
+# the generation knows keep its IDF, newer tokens weigh by their live
+# count. Whether a token is followed always goes by its live count.
+class RelatedIndex:
+    def __init__(self, slugs, tokens, generation=None):
+        self.slugs = slugs
+        self.tokens = tokens
+        self.df = Counter(t for toks in tokens for t in toks)
+
+        if generation is None:
+            n = len(slugs)
+            generation = {"size": n, "max_df": min(MAX_DF_CAP, max(MAX_DF_FLOOR, int(n * MAX_DF_SHARE))),
+                          "df": dict(self.df)}
+        self.generation = generation
+        self.idf = {t: self.token_idf(t, count) for t, count in self.df.items()}
+        self.norm = [math.sqrt(sum(self.idf[t] ** 2 for t in toks)) for toks in tokens]
+
+        self.postings = {}
+        for i, toks in enumerate(tokens):
+            for t in toks:
+                if self.followed(self.df[t]):
+                    self.postings.setdefault(t, []).append(i)
+
+    def token_idf(self, t, count):
+        return math.log(self.generation["size"] / self.generation["df"].get(t, count))
+
+    def followed(self, count):
+        return 1 < count <= self.generation["max_df"]
+
+    # Tokens weighed or followed differently than with the live counts
+    # previous_df (an earlier run under the same generation)
+    def changed_tokens(self, previous_df):
+        changed = set()
+        for t, count in self.df.items():
+            before = previous_df.get(t, 0)
+            if before != count and (
+                self.followed(before) != self.followed(count)
+                or t not in self.generation["df"]
+            ):
+                changed.add(t)
+        return changed
+
+    # (score, -j) for every article j scoring at least min_score against i
+    def scores(self, i, min_score=MIN_SCORE):
+        if not self.norm[i]:
+            return []
+
+        acc = {}
+        get = acc.get
+        for t in self.tokens[i]:
+            posting = self.postings.get(t)
+            if posting is None:
+                continue
+            weight = self.idf[t] ** 2
+            for j in posting:
+                acc[j] = get(j, 0.0) + weight
+        acc.pop(i, None)
+
+        norm = self.norm
+        norm_i = norm[i]
+        cutoff = min_score * norm_i
+        return [(dot / (norm_i * norm[j]), -j) for j, dot in acc.items() if dot >= cutoff * norm[j]]
+
+    # Best top_n (score, index) for article i; ties go to the earlier article
+    def related(self, i, top_n=RELATED_COUNT, min_score=MIN_SCORE):
+        return [(score, -j) for score, j in heapq.nlargest(top_n, self.scores(i, min_score))]
+
+# ================= BULK + CACHE =================
+# records: {slug: article}. Returns {slug: [related slugs]}.
+#
+# Scores use the IDF of a cache generation: the document counts frozen
+# when the cache last started over. A generation ends, and every set is
+# recomputed, when the archive size moves more than IDF_DRIFT from the
+# generation's. Within one, the cached sets are exactly what a full
+# recompute under the same generation returns; against a cold build
+# (cache_file=None) close scores can swap order, as that build weighs
+# tokens by today's counts.
+#
+# The cache keeps each article's token signature, related set and the
+# score a newcomer has to reach to get into that set (0 while the set is
+# not full). An article is recomputed when its tokens changed, when one
+# of its tokens is weighed or followed differently than last run (a new
+# token's count moved, a token crossed the posting limits), when an
+# article it links to was recomputed that way or went away, or when such
+# an article scores at least that floor against it. Cosine scores are
+# symmetric, so scoring the changed articles finds those neighbours from
+# their side: a small ingest recomputes a few articles, not everyone
+# sharing a common word with it.
+def find_related(records, cache_file=CACHE_FILE, top_n=RELATED_COUNT):
+    slugs = list(records)
+    tokens = [article_tokens(records[s]) for s in slugs]
+    signatures = [token_signature(t) for t in tokens]
+
+    cache = load_json(cache_file, {}) if cache_file else {}
+    cached = cache.get("articles", {})
+    generation = cache.get("generation")
+    if (
+        cache.get("version") != CACHE_VERSION
+        or cache.get("top_n") != top_n
+        or generation is None
+        or abs(len(slugs) - generation["size"]) > IDF_DRIFT * generation["size"]
+    ):
+        cached, generation = {}, None
+
+    index = RelatedIndex(slugs, tokens, generation)
+    moved = index.changed_tokens(cache.get("df", {})) if generation else set()
+
+    changed = set()
+    for i, (slug, sig) in enumerate(zip(slugs, signatures)):
+        entry = cached.get(slug)
+        if entry is None or entry[0] != sig or not moved.isdisjoint(tokens[i]):
+            changed.add(i)
+    gone = cached.keys() - records.keys()
+    changed_slugs = {slugs[i] for i in changed}
+
+    fresh = {}              # i -> top_n (score, j) already computed
+
+    # ---- who could a new or changed article displace? ----
+    dirty = set(changed)
+    for i in changed:
+        scored = index.scores(i)
+        fresh[i] = [(score, -j) for score, j in heapq.nlargest(top_n, scored)]
+        for score, j in scored:
+            j = -j
+            if j in dirty:
+                continue
+            entry = cached[slugs[j]]
+            if score >= entry[2] - 1e-6:      # floors are stored rounded
+                dirty.add(j)
+
+    result = {}
+    entries = {}
+    recomputed = 0
+
+    for i, (slug, sig) in enumerate(zip(slugs, signatures)):
+        entry = cached.get(slug)
+        if (
+            i not in dirty
+            and not any(r in changed_slugs or r in gone for r in entry[1])
+        ):
+            related, floor = entry[1], entry[2]
+        else:
+            best = fresh[i] if i in fresh else index.related(i, top_n)
+            related = [slugs[j] for _, j in best]
+            floor = best[-1][0] if len(best) == top_n else 0.0
+            recomputed += 1
+        result[slug] = related
+        entries[slug] = [sig, related, round(floor, 6)]
+
+    if cache_file and (recomputed or gone or generation is None or cache.get("df") != index.df):
+        save_json(cache_file, {"version": CACHE_VERSION, "top_n": top_n, "generation": index.generation,
+                               "df": index.df, "articles": entries},
+                  ensure_ascii=False, separators=(",", ":"))
+
+    print(f"🔗 Related articles: {recomputed} recomputed, {len(slugs) - recomputed} reused")
+    return result
+
+# ================= CLI =================
+# python related_articles.py [title words…] → related set for matching articles
+if __name__ == "__main__":
+    records = {}
+    for item in load_articles():
+        if article_slug(item):
+            records[article_slug(item)] = item
+
+    related = find_related(records)
+    query = " ".join(sys.argv[1:]).lower()
+    for slug, links in related.items():
+        if query and query not in slug.replace("-", " "):
+            continue
+        if links:
+            print(f"📰 {slug}")
+            for link in links:
+                print(f"   → {link}")
@@ -1,5 +1,7 @@
 import json
 
+from data_io import save_json
+
 RPM_CATEGORY = {
     "Business": 90,
     "Technology": 80,
@@ -16,7 +18,6 @@ ranked = {}
 for p, count in patterns["headline_patterns"].items():
     ranked[p] = count * 1.0  # CTR proxy
 
-with open("signals/revenue_patterns.json","w") as f:
-    json.dump(ranked, f, indent=2)
+save_json("signals/revenue_patterns.json", ranked, indent=2)
 
 print("💰 Revenue-weighted patterns ranked")
@@ -1,19 +1,19 @@
-import json
 from collections import defaultdict
 
-DATA_FILE = "data.json"
+from data_io import iter_articles, save_json
 
-with open(DATA_FILE, encoding="utf-8") as f:
-    data = json.load(f)
+def run(data):
+    heatmap = defaultdict(int)
 
-heatmap = defaultdict(int)
+    for a in data:
+        for c in a.get("TARGET_COUNTRIES", ["GLOBAL"]):
+            key = f"{c}_{a.get('category','General')}"
+            heatmap[key] += 1
 
-for a in data:
-    for c in a.get("TARGET_COUNTRIES", ["GLOBAL"]):
-        key = f"{c}_{a.get('category','General')}"
-        heatmap[key] += 1
+    save_json("signals/rpm_heatmap.json", heatmap, indent=2)
 
-with open("signals/rpm_heatmap.json", "w") as f:
-    json.dump(heatmap, f, indent=2)
+    print("🔥 RPM heatmap built")
 
-print("🔥 RPM heatmap built")
+# Read-only on its own: stream data.json instead of loading it whole
+if __name__ == "__main__":
+    run(iter_articles())
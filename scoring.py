@@ -0,0 +1,148 @@
+import json
+import os
+from datetime import datetime, timezone
+
+from article_fields import ages_hours, safe
+
+# NumPy is optional: the pure-Python columns below compute the same scores,
+# just without the batch speedup on large article sets
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# ================= CONFIG =================
+TRUST_FILE = "signals/trust_score.json"
+
+CATEGORY_WEIGHT = {
+    "Business": 95,
+    "Economy": 90,
+    "Technology": 88,
+    "AI": 90,
+    "Policy": 85,
+    "Politics": 80,
+    "Sports": 60,
+    "General": 70
+}
+
+# 🌍 Country RPM priority
+COUNTRY_RPM = {
+    "US": 100,
+    "UK": 95,
+    "CA": 90,
+    "AU": 85,
+    "GLOBAL": 70
+}
+
+DEFAULT_WEIGHT = 70
+
+# final = freshness * 0.35 + category * 0.30 + rpm * 0.25 + trust / 10
+FRESHNESS_DECAY = 6           # freshness points lost per hour of age
+FINAL_WEIGHTS = {
+    "freshness": 0.35,
+    "category": 0.30,
+    "rpm": 0.25
+}
+
+COUNTRY_BOOST = 0.5           # share of a market's RPM added when targeted
+
+# ================= HELPERS =================
+def load_trust_score(path=TRUST_FILE):
+    if os.path.exists(path):
+        with open(path) as f:
+            return json.load(f).get("trust_score", 100)
+    return 100
+
+def _column(values):
+    values = list(values)
+    return np.array(values, dtype=float) if np is not None else values
+
+# ================= SCORE COLUMNS =================
+# The article set as columns (one entry per article, in input order), so
+# the rankers' scores are computed in one batch instead of a Python call
+# per article per ranker: final() for generate_pages.py and topic_hubs.py
+# (settled() too), country() for country_homepages.py. Only the terms
+# those read are loaded (entity authority feeds no ranker). Scores come
+# back as plain lists aligned with the input.
+class ScoreColumns:
+    def __init__(self, age_hours, categories, countries, targets=None, trust_score=100):
+        self.size = len(age_hours)
+        self.age_hours = _column(age_hours)
+        self.category_weight = _column(CATEGORY_WEIGHT.get(c, DEFAULT_WEIGHT) for c in categories)
+        self.country_rpm = _column(COUNTRY_RPM.get(c, DEFAULT_WEIGHT) for c in countries)
+        self.targets = targets if targets is not None else [()] * self.size
+        self.trust_score = trust_score
+        self.targeted = None    # country -> indexes of the articles targeting it
+
+    # generate_pages.py articles (already normalised, age computed)
+    @classmethod
+    def from_articles(cls, articles, trust_score=100):
+        return cls(
+            [a["age_hours"] for a in articles],
+            [a["category"] for a in articles],
+            [a["country"] for a in articles],
+            trust_score=trust_score
+        )
+
+    # Raw data.json records, either field casing
+    @classmethod
+    def from_records(cls, data, trust_score=100, now=None):
+        now = now or datetime.now(timezone.utc)
+        # undated records count as new, unparseable dates as very old
+        ages = [
+            age if age is not None else (999 if safe(a, "DATE", "date") else 0)
+            for a, age in zip(data, ages_hours(data, now))
+        ]
+        return cls(
+            ages,
+            [safe(a, "CATEGORY", "category", default="General") for a in data],
+            [safe(a, "COUNTRY", default="GLOBAL") for a in data],
+            targets=[a.get("TARGET_COUNTRIES") or () for a in data],
+            trust_score=trust_score
+        )
+
+    # ---- score ----
+    def final(self):
+        if np is not None:
+            freshness = np.maximum(0, 100 - self.age_hours * FRESHNESS_DECAY)
+        else:
+            freshness = [max(0, 100 - age * FRESHNESS_DECAY) for age in self.age_hours]
+        return self._score(freshness)
+
+    # The final score once freshness has decayed to 0: what an article
+    # scores from 100 / FRESHNESS_DECAY hours on, and never more than final
+    def settled(self):
+        return self._score(_column([0] * self.size))
+
+    def _score(self, freshness):
+        w = FINAL_WEIGHTS
+        trust_boost = self.trust_score / 10
+
+        if np is not None:
+            raw = (freshness * w["freshness"] +
+                   self.category_weight * w["category"] +
+                   self.country_rpm * w["rpm"] +
+                   trust_boost).tolist()
+        else:
+            raw = [
+                f * w["freshness"] + c * w["category"] + r * w["rpm"] + trust_boost
+                for f, c, r in zip(freshness, self.category_weight, self.country_rpm)
+            ]
+
+        # round() per value: np.round differs from Python's on some halves,
+        # and a tie broken differently would reorder the homepage
+        return [round(v, 2) for v in raw]
+
+    # ---- country ----
+    # A country's homepage score is the final score plus COUNTRY_BOOST of
+    # its RPM on the articles targeting it, so only those change: returns
+    # {index: boosted score} for them, every other article scores base.
+    def country(self, country, rpm, base):
+        if self.targeted is None:
+            self.targeted = {}
+            for i, targeted in enumerate(self.targets):
+                for c in set(targeted):
+                    self.targeted.setdefault(c, []).append(i)
+
+        boost = rpm * COUNTRY_BOOST
+        return {i: base[i] + boost for i in self.targeted.get(country, ())}
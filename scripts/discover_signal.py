@@ -1,6 +1,10 @@
-import json, os
+import json, os, sys
 from datetime import datetime, timezone
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_io import save_json
+
 DISCOVER_FILE = "signals/discover_signals.json"
 LIVE_FILE = "signals/live_feed.json"
 TOPICS_FILE = "signals/topics_feed.json"
@@ -46,7 +50,6 @@ discover_signals = {
     }
 }
 
-with open(DISCOVER_FILE, "w", encoding="utf-8") as f:
-    json.dump(discover_signals, f, indent=2)
+save_json(DISCOVER_FILE, discover_signals, indent=2)
 
 print("🧭 Discover signals updated")
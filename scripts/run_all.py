@@ -1,21 +1,14 @@
-import subprocess
+import os
 import sys
 
-def run(script):
-    print(f"\n▶ Running {script}")
-    result = subprocess.run(
-        [sys.executable, script],
-        capture_output=True,
-        text=True
-    )
-    print(result.stdout)
-    if result.returncode != 0:
-        print(result.stderr)
-        raise SystemExit(f"❌ Failed: {script}")
+# Stages run in this process (see pipeline.py) instead of one
+# interpreter per script; data.json is parsed and written once.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
 
-run("scripts/live_engine.py")
-run("scripts/trust_signal.py")
-run("scripts/discover_signal.py")
-run("generators/build_articles.py")
+import pipeline
+
+pipeline.run()
 
 print("\n✅ All PureStill engines completed successfully")
@@ -1,6 +1,10 @@
-import json, os
+import os, sys
 from datetime import datetime, timezone
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_io import save_json
+
 SIGNAL_FILE = "signals/trust_signals.json"
 
 os.makedirs("signals", exist_ok=True)
@@ -29,7 +33,6 @@ trust_signals = {
     }
 }
 
-with open(SIGNAL_FILE, "w", encoding="utf-8") as f:
-    json.dump(trust_signals, f, indent=2)
+save_json(SIGNAL_FILE, trust_signals, indent=2)
 
 print("🛡️ Trust signals updated")
@@ -0,0 +1,100 @@
+import json
+import os
+import sys
+import time
+
+from data_io import save_json
+
+# ================= CONFIG =================
+RETENTION_HOURS = 168       # forget a uid after 7 days (feeds rotate far sooner)
+UID_CHARS = 16              # 64 bits of the md5 uid is plenty at this volume
+
+# ================= SEEN CACHE =================
+# Dedupe set with a timestamp per entry. Entries older than the retention
+# window are dropped on load, so the file and startup cost stay bounded by
+# recent volume instead of growing forever.
+#
+# File format (compact JSON): {"retention_hours": 168, "seen": {uid16: epoch}}
+# The legacy format — a plain list of uids — is accepted and every entry is
+# treated as seen "now", so it ages out one retention window later.
+class SeenCache:
+    def __init__(self, path, retention_hours=RETENTION_HOURS, now=None):
+        self.path = path
+        self.retention = int(retention_hours * 3600)
+        self.now = int(now if now is not None else time.time())
+
+        self.entries = {}
+        self.loaded = 0
+        self.expired = 0
+        self.hits = 0
+        self.misses = 0
+        self.added = 0
+
+        self._load()
+
+    def _key(self, uid):
+        return uid[:UID_CHARS]
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                raw = json.load(f)
+        except Exception as e:
+            print("⚠️ Seen cache unreadable, starting empty:", e)
+            return
+
+        if isinstance(raw, list):
+            stored = {uid: self.now for uid in raw}
+        else:
+            stored = raw.get("seen", {})
+
+        cutoff = self.now - self.retention
+        for uid, ts in stored.items():
+            self.loaded += 1
+            if ts < cutoff:
+                self.expired += 1
+                continue
+            self.entries[self._key(uid)] = ts
+
+    def __contains__(self, uid):
+        if self._key(uid) in self.entries:
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, uid):
+        self.entries[self._key(uid)] = self.now
+        self.added += 1
+
+    def save(self):
+        payload = {
+            "retention_hours": self.retention // 3600,
+            "seen": self.entries
+        }
+        save_json(self.path, payload, separators=(",", ":"))
+
+    def memory_bytes(self):
+        size = sys.getsizeof(self.entries)
+        for k, v in self.entries.items():
+            size += sys.getsizeof(k) + sys.getsizeof(v)
+        return size
+
+    def report(self):
+        lookups = self.hits + self.misses
+        hit_rate = (self.hits / lookups * 100) if lookups else 0.0
+        file_bytes = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+
+        print(
+            f"🧮 Seen cache: {len(self.entries)} entries "
+            f"(+{self.added}, expired {self.expired}/{self.loaded}) | "
+            f"hit rate {hit_rate:.1f}% of {lookups} lookups | "
+            f"~{self.memory_bytes() / 1024:.1f} KiB in memory, "
+            f"{file_bytes / 1024:.1f} KiB on disk"
+        )
@@ -0,0 +1,167 @@
+import os
+import sys
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape
+
+from article_fields import article_epoch, article_slug, safe
+from data_io import load_articles, write_if_changed
+
+# ================= CONFIG =================
+BASE_URL = "https://purestill.pages.dev"
+SITE_DIR = "site"
+
+SITEMAP_INDEX = os.path.join(SITE_DIR, "sitemap.xml")          # what robots.txt / Search Console read
+PAGES_SITEMAP = "sitemap-pages.xml"                             # homepage, hubs, static pages
+ARTICLE_SHARD = "sitemap-articles-{}.xml"
+NEWS_SITEMAP = os.path.join(SITE_DIR, "news-sitemap.xml")
+
+MAX_URLS = 50_000           # per sitemap file (protocol limit)
+NEWS_WINDOW_HOURS = 48      # Google News only reads the last two days
+NEWS_MAX_URLS = 1_000       # per news sitemap (Google News limit)
+
+PUBLICATION_NAME = "PureStill"
+PUBLICATION_LANGUAGE = "en"
+
+URLSET_OPEN = "<?xml version='1.0' encoding='UTF-8'?>\n<urlset xmlns='http://www.sitemaps.org/schemas/sitemap/0.9'>\n"
+NEWS_URLSET_OPEN = (
+    "<?xml version='1.0' encoding='UTF-8'?>\n"
+    "<urlset xmlns='http://www.sitemaps.org/schemas/sitemap/0.9' "
+    "xmlns:news='http://www.google.com/schemas/sitemap-news/0.9'>\n"
+)
+INDEX_OPEN = "<?xml version='1.0' encoding='UTF-8'?>\n<sitemapindex xmlns='http://www.sitemaps.org/schemas/sitemap/0.9'>\n"
+
+NOW = datetime.now(timezone.utc)
+
+# ================= URLS =================
+def w3c_date(dt):
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+
+# (loc, published datetime or None, title) per article page, oldest first so
+# new articles land in the last shard and the older shards stay unchanged.
+# The first record with a slug wins; later duplicates share its page.
+def article_urls(articles):
+    seen = set()
+    for item in reversed(articles):
+        slug = article_slug(item)
+        if not slug or slug in seen:
+            continue
+        seen.add(slug)
+        ts = article_epoch(item)
+        yield (
+            f"{BASE_URL}/articles/{slug}.html",
+            datetime.fromtimestamp(ts, timezone.utc) if ts is not None else None,
+            safe(item, "TITLE", "title"),
+        )
+
+# Every other generated page: index.html, topic hubs, pillars, country
+# homepages, static pages. Templates ("_…") and verification files are skipped.
+def site_page_urls(site_dir=SITE_DIR):
+    urls = []
+    for root, dirs, files in os.walk(site_dir):
+        rel = os.path.relpath(root, site_dir)
+        if rel == "articles":
+            dirs[:] = []
+            continue
+        dirs.sort()
+        for name in sorted(files):
+            if not name.endswith(".html") or name.startswith("_") or name.startswith("google"):
+                continue
+            path = "" if rel == "." else rel.replace(os.sep, "/") + "/"
+            urls.append(f"{BASE_URL}/{path}" if name == "index.html" else f"{BASE_URL}/{path}{name}")
+    # homepage first
+    urls.sort(key=lambda u: (u != f"{BASE_URL}/", u))
+    return urls
+
+# ================= RENDER =================
+def render_url(loc, published=None):
+    if published is None:
+        return f"<url><loc>{escape(loc)}</loc></url>\n"
+    return f"<url><loc>{escape(loc)}</loc><lastmod>{w3c_date(published)}</lastmod></url>\n"
+
+def render_news_url(loc, published, title):
+    return (
+        f"<url>\n<loc>{escape(loc)}</loc>\n<news:news>\n<news:publication>\n"
+        f"<news:name>{PUBLICATION_NAME}</news:name>\n"
+        f"<news:language>{PUBLICATION_LANGUAGE}</news:language>\n"
+        f"</news:publication>\n"
+        f"<news:publication_date>{w3c_date(published)}</news:publication_date>\n"
+        f"<news:title>{escape(title)}</news:title>\n</news:news>\n</url>\n"
+    )
+
+# ================= BUILD =================
+# Streams the article URLs into MAX_URLS-sized shards: one shard's text is
+# held at a time, never the whole sitemap. Returns
+# (article shards, news URLs, files written, files unchanged).
+def build_sitemaps(articles, site_dir=SITE_DIR, max_urls=MAX_URLS, now=None):
+    now = now or NOW
+    written = unchanged = 0
+    shards = []             # (file name, lastmod or None)
+
+    def flush(name, lines, lastmod):
+        nonlocal written, unchanged
+        if write_if_changed(os.path.join(site_dir, name), URLSET_OPEN + "".join(lines) + "</urlset>\n"):
+            written += 1
+        else:
+            unchanged += 1
+        shards.append((name, lastmod))
+
+    flush(PAGES_SITEMAP, [render_url(loc) for loc in site_page_urls(site_dir)], None)
+
+    news = []
+    lines = []
+    lastmod = None
+    count = 0
+
+    for loc, published, title in article_urls(articles):
+        lines.append(render_url(loc, published))
+        if published is not None:
+            lastmod = published if lastmod is None else max(lastmod, published)
+            age_hours = (now - published).total_seconds() / 3600
+            if 0 <= age_hours <= NEWS_WINDOW_HOURS:
+                news.append((published, loc, title))
+
+        if len(lines) == max_urls:
+            count += 1
+            flush(ARTICLE_SHARD.format(count), lines, lastmod)
+            lines = []
+            lastmod = None
+
+    if lines or count == 0:
+        count += 1
+        flush(ARTICLE_SHARD.format(count), lines, lastmod)
+
+    # 🧹 shards left over from a larger archive
+    n = count + 1
+    while os.path.exists(os.path.join(site_dir, ARTICLE_SHARD.format(n))):
+        os.remove(os.path.join(site_dir, ARTICLE_SHARD.format(n)))
+        n += 1
+
+    # ---- SITEMAP INDEX ----
+    entries = []
+    for name, shard_lastmod in shards:
+        entry = f"<sitemap><loc>{BASE_URL}/{name}</loc>"
+        if shard_lastmod is not None:
+            entry += f"<lastmod>{w3c_date(shard_lastmod)}</lastmod>"
+        entries.append(entry + "</sitemap>\n")
+    if write_if_changed(os.path.join(site_dir, os.path.basename(SITEMAP_INDEX)),
+                        INDEX_OPEN + "".join(entries) + "</sitemapindex>\n"):
+        written += 1
+    else:
+        unchanged += 1
+
+    # ---- NEWS SITEMAP (newest first) ----
+    news.sort(key=lambda n: n[0], reverse=True)
+    body = "".join(render_news_url(loc, published, title) for published, loc, title in news[:NEWS_MAX_URLS])
+    if write_if_changed(os.path.join(site_dir, os.path.basename(NEWS_SITEMAP)), NEWS_URLSET_OPEN + body + "</urlset>\n"):
+        written += 1
+    else:
+        unchanged += 1
+
+    return count, min(len(news), NEWS_MAX_URLS), written, unchanged
+
+def run(data):
+    shards, news, written, unchanged = build_sitemaps(data)
+    print(f"🗺 Sitemaps: {shards} article shard(s), {news} news URLs | written: {written} | unchanged: {unchanged}")
+
+if __name__ == "__main__":
+    run(load_articles(sys.argv[1]) if len(sys.argv) > 1 else load_articles())
@@ -1,23 +1,23 @@
-import json
+from data_io import load_articles, save_json
 
 TARGET_SITES = [
     "https://purestillglobal.pages.dev",
     "https://purestilltech.pages.dev"
 ]
 
-with open("data.json") as f:
-    data = json.load(f)
+def run(data):
+    payload = []
 
-payload = []
+    for a in data[:10]:
+        payload.append({
+            "title": a["title"],
+            "summary": a["summary"],
+            "canonical": f"https://purestill.pages.dev/articles/{a['slug']}.html"
+        })
 
-for a in data[:10]:
-    payload.append({
-        "title": a["title"],
-        "summary": a["summary"],
-        "canonical": f"https://purestill.pages.dev/articles/{a['slug']}.html"
-    })
+    save_json("signals/syndication_payload.json", payload, indent=2)
 
-with open("signals/syndication_payload.json","w") as f:
-    json.dump(payload, f, indent=2)
+    print("🌐 Syndication payload generated")
 
-print("🌐 Syndication payload generated")
+if __name__ == "__main__":
+    run(load_articles())
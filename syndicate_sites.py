@@ -1,7 +1,7 @@
-import json
 import os
 
-DATA_FILE = "data.json"
+from data_io import load_articles
+
 OUT_DIR = "syndication"
 
 SITES = {
@@ -9,17 +9,15 @@ SITES = {
     "tech": ["Technology", "AI"]
 }
 
-os.makedirs(OUT_DIR, exist_ok=True)
-
-with open(DATA_FILE, encoding="utf-8") as f:
-    data = json.load(f)
+def run(data):
+    os.makedirs(OUT_DIR, exist_ok=True)
 
-for site, cats in SITES.items():
-    html = f"<h1>{site.title()} Analysis</h1>"
+    for site, cats in SITES.items():
+        html = f"<h1>{site.title()} Analysis</h1>"
 
-    for a in data:
-        if a.get("category") in cats:
-            html += f"""
+        for a in data:
+            if a.get("category") in cats:
+                html += f"""
             <div>
               <h3>{a['title']}</h3>
               <p>{a['summary']}</p>
@@ -29,7 +27,10 @@ for site, cats in SITES.items():
             </div>
             """
 
-    with open(os.path.join(OUT_DIR, f"{site}.html"), "w") as f:
-        f.write(html)
+        with open(os.path.join(OUT_DIR, f"{site}.html"), "w") as f:
+            f.write(html)
+
+    print("🕸️ Syndication mesh generated")
 
-print("🕸️ Syndication mesh generated")
+if __name__ == "__main__":
+    run(load_articles())
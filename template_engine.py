@@ -0,0 +1,56 @@
+import html
+import re
+
+# ================= CONFIG =================
+SLOT_PATTERN = re.compile(r"\{\{([A-Z0-9_]+)\}\}")
+
+# ================= COMPILED TEMPLATE =================
+# A {{PLACEHOLDER}} template parsed once into alternating literal / slot
+# segments. Rendering is a single join instead of one str.replace (and one
+# full copy of the page) per placeholder.
+#
+# Slot values are HTML-escaped unless the slot is listed in raw (slots that
+# carry markup, e.g. CONTENT). escape=False treats every slot as raw.
+class Template:
+    def __init__(self, text, name="template", raw=(), escape=True):
+        self.name = name
+        self.literals = []
+        self.slots = []
+
+        pos = 0
+        for m in SLOT_PATTERN.finditer(text):
+            self.literals.append(text[pos:m.start()])
+            self.slots.append(m.group(1))
+            pos = m.end()
+        self.literals.append(text[pos:])
+
+        self.slot_names = set(self.slots)
+        self.escaped = [escape and slot not in raw for slot in self.slots]
+
+    def missing(self, values):
+        return sorted(self.slot_names - values.keys())
+
+    # strict=True raises on slots without a value; strict=False leaves the
+    # {{PLACEHOLDER}} text in place, which is what a replace chain did.
+    def render(self, values, strict=True):
+        if strict:
+            missing = self.missing(values)
+            if missing:
+                raise KeyError(f"{self.name}: no value for slot(s) {', '.join(missing)}")
+
+        literals = self.literals
+        parts = [literals[0]]
+
+        for i, slot in enumerate(self.slots):
+            if slot in values:
+                value = str(values[slot])
+                parts.append(html.escape(value) if self.escaped[i] else value)
+            else:
+                parts.append("{{" + slot + "}}")
+            parts.append(literals[i + 1])
+
+        return "".join(parts)
+
+def load_template(path, raw=(), escape=True):
+    with open(path, encoding="utf-8") as f:
+        return Template(f.read(), name=path, raw=raw, escape=escape)
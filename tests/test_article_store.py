@@ -0,0 +1,46 @@
+from article_store import ArticleStore, fingerprint
+
+def open_store(tmp_path):
+    return ArticleStore(
+        snapshot_file=str(tmp_path / "snapshot.jsonl"),
+        log_file=str(tmp_path / "log.jsonl"),
+        meta_file=str(tmp_path / "meta.json"),
+        data_file=str(tmp_path / "data.json"),
+    )
+
+def test_torn_log_tail_does_not_swallow_next_entry(tmp_path):
+    store = open_store(tmp_path)
+    store.put({"title": "First story", "date": "2026-01-01T00:00:00+00:00"})
+    store.flush()
+
+    # a run killed halfway through writing its log line
+    with open(tmp_path / "log.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"op":"put","fp":"abc","item":{"title":"Torn')
+
+    store = open_store(tmp_path)
+    assert len(store) == 1
+    store.put({"title": "Second story", "date": "2026-01-02T00:00:00+00:00"})
+    store.flush()
+
+    store = open_store(tmp_path)
+    assert fingerprint("First story") in store
+    assert fingerprint("Second story") in store
+    assert [a["title"] for a in store.articles()] == ["Second story", "First story"]
+
+def test_edited_date_in_data_json_is_restamped(tmp_path):
+    from article_fields import article_epoch, date_epoch
+    from data_io import load_articles, save_articles
+
+    store = open_store(tmp_path)
+    store.sync([{"title": "Dated story", "date": "2026-01-01T00:00:00+00:00"}])
+    store.export()
+
+    # a hand edit of the date that leaves the stored epoch behind
+    data = load_articles(str(tmp_path / "data.json"))
+    data[0]["date"] = "2026-03-01T00:00:00+00:00"
+    save_articles(data, str(tmp_path / "data.json"))
+
+    store = open_store(tmp_path)
+    item = store.articles()[0]
+    assert article_epoch(item) == date_epoch("2026-03-01T00:00:00+00:00")
+    assert item["date_ts"] == date_epoch("2026-03-01T00:00:00+00:00")
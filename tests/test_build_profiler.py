@@ -0,0 +1,23 @@
+import json
+
+from build_profiler import BuildProfiler
+
+def test_articles_written_is_counted_by_default(tmp_path):
+    data = [{"title": f"Story {i}", "score": i, "tags": []} for i in range(10)]
+    metrics = tmp_path / "metrics.jsonl"
+    profiler = BuildProfiler(str(metrics))
+
+    with profiler.stage("edit", data):
+        data[0]["score"] = 100          # reassigned
+        data[1]["new_field"] = True     # added
+        data[2]["score"] = 2            # same value: the cached small int, not a write
+        data.insert(0, {"title": "Fresh"})
+        del data[-1]
+    with profiler.stage("read only", data):
+        sum(item.get("score", 0) for item in data)
+    profiler.save(len(data))
+
+    run = json.loads(metrics.read_text())
+    written = {s["stage"]: s["articles_written"] for s in run["stages"]}
+    assert written == {"edit": 4, "read only": 0}
+    assert all(s["rss_growth_mb"] >= 0 for s in run["stages"])
@@ -0,0 +1,57 @@
+import json
+import random
+
+import pytest
+
+from data_io import iter_articles, write_articles
+
+def articles(n, seed=4):
+    rng = random.Random(seed)
+    return [
+        {
+            "title": f'Story {i} "quoted" \\ ünïcode ✓',
+            "score": rng.choice([0, -3, 2.5, 1e21, 12345678901234567890]),
+            "tags": [rng.choice(["a", "b", ""]) for _ in range(rng.randint(0, 3))],
+            "nested": {"ok": True, "none": None, "text": "[{,]}" * rng.randint(0, 5)},
+        }
+        for i in range(n)
+    ]
+
+def test_round_trip_matches_json_load(tmp_path):
+    path = str(tmp_path / "data.json")
+    for items in (articles(60), articles(1), []):
+        write_articles(items, path, backup=False)
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        assert text == json.dumps(items, indent=2, ensure_ascii=False)
+
+        # small chunks cut items, strings and numbers at every refill
+        for chunk_size in (1, 7, 64, 1 << 16):
+            assert list(iter_articles(path, chunk_size)) == json.loads(text) == items
+
+@pytest.mark.parametrize("text", ["", "   \n\t ", "\n"])
+def test_whitespace_only_raises_like_json_load(tmp_path, text):
+    path = tmp_path / "data.json"
+    path.write_text(text, encoding="utf-8")
+    with pytest.raises(ValueError):
+        json.loads(text)
+    with pytest.raises(ValueError):
+        list(iter_articles(str(path)))
+
+def test_torn_file_raises_like_json_load(tmp_path):
+    path = str(tmp_path / "data.json")
+    write_articles(articles(5), path, backup=False)
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+
+    torn = tmp_path / "torn.json"
+    for cut in range(1, len(text)):
+        prefix = text[:cut]
+        if not prefix.strip():
+            continue
+        with pytest.raises(ValueError):
+            json.loads(prefix)
+        torn.write_text(prefix, encoding="utf-8")
+        for chunk_size in (5, 1 << 16):
+            with pytest.raises(ValueError):
+                list(iter_articles(str(torn), chunk_size))
@@ -0,0 +1,64 @@
+import copy
+from datetime import datetime, timedelta, timezone
+
+import discover_lifecycle
+from article_store import DayIndex
+from test_article_store import open_store
+
+NOW = datetime(2026, 6, 1, 12, tzinfo=timezone.utc)
+DESK_RULES = [r for r in discover_lifecycle.RULES if r[0] in ("discover_feedback", "content_prune")]
+
+def story(i, age_days):
+    return {"title": f"Story {i}", "date": (NOW - timedelta(days=age_days, hours=1)).isoformat()}
+
+def test_desk_rules_read_only_their_day_buckets(tmp_path, monkeypatch):
+    store = open_store(tmp_path)
+    store.sync([story(i, age) for i, age in enumerate(range(60))])
+    data = store.articles()
+    data.insert(0, story(100, 5))       # ingested this run, not in the store yet
+    expected = copy.deepcopy(data)
+
+    windows = []
+    real_window = DayIndex.window
+    def window(self, now_ts, min_days, max_days=None):
+        windows.append((min_days, max_days))
+        return real_window(self, now_ts, min_days, max_days)
+    monkeypatch.setattr(DayIndex, "window", window)
+
+    visited, hits, failed = discover_lifecycle.run_rules(data, DESK_RULES, NOW, store=store)
+    assert windows == [(3, 7), (31, None)]
+    # 3–7 days (5 stored + the new one) and 31–59 days; the rest is never read
+    assert visited == 5 + 1 + 29
+    assert not failed
+
+    discover_lifecycle.run_rules(expected, DESK_RULES, NOW)
+    assert data == expected
+
+class Exploding:
+    # sets a field on every article, then raises on the third
+    @staticmethod
+    def rule(item, age, state):
+        state["seen"] = state.get("seen", 0) + 1
+        item["DISCOVER_SIGNAL"] = 99
+        item["EXPLODED"] = True
+        if state["seen"] == 3:
+            raise RuntimeError("boom")
+        return True
+
+    @staticmethod
+    def report(state):
+        raise AssertionError("a failed rule does not report")
+
+def test_failed_rule_leaves_no_changes(capsys):
+    data = [story(i, age) for i, age in enumerate(range(40))]
+    expected = copy.deepcopy(data)
+
+    # content_prune after it reads DISCOVER_SIGNAL, which the failed rule set
+    rules = [("exploding", Exploding, "days", (0, None))] + DESK_RULES
+    visited, hits, failed = discover_lifecycle.run_rules(data, rules, NOW)
+    assert failed == ["exploding"]
+    assert "rolled back" in capsys.readouterr().out
+
+    discover_lifecycle.run_rules(expected, DESK_RULES, NOW)
+    assert data == expected
+    assert hits[1:] == [5, 9]
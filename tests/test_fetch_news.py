@@ -0,0 +1,44 @@
+import fetch_news
+
+class Feed:
+    bozo = False
+
+    def __init__(self, entries):
+        self.entries = entries
+
+def run_with_feed(monkeypatch, tmp_path, entries):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "signals").mkdir()
+    url = "https://example.com/rss"
+    committed = []
+
+    monkeypatch.setattr(fetch_news, "load_feeds", lambda: [(url, 1)])
+    # same shape as feed_fetcher._fetch_one returns
+    monkeypatch.setattr(fetch_news, "fetch_feeds", lambda urls: [
+        {"url": url, "status": 200, "feed": Feed(entries), "etag": '"v1"', "modified": None,
+         "latency_ms": 42, "error": None}
+    ])
+    monkeypatch.setattr(fetch_news, "commit_validators", committed.extend)
+
+    data = []
+    fetch_news.run(data)
+    return data, committed
+
+def entries(n):
+    return [{"link": f"https://example.com/{i}", "title": f"Story number {i} about topic {i * 7919}"}
+            for i in range(n)]
+
+def test_feed_cut_short_by_per_feed_cap_keeps_no_validators(monkeypatch, tmp_path):
+    data, committed = run_with_feed(monkeypatch, tmp_path, entries(fetch_news.MAX_ITEMS_PER_FEED + 2))
+    assert len(data) == fetch_news.MAX_ITEMS_PER_FEED
+    assert committed == []
+
+def test_fully_read_feed_keeps_validators(monkeypatch, tmp_path):
+    data, committed = run_with_feed(monkeypatch, tmp_path, entries(fetch_news.MAX_ITEMS_PER_FEED))
+    assert len(data) == fetch_news.MAX_ITEMS_PER_FEED
+    assert len(committed) == 1
+    assert committed[0]["etag"] == '"v1"'
+
+def test_latency_report_shows_each_feed(monkeypatch, tmp_path, capsys):
+    run_with_feed(monkeypatch, tmp_path, entries(3))
+    assert "       42ms  200  https://example.com/rss\n" in capsys.readouterr().out
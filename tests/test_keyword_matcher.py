@@ -0,0 +1,20 @@
+from fetch_news import detect_category
+from keyword_matcher import KeywordMatcher
+
+TABLE = {"Fed": ["fed", "federal reserve"], "AI": ["ai"], "Markets": ["wall street", "stock"]}
+
+def test_keywords_match_whole_words_only():
+    matcher = KeywordMatcher(TABLE)
+    for text in ["Officials said talks would continue", "Fresh details emerge", "The feed was slow"]:
+        assert matcher.labels(text) == []
+        assert matcher.first(text, "none") == "none"
+        assert not matcher.search(text)
+
+    assert detect_category("Officials said talks would continue") == "General"
+    assert detect_category("Fresh details emerge") == "General"
+
+def test_plurals_phrases_and_table_order():
+    matcher = KeywordMatcher(TABLE)
+    assert matcher.labels("Wall-Street stocks and the Fed") == ["Fed", "Markets"]
+    assert matcher.first("AI chips lift stocks", "none") == "AI"
+    assert matcher.search("Federal  Reserve holds")
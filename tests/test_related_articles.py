@@ -0,0 +1,55 @@
+import json
+import random
+
+from related_articles import IDF_DRIFT, find_related
+
+WORDS = "fed rates tariffs chips greenland nato europe jobs inflation court senate oil gold strike".split()
+
+def archive(n, seed=1):
+    rng = random.Random(seed)
+    return {f"story-{i}": {"title": " ".join(rng.sample(WORDS, 4)) + f" {i}"} for i in range(n)}
+
+# The same generation's IDF, every set recomputed
+def full_recompute(records, cache):
+    with open(cache) as f:
+        state = json.load(f)
+    state["articles"] = {}
+    with open(cache, "w") as f:
+        json.dump(state, f)
+    return find_related(records, cache_file=cache)
+
+def test_cached_run_matches_a_full_recompute(tmp_path):
+    for seed in range(20):
+        cache = str(tmp_path / f"related-{seed}.json")
+        records = archive(300, seed)
+        find_related(records, cache_file=cache)
+
+        grown = dict(records)
+        grown.update({f"new-{i}": item for i, item in enumerate(archive(1 + seed, seed=100 + seed).values())})
+        del grown["story-5"]
+        grown["story-7"] = {"title": "greenland nato tariffs europe"}
+        assert find_related(grown, cache_file=cache) == full_recompute(grown, cache)
+
+        # a later run on top of that one still agrees
+        grown["new-extra"] = {"title": "fed rates jobs inflation strike brandnew"}
+        assert find_related(grown, cache_file=cache) == full_recompute(grown, cache)
+
+def test_drift_starts_a_new_generation(tmp_path):
+    cache = str(tmp_path / "related.json")
+    records = archive(300)
+    find_related(records, cache_file=cache)
+
+    grown = dict(records)
+    grown.update({f"new-{i}": item for i, item in enumerate(archive(int(300 * IDF_DRIFT) + 1, seed=2).values())})
+    assert find_related(grown, cache_file=cache) == find_related(grown, cache_file=None)
+
+def test_small_ingest_reuses_most_sets(tmp_path, capsys):
+    cache = str(tmp_path / "related.json")
+    records = archive(400)
+    find_related(records, cache_file=cache)
+
+    grown = dict(records, **{"new-0": {"title": "fed rates jobs inflation"}})
+    capsys.readouterr()
+    find_related(grown, cache_file=cache)
+    recomputed = int(capsys.readouterr().out.split("Related articles: ")[1].split()[0])
+    assert recomputed < 50
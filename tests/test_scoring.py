@@ -0,0 +1,62 @@
+import importlib.util
+import random
+
+import pytest
+
+import scoring
+from scoring import CATEGORY_WEIGHT, COUNTRY_RPM, DEFAULT_WEIGHT, FINAL_WEIGHTS, FRESHNESS_DECAY, ScoreColumns
+
+CATEGORIES = list(CATEGORY_WEIGHT) + ["Unknown"]
+COUNTRIES = list(COUNTRY_RPM) + ["XX"]
+
+def columns(n=2000, seed=9):
+    rng = random.Random(seed)
+    return (
+        # whole and half hours too, where rounding ties show up
+        [rng.choice([rng.uniform(0, 48), rng.randrange(48) / 2]) for _ in range(n)],
+        [rng.choice(CATEGORIES) for _ in range(n)],
+        [rng.choice(COUNTRIES) for _ in range(n)],
+    )
+
+# The per-article formula the columns replaced
+def reference(ages, categories, countries, trust=100):
+    w = FINAL_WEIGHTS
+    return [
+        round(max(0, 100 - age * FRESHNESS_DECAY) * w["freshness"]
+              + CATEGORY_WEIGHT.get(c, DEFAULT_WEIGHT) * w["category"]
+              + COUNTRY_RPM.get(k, DEFAULT_WEIGHT) * w["rpm"]
+              + trust / 10, 2)
+        for age, c, k in zip(ages, categories, countries)
+    ]
+
+def test_fallback_matches_reference(monkeypatch):
+    monkeypatch.setattr(scoring, "np", None)
+    data = columns()
+    assert ScoreColumns(*data, trust_score=80).final() == reference(*data, trust=80)
+
+@pytest.mark.skipif(importlib.util.find_spec("numpy") is None, reason="NumPy not installed")
+def test_numpy_matches_fallback(monkeypatch):
+    import numpy
+
+    data = columns()
+    monkeypatch.setattr(scoring, "np", numpy)
+    vectorized = ScoreColumns(*data, trust_score=80).final()
+    monkeypatch.setattr(scoring, "np", None)
+    assert vectorized == ScoreColumns(*data, trust_score=80).final()
+
+def test_country_ranking_matches_a_full_sort():
+    from country_homepages import rank_countries
+
+    rng = random.Random(5)
+    markets = {"US": 100, "UK": 90, "CA": 85}
+    ages, categories, countries = columns(500)
+    targets = [rng.sample(list(markets) + ["IN"], rng.randint(0, 2)) for _ in range(500)]
+    cols = ScoreColumns(ages, categories, countries, targets=targets)
+    base = cols.final()
+
+    ranked = rank_countries(cols, markets, base, limit=15)
+    for country, rpm in markets.items():
+        boosted = cols.country(country, rpm, base)
+        assert set(boosted) == {i for i, t in enumerate(targets) if country in t}
+        scores = [boosted.get(i, base[i]) for i in range(500)]
+        assert ranked[country] == sorted(range(500), key=scores.__getitem__, reverse=True)[:15]
@@ -0,0 +1,102 @@
+import os
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import topic_hubs
+from scoring import ScoreColumns
+
+NOW = datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+CATEGORIES = ["Business", "business", "AI", "ai", "US Politics", "Sports", "Economy", "General"]
+
+def article(rng, n, hours_old):
+    item = {
+        "title": f"Story {n} about {rng.choice(['rates', 'chips', 'votes', 'oil'])}",
+        "summary": f"Summary {n}",
+        "category": rng.choice(CATEGORIES),
+        "COUNTRY": rng.choice(["US", "UK", "GLOBAL"]),
+    }
+    if hours_old is not None:
+        item["date"] = (NOW - timedelta(hours=hours_old)).isoformat()
+    return item
+
+def batch(rng, start, count, fresh=False):
+    # newest first, like an ingest puts them
+    out = []
+    for n in range(start + count - 1, start - 1, -1):
+        hours = None if n % 29 == 0 else rng.uniform(0, 30) if fresh else rng.uniform(20, 2000)
+        out.append(article(rng, n, hours))
+    return out
+
+@pytest.fixture
+def hubs(tmp_path, monkeypatch):
+    monkeypatch.setattr(topic_hubs, "load_trust_score", lambda: 100)
+    clock = [NOW]
+    from_records = ScoreColumns.from_records.__func__
+    monkeypatch.setattr(ScoreColumns, "from_records",
+                        classmethod(lambda cls, data, trust=100: from_records(cls, data, trust, now=clock[0])))
+
+    # run(data, site) into site/, with its own manifest, at `now`
+    def build(data, site, full=False, now=NOW):
+        clock[0] = now
+        monkeypatch.setattr(topic_hubs, "OUT_DIR", str(tmp_path / site))
+        monkeypatch.setattr(topic_hubs, "MANIFEST_FILE", str(tmp_path / f"{site}.json"))
+        topic_hubs.run(data, full=full)
+        root = tmp_path / site
+        pages = {}
+        for dirpath, _, files in os.walk(root):
+            for name in files:
+                path = os.path.join(dirpath, name)
+                with open(path, encoding="utf-8") as f:
+                    pages[os.path.relpath(path, root)] = f.read()
+        return pages
+
+    return build
+
+def test_prepended_runs_match_a_full_rebuild(hubs, capsys):
+    rng = random.Random(4)
+    data = batch(rng, 0, 900)
+    hubs(data, "incremental")
+
+    start = 900
+    for count in (7, 1, 60, 0):
+        data = batch(rng, start, count, fresh=True) + data
+        start += count
+        capsys.readouterr()
+        incremental = hubs(data, "incremental")
+        assert f"(+{count} articles)" in capsys.readouterr().out
+        assert incremental == hubs(data, f"full-{start}", full=True)
+
+def test_hubs_follow_freshness_decay(hubs):
+    rng = random.Random(8)
+    data = batch(rng, 100, 40, fresh=True) + batch(rng, 0, 100)
+    first = hubs(data, "incremental")
+
+    for hours in (3, 9, 40):
+        later = NOW + timedelta(hours=hours)
+        assert hubs(data, "incremental", now=later) == hubs(data, f"full-{hours}", full=True, now=later)
+    assert hubs(data, "incremental", now=later)["business.html"] != first["business.html"]
+
+def test_unchanged_list_writes_nothing(hubs, capsys):
+    data = batch(random.Random(5), 0, 400)
+    hubs(data, "site")
+    capsys.readouterr()
+    hubs(data, "site")
+    assert "written: 0 | removed: 0" in capsys.readouterr().out
+
+def test_reshaped_list_is_rebuilt(hubs, capsys):
+    data = batch(random.Random(6), 0, 400)
+    hubs(data, "site")
+    del data[150]
+    capsys.readouterr()
+    pages = hubs(data, "site")
+    assert "(rebuilt)" in capsys.readouterr().out
+    assert pages == hubs(data, "fresh")
+
+def test_hub_urls_keep_the_lowercase_dash_rule(hubs):
+    pages = hubs(batch(random.Random(7), 0, 400), "site")
+    hub_files = {path for path in pages if "/" not in path}
+    assert hub_files == {"business.html", "ai.html", "us-politics.html", "sports.html",
+                         "economy.html", "general.html"}
+    assert "<h1>AI Analysis</h1>" in pages["ai.html"]
@@ -0,0 +1,19 @@
+import json
+
+import trust_signals
+
+def test_unchanged_score_keeps_the_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    data = [{"title": "Story", "category": "Business", "source": "BBC"}]
+
+    trust_signals.run(data)
+    path = tmp_path / "signals" / "trust_score.json"
+    first = path.read_text()
+
+    monkeypatch.setattr(trust_signals, "NOW", trust_signals.NOW.replace(year=2030))
+    trust_signals.run(data)
+    assert path.read_text() == first
+
+    # a changed signal still rewrites it
+    trust_signals.run(data * 20)
+    assert json.loads(path.read_text())["behavioral_signals"]["publishing_rate_ok"] == 0
@@ -1,53 +1,296 @@
-import json, os
-from collections import defaultdict
+import hashlib
+import heapq
+import os
 
-DATA_FILE = "data.json"
-OUT_DIR = "site/topics"
-
-os.makedirs(OUT_DIR, exist_ok=True)
-
-with open(DATA_FILE, encoding="utf-8") as f:
-    data = json.load(f)
+from article_fields import article_slug, safe
+from article_store import article_title, fingerprint
+from data_io import atomic_write, load_articles, load_json, save_json
+from scoring import ScoreColumns, load_trust_score
+from template_engine import Template
 
-topics = defaultdict(list)
-
-for item in data:
-    cat = item.get("category", "General")
-    topics[cat].append(item)
+# ================= CONFIG =================
+BASE_URL = "https://purestill.pages.dev"
+OUT_DIR = "site/topics"
+MANIFEST_FILE = "signals/topic_hubs.json"      # page path -> hash of what was written, plus the hub state
+STATE_VERSION = 1           # bump when the hub state layout changes
 
-for topic, items in topics.items():
-    # sort by quality
-    items = sorted(
-        items,
-        key=lambda x: x.get("final_score", 0),
-        reverse=True
-    )[:20]
+HUB_SIZE = 20               # best-scoring articles on the hub page
+ARCHIVE_PAGE_SIZE = 50      # articles per archive page
 
-    slug = topic.lower().replace(" ", "-")
-    html = f"""
+HUB_TEMPLATE = """
     <html>
     <head>
-      <title>{topic} Analysis | PureStill</title>
-      <meta name="description" content="Independent analysis of {topic.lower()} developments">
-      <link rel="canonical" href="https://purestill.pages.dev/topics/{slug}.html">
+      <title>{{TITLE}} | PureStill</title>
+      <meta name="description" content="{{DESCRIPTION}}">
+      <link rel="canonical" href="{{CANONICAL}}">
     </head>
     <body>
-      <h1>{topic} Analysis</h1>
-    """
+      <h1>{{HEADING}}</h1>
+    {{ITEMS}}{{PAGINATION}}</body></html>"""
+
+# Markup goes in as-is, as the concatenated pages did
+HUB_PAGE = Template(HUB_TEMPLATE, "topic_hubs.HUB_TEMPLATE", escape=False)
+TEMPLATE_HASH = hashlib.sha256(HUB_TEMPLATE.encode("utf-8")).hexdigest()
+
+# ================= TOPICS =================
+def article_topic(item):
+    return safe(item, "CATEGORY", "category", default="General")
+
+# The hub URL rule since the first hubs: "AI" and "ai" share one hub
+def topic_slug(topic):
+    return topic.lower().replace(" ", "-")
+
+# A hub shows the spelling that sorts first, so adding articles under
+# another spelling does not rename it
+def topic_name(names):
+    return min(names)
 
-    for a in items:
-        html += f"""
+def page_count(members):
+    return (members + ARCHIVE_PAGE_SIZE - 1) // ARCHIVE_PAGE_SIZE if members > HUB_SIZE else 0
+
+# ================= RENDER =================
+def render_item(a):
+    return f"""
         <div style="margin-bottom:24px">
           <h3>
-            <a href="/articles/{a['slug']}.html">{a['title']}</a>
+            <a href="/articles/{article_slug(a)}.html">{safe(a, "TITLE", "title")}</a>
           </h3>
-          <p>{a['summary']}</p>
+          <p>{safe(a, "SUMMARY", "summary")}</p>
         </div>
         """
 
-    html += "</body></html>"
+def archive_path(slug, page):
+    return f"{slug}/page-{page}.html"
+
+# The hub lists every archive page, newest first
+def render_pagination(slug, pages):
+    if not pages:
+        return ""
+    links = "".join(
+        f'<a href="/topics/{archive_path(slug, p)}">{p}</a> ' for p in range(pages, 0, -1)
+    )
+    return f"""
+      <nav class="archive">Archive: {links}</nav>
+    """
+
+# An archive page links the hub and its neighbours only, so a new last
+# page changes the page before it and no other
+def render_neighbours(topic, slug, page, pages):
+    links = f'<a href="/topics/{slug}.html">{topic}</a> '
+    if page > 1:
+        links += f'<a href="/topics/{archive_path(slug, page - 1)}">Older</a> '
+    if page < pages:
+        links += f'<a href="/topics/{archive_path(slug, page + 1)}">Newer</a> '
+    return f"""
+      <nav class="archive">{links}</nav>
+    """
+
+def hub_page(topic, slug, items, pages):
+    return f"{slug}.html", {
+        "TITLE": f"{topic} Analysis",
+        "DESCRIPTION": f"Independent analysis of {topic.lower()} developments",
+        "CANONICAL": f"{BASE_URL}/topics/{slug}.html",
+        "HEADING": f"{topic} Analysis",
+        "ITEMS": "".join(render_item(a) for a in items),
+        "PAGINATION": render_pagination(slug, pages),
+    }
+
+# items: the page's articles, newest first
+def archive_page(topic, slug, page, pages, items):
+    return archive_path(slug, page), {
+        "TITLE": f"{topic} Archive, page {page}",
+        "DESCRIPTION": f"Archive of {topic.lower()} analysis, page {page}",
+        "CANONICAL": f"{BASE_URL}/topics/{archive_path(slug, page)}",
+        "HEADING": f"{topic} Archive — page {page}",
+        "ITEMS": "".join(render_item(a) for a in items),
+        "PAGINATION": render_neighbours(topic, slug, page, pages),
+    }
+
+# Page 1 holds the oldest articles, so adding articles only ever changes
+# the last page (and the one before it gains a "Newer" link).
+# newest: the topic's newest members in list order, enough to fill pages
+# first..pages.
+def archive_pages(topic, slug, data, newest, first, pages):
+    oldest_first = newest[::-1]
+    for page in range(first, pages + 1):
+        chunk = oldest_first[(page - first) * ARCHIVE_PAGE_SIZE:(page - first + 1) * ARCHIVE_PAGE_SIZE]
+        yield archive_page(topic, slug, page, pages, [data[i] for i in reversed(chunk)])
+
+# ================= HUB STATE =================
+# A hub is its topic's HUB_SIZE best scores, ties in list order (what a
+# stable sort gave). Scores only fall with age, down to the settled score,
+# so an article past its freshness that is not among the HUB_SIZE best
+# settled scores can never make the hub again. The candidates kept between
+# runs are those best settled plus the still-fresh articles (undated ones
+# stay fresh), stored as positions from the end of the list, which
+# articles prepended by an ingest do not move.
+#
+# Returns the hub (indexes, best first) and the candidates to keep.
+def pick(data, indexes, trust):
+    columns = ScoreColumns.from_records([data[i] for i in indexes], trust)
+    scores, settled = columns.final(), columns.settled()
+    order = range(len(indexes))
+
+    top = heapq.nlargest(HUB_SIZE, order, key=lambda j: (scores[j], -indexes[j]))
+    best = heapq.nlargest(HUB_SIZE, order, key=lambda j: (settled[j], -indexes[j]))
+    keep = set(best).union(j for j in order if scores[j] > settled[j])
+    return [indexes[j] for j in top], sorted(indexes[j] for j in keep)
+
+def list_marker(data):
+    if not data:
+        return [0, None, None]
+    return [len(data), fingerprint(article_title(data[0])), fingerprint(article_title(data[-1]))]
+
+# How many articles were put in front of the list the state was built
+# from, or None when the list changed any other way (or the trust score
+# or page sizes did) and the hubs are rebuilt from all of it. Edits to
+# the title, summary, category or date of an older article that is not a
+# candidate are not seen here: run with full=True (pipeline.py --full)
+# after rewriting the archive in place.
+def prepended(state, data, trust):
+    if (
+        not state
+        or state.get("version") != STATE_VERSION
+        or state.get("trust") != trust
+        or state.get("sizes") != [HUB_SIZE, ARCHIVE_PAGE_SIZE]
+    ):
+        return None
+
+    count, first, last = state["list"]
+    extra = len(data) - count
+    if extra < 0:
+        return None
+    if count and (
+        fingerprint(article_title(data[extra])) != first
+        or fingerprint(article_title(data[-1])) != last
+    ):
+        return None
+    return extra
+
+# ================= BUILD =================
+# Every topic from the whole list. Fills topics (slug -> state entry) and
+# yields every page.
+def rebuild(data, trust, topics):
+    members = {}
+    names = {}
+    for i, item in enumerate(data):
+        topic = article_topic(item)
+        slug = topic_slug(topic)
+        if slug not in members:
+            members[slug] = []
+            names[slug] = set()
+        members[slug].append(i)
+        names[slug].add(topic)
+
+    n = len(data)
+    for slug, indexes in members.items():
+        name = topic_name(names[slug])
+        top, keep = pick(data, indexes, trust)
+        pages = page_count(len(indexes))
+        topics[slug] = {"name": name, "count": len(indexes), "candidates": [n - 1 - i for i in keep]}
+
+        yield hub_page(name, slug, [data[i] for i in top], pages)
+        yield from archive_pages(name, slug, data, indexes, 1, pages)
+
+# The first `extra` articles are new, everything after them is the list
+# the state was built from. Every hub is re-picked from its candidates
+# and the new articles; only archive pages from a grown topic's old last
+# page on are rendered, from its newest members (the front of the list).
+def update(data, state, extra, trust, topics):
+    added = {}
+    names = {}
+    for i in range(extra):
+        topic = article_topic(data[i])
+        slug = topic_slug(topic)
+        added.setdefault(slug, []).append(i)
+        names.setdefault(slug, set()).add(topic)
+
+    n = len(data)
+    grown = {}          # slug -> (name, first page to render, pages)
+    for slug in list(state["topics"]) + [s for s in added if s not in state["topics"]]:
+        entry = state["topics"].get(slug, {"name": None, "count": 0, "candidates": []})
+        new = added.get(slug, [])
+        name = topic_name(names.get(slug, set()) | ({entry["name"]} if entry["name"] else set()))
+
+        top, keep = pick(data, new + [n - 1 - r for r in entry["candidates"]], trust)
+        count = entry["count"] + len(new)
+        pages = page_count(count)
+        topics[slug] = {"name": name, "count": count, "candidates": [n - 1 - i for i in keep]}
+
+        yield hub_page(name, slug, [data[i] for i in top], pages)
+
+        if name != entry["name"]:
+            first = 1       # the name is on every page
+        elif new:
+            first = max(1, page_count(entry["count"]))
+        else:
+            continue
+        if first <= pages:
+            grown[slug] = (name, first, pages)
+
+    # the grown topics' newest members, one scan from the front
+    wanted = {slug: topics[slug]["count"] - (first - 1) * ARCHIVE_PAGE_SIZE
+              for slug, (_, first, _) in grown.items()}
+    newest = {slug: [] for slug in grown}
+    for i, item in enumerate(data):
+        if not wanted:
+            break
+        slug = topic_slug(article_topic(item))
+        if slug in wanted:
+            newest[slug].append(i)
+            if len(newest[slug]) == wanted[slug]:
+                del wanted[slug]
+
+    for slug, (name, first, pages) in grown.items():
+        yield from archive_pages(name, slug, data, newest[slug], first, pages)
+
+# ================= RUN =================
+# full: rebuild every hub from the whole list instead of the kept state
+def run(data, full=False):
+    os.makedirs(OUT_DIR, exist_ok=True)
+    trust = load_trust_score()
+
+    manifest = load_json(MANIFEST_FILE, {})
+    current = manifest.get("template") == TEMPLATE_HASH
+    previous = manifest.get("pages", {}) if current else {}
+    extra = prepended(manifest.get("state"), data, trust) if current and not full else None
+
+    topics = {}
+    if extra is None:
+        pages, built = rebuild(data, trust, topics), {}
+    else:
+        pages, built = update(data, manifest["state"], extra, trust, topics), dict(previous)
+
+    rendered = written = 0
+    for path, values in pages:
+        html = HUB_PAGE.render(values)
+        digest = hashlib.sha256(html.encode("utf-8")).hexdigest()
+        built[path] = digest
+        rendered += 1
+
+        target = os.path.join(OUT_DIR, path)
+        if previous.get(path) == digest and os.path.exists(target):
+            continue
+        with atomic_write(target) as f:
+            f.write(html)
+        written += 1
+
+    # 🧹 hub and archive pages we wrote before that no longer exist
+    removed = 0
+    for path in previous:
+        if path not in built and os.path.exists(os.path.join(OUT_DIR, path)):
+            os.remove(os.path.join(OUT_DIR, path))
+            removed += 1
+
+    state = {"version": STATE_VERSION, "trust": trust, "sizes": [HUB_SIZE, ARCHIVE_PAGE_SIZE],
+             "list": list_marker(data), "topics": topics}
+    if built != previous or state != manifest.get("state") or not current:
+        save_json(MANIFEST_FILE, {"template": TEMPLATE_HASH, "pages": built, "state": state},
+                  indent=2, sort_keys=True)
 
-    with open(os.path.join(OUT_DIR, f"{slug}.html"), "w", encoding="utf-8") as f:
-        f.write(html)
+    mode = "rebuilt" if extra is None else f"+{extra} articles"
+    print(f"Topic hubs generated: {len(topics)} topics ({mode}), {len(built)} pages | "
+          f"rendered: {rendered} | written: {written} | removed: {removed}")
 
-print("Topic hubs generated")
+if __name__ == "__main__":
+    run(load_articles())
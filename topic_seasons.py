@@ -1,33 +1,36 @@
-import json
-from datetime import datetime
+from datetime import datetime, timezone
 from collections import defaultdict
 
-with open("data.json") as f:
-    data = json.load(f)
+from article_fields import article_epoch
+from data_io import iter_articles, save_json
 
-seasons = defaultdict(lambda: defaultdict(int))
+def run(data):
+    seasons = defaultdict(lambda: defaultdict(int))
 
-for a in data:
-    if a.get("DISCOVER_SIGNAL", 0) < 2:
-        continue
+    for a in data:
+        if a.get("DISCOVER_SIGNAL", 0) < 2:
+            continue
 
-    try:
-        dt = datetime.fromisoformat(a["date"].replace("Z","+00:00"))
-    except:
-        continue
+        ts = article_epoch(a, fields=("date",))
+        if ts is None:
+            continue
+        dt = datetime.fromtimestamp(ts, timezone.utc)
 
-    week = dt.isocalendar()[1]
-    topic = a.get("category","General")
+        week = dt.isocalendar()[1]
+        topic = a.get("category","General")
 
-    seasons[week][topic] += 1
+        seasons[week][topic] += 1
 
-season_map = {}
+    season_map = {}
 
-for week, topics in seasons.items():
-    top = sorted(topics.items(), key=lambda x: x[1], reverse=True)[:3]
-    season_map[str(week)] = [t[0] for t in top]
+    for week, topics in seasons.items():
+        top = sorted(topics.items(), key=lambda x: x[1], reverse=True)[:3]
+        season_map[str(week)] = [t[0] for t in top]
 
-with open("signals/topic_seasons.json","w") as f:
-    json.dump(season_map, f, indent=2)
+    save_json("signals/topic_seasons.json", season_map, indent=2)
 
-print("📆 Topic seasons generated")
+    print("📆 Topic seasons generated")
+
+# Read-only on its own: stream data.json instead of loading it whole
+if __name__ == "__main__":
+    run(iter_articles())
@@ -1,6 +1,8 @@
 import json
 from datetime import datetime, timedelta
 
+from data_io import save_json
+
 TODAY = datetime.utcnow().date()
 YESTERDAY = TODAY - timedelta(days=1)
 
@@ -28,7 +30,6 @@ for t in today:
             "countries": t.get("countries", ["US"])
         })
 
-with open("signals/tomorrow_topics.json","w") as f:
-    json.dump(forecast, f, indent=2)
+save_json("signals/tomorrow_topics.json", forecast, indent=2)
 
 print(f"🔮 Tomorrow topics predicted: {len(forecast)}")